@@ -65,7 +65,7 @@ with st.spinner("Memuat data terbaru..."):
 dp = data['dp_instance']
 
 # Validasi Data Kosong agar tidak crash
-if dp.df is None or dp.df.empty:
+if not dp.has_data():
     st.error("❌ Data tidak ditemukan atau kosong. Silakan input data terlebih dahulu.")
     st.stop()
 
@@ -88,20 +88,16 @@ else:
 
 
 # [UPDATE LOGIKA DATA]
-# Kita filter data mentah (raw_data) DULUAN sebelum masuk ke filter tanggal
-if selected_author != "Semua Kreator":
-    base_df = data['raw_data'][data['raw_data']['authorMeta.name'] == selected_author].copy()
-else:
-    base_df = data['raw_data'].copy()
-
+# Filter kreator & waktu dijawab lewat indeks (searchsorted) di DataProcessor,
+# tanpa membandingkan string seluruh kolom atau menyalin frame.
+row_index = dp.get_row_index()
+author_filter = None if selected_author == "Semua Kreator" else selected_author
+base_cube = dp.get_cube().slice(author=author_filter)
 
-# 2. Filter Tanggal (Bekerja di atas base_df yang sudah difilter author)
-base_df['createTimeISO'] = pd.to_datetime(base_df['createTimeISO'])
 
-if not base_df.empty:
-    min_date = base_df['createTimeISO'].min().date()
-    max_date = base_df['createTimeISO'].max().date()
-else:
+# 2. Filter Tanggal (Bekerja di atas data kreator terpilih)
+min_date, max_date = row_index.date_bounds(author=author_filter)
+if min_date is None:
     min_date, max_date = pd.Timestamp.now().date(), pd.Timestamp.now().date()
 
 # Pilihan Mode Filter Waktu
@@ -110,10 +106,10 @@ filter_mode = st.sidebar.radio(
     ["Semua Waktu", "Rentang Tanggal", "Bulan Tertentu", "Tahun Tertentu"]
 )
 
-# 3. Logika Filter Akhir (filtered_df)
-filtered_df = base_df.copy()
+# 3. Logika Filter Akhir (panels + filtered_cube untuk panel agregat)
+time_filter = {}
 
-if not filtered_df.empty:
+if row_index.count(author=author_filter) > 0:
     if filter_mode == "Rentang Tanggal":
         date_range = st.sidebar.date_input(
             "Pilih Rentang Tanggal",
@@ -123,68 +119,70 @@ if not filtered_df.empty:
         )
         if len(date_range) == 2:
             start_date, end_date = date_range
-            filtered_df = filtered_df[
-                (filtered_df['createTimeISO'].dt.date >= start_date) &
-                (filtered_df['createTimeISO'].dt.date <= end_date)
-            ]
+            time_filter = {'start_date': start_date, 'end_date': end_date}
 
     elif filter_mode == "Bulan Tertentu":
-        available_years = sorted(filtered_df['createTimeISO'].dt.year.unique())
+        available_years = row_index.available_years(author=author_filter)
         selected_year = st.sidebar.selectbox("Pilih Tahun", available_years)
         
-        months_in_year = filtered_df[filtered_df['createTimeISO'].dt.year == selected_year]['createTimeISO'].dt.month_name().unique()
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
-        sorted_months = sorted(months_in_year, key=lambda x: month_order.index(x) if x in month_order else 99)
+        sorted_months = row_index.available_months(selected_year, author=author_filter)
         
         selected_month = st.sidebar.selectbox("Pilih Bulan", sorted_months)
         
-        filtered_df = filtered_df[
-            (filtered_df['createTimeISO'].dt.year == selected_year) &
-            (filtered_df['createTimeISO'].dt.month_name() == selected_month)
-        ]
+        time_filter = {'year': selected_year, 'month_name': selected_month}
 
     elif filter_mode == "Tahun Tertentu":
-        available_years = sorted(filtered_df['createTimeISO'].dt.year.unique())
+        available_years = row_index.available_years(author=author_filter)
         selected_year = st.sidebar.selectbox("Pilih Tahun", available_years)
-        filtered_df = filtered_df[filtered_df['createTimeISO'].dt.year == selected_year]
+        time_filter = {'year': selected_year}
 
-st.sidebar.info(f"Menampilkan **{len(filtered_df)}** video")
+# Panel tingkat baris (median, tren, top video, korelasi, histogram) untuk filter aktif;
+# mode streaming menghitungnya per blok dari column store tanpa memuat seluruh data
+panels = dp.get_dashboard_panels(author=author_filter, **time_filter)
+filtered_cube = base_cube.slice(**time_filter)
+n_videos = panels['n_videos']
+
+st.sidebar.info(f"Menampilkan **{n_videos}** video")
 
 
 # ==================== OVERVIEW METRICS ====================
 st.header("📈 Ringkasan Performa")
 
+# Total & rata-rata diambil dari cube agregat (tanpa scan baris)
+filtered_stats = dp.get_summary_stats(cube=filtered_cube)
+filtered_totals = filtered_cube.totals()
+
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.metric(
         label="Total Video",
-        value=f"{len(filtered_df)}",
+        value=f"{n_videos}",
     )
 
 with col2:
-    total_views = filtered_df['playCount'].sum()
+    total_views = filtered_stats.get('total_views', 0)
     st.metric(
         label="Total Tayangan",
         value=format_indo(total_views),
     )
 
 with col3:
-    total_likes = filtered_df['diggCount'].sum()
+    total_likes = filtered_stats.get('total_likes', 0)
     st.metric(
         label="Total Suka",
         value=format_indo(total_likes),
     )
 
 with col4:
-    total_comments = filtered_df['commentCount'].sum()
+    total_comments = filtered_stats.get('total_comments', 0)
     st.metric(
         label="Total Komentar",
         value=format_indo(total_comments),
     )
 
 with col5:
-    avg_engagement = filtered_df['engagement_rate'].mean() if not filtered_df.empty else 0
+    avg_engagement = filtered_stats.get('avg_engagement_rate', 0)
     st.metric(
         label="Avg. Engagement",
         value=f"{avg_engagement:.2f}%",
@@ -194,28 +192,28 @@ with col5:
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    avg_views = filtered_df['playCount'].mean() if not filtered_df.empty else 0
+    avg_views = filtered_stats.get('avg_views', 0)
     st.metric(
         label="Rata-rata Tayangan",
         value=format_indo(avg_views)
     )
 
 with col2:
-    median_views = filtered_df['playCount'].median() if not filtered_df.empty else 0
+    median_views = panels['median_views']
     st.metric(
         label="Median Tayangan",
         value=format_indo(median_views)
     )
 
 with col3:
-    best_video_views = filtered_df['playCount'].max() if not filtered_df.empty else 0
+    best_video_views = filtered_totals.get('playCount_max', 0)
     st.metric(
         label="Video Terbaik",
         value=format_indo(best_video_views)
     )
 
 with col4:
-    avg_duration = filtered_df['videoMeta.duration'].mean() if not filtered_df.empty else 0
+    avg_duration = filtered_stats.get('avg_duration', 0)
     st.metric(
         label="Durasi Rata-rata",
         value=f"{avg_duration:.0f} detik"
@@ -261,13 +259,13 @@ if selected_author == "Semua Kreator":
 # ==================== PERFORMANCE OVER TIME ====================
 st.header("⏰ Performa Berdasarkan Waktu")
 
-if not filtered_df.empty:
+if n_videos > 0:
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("📅 Performa per Hari")
-        # Hitung ulang berdasarkan filtered_df
-        day_perf = dp.get_performance_by_day(filtered_df).reset_index()
+        # Hitung ulang berdasarkan filter (roll-up cube)
+        day_perf = dp.get_performance_by_day(cube=filtered_cube).reset_index()
         day_perf = day_perf.rename(columns={'upload_day': 'Hari Upload', 'playCount': 'Rata-rata Tayangan'})
 
         fig_day = create_bar_chart(day_perf, x='Hari Upload', y='Rata-rata Tayangan', title="Rerata Tayangan per Hari", xaxis_title="Hari", yaxis_title="Tayangan")
@@ -280,7 +278,7 @@ if not filtered_df.empty:
 
     with col2:
         st.subheader("🕐 Performa per Jam")
-        hour_perf = dp.get_performance_by_hour(filtered_df).reset_index()
+        hour_perf = dp.get_performance_by_hour(cube=filtered_cube).reset_index()
         hour_perf = hour_perf.rename(columns={'upload_hour': 'Jam Upload', 'playCount': 'Rata-rata Tayangan'})
 
         fig_hour = create_line_chart(hour_perf, x='Jam Upload', y='Rata-rata Tayangan', title="Rerata Tayangan per Jam", xaxis_title="Jam", yaxis_title="Tayangan")
@@ -292,8 +290,7 @@ if not filtered_df.empty:
 
     # Time series view
     st.subheader("📈 Tren Tayangan Sepanjang Waktu")
-    time_series_df = filtered_df.sort_values('createTimeISO')[['createTimeISO', 'playCount']]
-    time_series_df = time_series_df.rename(columns={'createTimeISO': 'Tanggal Upload', 'playCount': 'Jumlah Tayangan'})
+    time_series_df = panels['time_series'].rename(columns={'createTimeISO': 'Tanggal Upload', 'playCount': 'Jumlah Tayangan'})
 
     fig_timeline = create_time_series_chart(time_series_df, date_col='Tanggal Upload', value_col='Jumlah Tayangan', title="Tren Video", yaxis_title="Tayangan")
     st.plotly_chart(fig_timeline, use_container_width=True)
@@ -306,8 +303,8 @@ st.markdown("---")
 # ==================== CONTENT TYPE ANALYSIS ====================
 st.header("🎨 Analisis Tipe Konten")
 
-# Hitung ulang berdasarkan filtered_df
-content_type_perf = dp.get_content_type_performance(filtered_df)
+# Hitung ulang berdasarkan filter (roll-up cube)
+content_type_perf = dp.get_content_type_performance(cube=filtered_cube)
 
 if not content_type_perf.empty:
     content_dist = content_type_perf.reset_index().rename(columns={
@@ -347,7 +344,7 @@ st.markdown("---")
 # ==================== AUDIO TYPE ANALYSIS ====================
 st.header("🎵 Analisis Tipe Audio")
 # [FIXED] Fungsi ini sekarang mengembalikan 'Jumlah Video' dan 'Rata-rata Tayangan'
-audio_type_perf = dp.get_audio_type_performance(filtered_df) 
+audio_type_perf = dp.get_audio_type_performance(cube=filtered_cube) 
 
 if not audio_type_perf.empty:
     audio_dist = audio_type_perf.reset_index().rename(columns={
@@ -380,23 +377,24 @@ st.header("🏆 Video dengan Performa Terbaik")
 
 tab1, tab2, tab3 = st.tabs(["📈 Berdasarkan Tayangan", "❤️ Berdasarkan Suka", "💬 Berdasarkan Komen"])
 
-if not filtered_df.empty:
+if n_videos > 0:
+    # Caption (kolom teks berat) hanya dibaca untuk 10 baris yang ditampilkan
     with tab1:
         st.subheader("Top 10 Video Berdasarkan Tayangan")
-        top_views = filtered_df.nlargest(10, 'playCount')[['text', 'playCount', 'diggCount', 'engagement_rate']].copy()
+        top_views = panels['top_views'][['text', 'playCount', 'diggCount', 'engagement_rate']].copy()
         top_views.columns = ['Caption', 'Tayangan', 'Suka', 'ER (%)']
         top_views['Tayangan'] = top_views['Tayangan'].apply(lambda x: f"{x:,.0f}")
         st.dataframe(top_views, use_container_width=True, hide_index=True)
 
     with tab2:
         st.subheader("Top 10 Video Berdasarkan Suka")
-        top_likes = filtered_df.nlargest(10, 'diggCount')[['text', 'playCount', 'diggCount']].copy()
+        top_likes = panels['top_likes'][['text', 'playCount', 'diggCount']].copy()
         top_likes.columns = ['Caption', 'Tayangan', 'Suka']
         st.dataframe(top_likes, use_container_width=True, hide_index=True)
 
     with tab3:
         st.subheader("Top 10 Video Berdasarkan Komentar")
-        top_comments = filtered_df.nlargest(10, 'commentCount')[['text', 'playCount', 'diggCount', 'commentCount']].copy()
+        top_comments = panels['top_comments'][['text', 'playCount', 'diggCount', 'commentCount']].copy()
         top_comments.columns = ['Caption', 'Tayangan', 'Suka', 'Komentar']
         st.dataframe(top_comments, use_container_width=True, hide_index=True)
 
@@ -410,7 +408,7 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("📊 Korelasi Metrik")
     # Hitung korelasi berdasarkan data yang difilter
-    corr_df = dp.get_correlation_matrix(filtered_df)
+    corr_df = panels['correlation']
     
     rename_map = {
         'playCount': 'Tayangan', 'diggCount': 'Suka', 
@@ -424,15 +422,11 @@ with col1:
 
 with col2:
         st.subheader("📈 Distribusi Engagement Rate")
-        hist_df = filtered_df.copy().rename(columns={'engagement_rate': 'Engagement Rate (%)'})
-        
-        # FIX: Tambahkan parameter 'xaxis_title' yang wajib diminta oleh fungsi
-        fig_hist = create_histogram(
-            hist_df, 
-            x='Engagement Rate (%)', 
-            title="Sebaran Engagement", 
-            xaxis_title="Persentase Engagement (%)", # <-- TAMBAHAN WAJIB INI
-            nbins=30
+        # Bin (30, lebar sama) sudah dihitung di get_dashboard_panels
+        fig_hist = create_binned_histogram(
+            panels['engagement_hist'],
+            title="Sebaran Engagement",
+            xaxis_title="Persentase Engagement (%)"
         )
         st.plotly_chart(fig_hist, use_container_width=True)
 
@@ -441,8 +435,8 @@ st.markdown("---")
 # ==================== KEY INSIGHTS (LOGIKA DINAMIS) ====================
 st.header("💡 Insight Utama")
 
-# Hitung insight berdasarkan data filtered_df
-if not filtered_df.empty and not content_type_perf.empty:
+# Hitung insight berdasarkan data terfilter
+if n_videos > 0 and not content_type_perf.empty:
     # Ambil rekomendasi dinamis
     rec_day = best_day if 'best_day' in locals() else "-"
     rec_hour = best_hour if 'best_hour' in locals() else "-"
@@ -459,7 +453,7 @@ if not filtered_df.empty and not content_type_perf.empty:
         
     with col2:
         st.subheader("📊 Ringkasan")
-        st.info(f"Analisis ini didasarkan pada **{len(filtered_df)}** video terpilih.")
+        st.info(f"Analisis ini didasarkan pada **{n_videos}** video terpilih.")
 
 # Footer
 st.markdown("---")
@@ -13,8 +13,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.model_handler import get_model_handler
-from utils.data_processor import get_data_processor
-from utils.visualizations import create_bar_chart, format_number
+from utils.data_processor import get_data_processor, WHAT_IF_DURATIONS
+from utils.visualizations import create_bar_chart, create_heatmap, format_number
+from utils.what_if import sweep_posting_options
 
 # Page config
 st.set_page_config(
@@ -38,13 +39,7 @@ def load_reference_data():
     """Load reference statistics"""
     dp = get_data_processor()
     dp.load_data() # Force load terbaru
-    return {
-        'avg_likes': dp.df['diggCount'].mean(),
-        'avg_comments': dp.df['commentCount'].mean(),
-        'avg_shares': dp.df['shareCount'].mean(),
-        'avg_duration': dp.df['videoMeta.duration'].mean(),
-        'trending_threshold': dp.get_trending_threshold(75)
-    }
+    return dp.get_reference_stats()
 
 model_handler = load_model()
 ref_data = load_reference_data()
@@ -225,6 +220,12 @@ with st.form("prediction_form"):
                 help="Seberapa trending hashtag yang digunakan"
             )
 
+        sweep_durations = st.checkbox(
+            "Simulasi juga variasi durasi video",
+            value=False,
+            help=f"Tambahkan durasi {', '.join(str(d) for d in WHAT_IF_DURATIONS)} detik ke simulasi waktu upload terbaik"
+        )
+
     # Submit button
     st.markdown("---")
     submitted = st.form_submit_button("🔮 Prediksi Sekarang", use_container_width=True, type="primary")
@@ -289,8 +290,8 @@ if submitted:
         # Panggil Otak Sistem (DataProcessor)
         dp = get_data_processor()
         
-        # Dapatkan fitur yang sudah di-engineer (One-Hot Encoded, dll)
-        features_df = dp.prepare_features_for_prediction(raw_input_data)
+        # Dapatkan fitur yang sudah di-engineer (One-Hot Encoded, dll) langsung dalam urutan fitur model
+        features_df = dp.prepare_features_for_prediction(raw_input_data, feature_names=model_handler.feature_names)
         
         # Dapatkan kategori yang terdeteksi (untuk info display)
         detected_category = dp._classify_content_logic(final_text_input)
@@ -338,19 +339,30 @@ if submitted:
 
     st.markdown("---")
 
-    # Feature Importance for this prediction
+    # Kontribusi fitur untuk prediksi INI (jalur keputusan tiap pohon), bukan importance global
     st.subheader("📊 Faktor Paling Berpengaruh")
 
+    bias, contributions = model_handler.get_contributions(features_df)
+
     col1, col2 = st.columns([2, 1])
 
     with col1:
-            # Get feature importance from model
-            feature_imp = model_handler.get_feature_importance()
-
-            if feature_imp is not None:
-                # Display top 10 features
-                top_features = feature_imp.head(10).copy() 
-                
+            if contributions is not None:
+                # Display top 10 features (berdasarkan besar kontribusi, positif maupun negatif)
+                row_contrib = contributions.iloc[0]
+                top_idx = row_contrib.abs().sort_values(ascending=False, kind='stable').index[:10]
+                top_features = pd.DataFrame({'feature': top_idx, 'importance': row_contrib[top_idx].to_numpy()})
+                chart_title = "10 Faktor Penentu Prediksi Ini"
+                chart_yaxis = "Kontribusi ke Peluang Trending"
+            else:
+                # Fallback: importance global model
+                top_features = model_handler.get_feature_importance()
+                if top_features is not None:
+                    top_features = top_features.head(10).copy()
+                chart_title = "10 Faktor Penentu Utama"
+                chart_yaxis = "Tingkat Pengaruh"
+
+            if top_features is not None:
                 # Mapping nama fitur agar lebih user-friendly
                 rename_fitur = {
                     'Suka': 'Jumlah Suka',
@@ -378,24 +390,36 @@ if submitted:
                     top_features,
                     x='feature',
                     y='importance',
-                    title="10 Faktor Penentu Utama",
+                    title=chart_title,
                     xaxis_title="Faktor",
-                    yaxis_title="Tingkat Pengaruh",
+                    yaxis_title=chart_yaxis,
                     orientation='h'
                 )
                 st.plotly_chart(fig_importance, use_container_width=True)
 
     with col2:
         st.markdown("**Insight:**")
-        st.markdown(f"""
-        Berdasarkan model Random Forest, faktor-faktor berikut paling berpengaruh terhadap prediksi:
+        if contributions is not None:
+            st.markdown(f"""
+            Peluang trending dasar (rata-rata data latih): **{bias*100:.1f}%**.
+            Faktor berikut paling menggeser peluang untuk video ini:
 
-        1. **{feature_imp.iloc[0]['feature']}** ({feature_imp.iloc[0]['importance']*100:.1f}%)
-        2. **{feature_imp.iloc[1]['feature']}** ({feature_imp.iloc[1]['importance']*100:.1f}%)
-        3. **{feature_imp.iloc[2]['feature']}** ({feature_imp.iloc[2]['importance']*100:.1f}%)
+            1. **{top_features.iloc[0]['feature']}** ({top_features.iloc[0]['importance']*100:+.1f} poin)
+            2. **{top_features.iloc[1]['feature']}** ({top_features.iloc[1]['importance']*100:+.1f} poin)
+            3. **{top_features.iloc[2]['feature']}** ({top_features.iloc[2]['importance']*100:+.1f} poin)
 
-        Fokus pada metrik-metrik ini untuk meningkatkan performa!
-        """)
+            Nilai positif menaikkan peluang trending, nilai negatif menurunkannya.
+            """)
+        elif top_features is not None:
+            st.markdown(f"""
+            Berdasarkan model Random Forest, faktor-faktor berikut paling berpengaruh terhadap prediksi:
+
+            1. **{top_features.iloc[0]['feature']}** ({top_features.iloc[0]['importance']*100:.1f}%)
+            2. **{top_features.iloc[1]['feature']}** ({top_features.iloc[1]['importance']*100:.1f}%)
+            3. **{top_features.iloc[2]['feature']}** ({top_features.iloc[2]['importance']*100:.1f}%)
+
+            Fokus pada metrik-metrik ini untuk meningkatkan performa!
+            """)
 
     st.markdown("---")
 
@@ -466,6 +490,51 @@ if submitted:
 
     st.markdown("---")
 
+    # What-if: semua kombinasi jam x hari x audio dinilai dalam satu panggilan model
+    st.subheader("⏰ Simulasi Waktu & Pengaturan Terbaik")
+
+    audio_options = ["Audio Original", "Audio Populer", "Audio Lainnya"]
+    what_if = sweep_posting_options(
+        dp, model_handler, raw_input_data,
+        audio_types=audio_options,
+        durations=WHAT_IF_DURATIONS if sweep_durations else None
+    )
+
+    if what_if is not None:
+        col1, col2 = st.columns([3, 2])
+
+        with col1:
+            heatmap = what_if['heatmap']
+            fig_what_if = create_heatmap(
+                heatmap.to_numpy(),
+                x_labels=[f"{h:02d}" for h in heatmap.columns],
+                y_labels=[days_indo[d] for d in heatmap.index],
+                title="Peluang Trending Terbaik per Hari & Jam",
+                colorscale='Greens'
+            )
+            st.plotly_chart(fig_what_if, use_container_width=True)
+
+        with col2:
+            top_options = what_if['ranked'].head(10)
+            top_table = pd.DataFrame({
+                'Hari': [days_indo[d] for d in top_options['upload_day']],
+                'Jam': [f"{h:02d}:00" for h in top_options['upload_hour']],
+                'Tipe Audio': top_options['audio_type'],
+                'Durasi (detik)': top_options['duration'],
+                'Peluang Trending': top_options['Prob_Trending'] * 100
+            })
+            st.markdown("**10 Kombinasi Terbaik:**")
+            st.dataframe(
+                top_table.style.format({'Peluang Trending': '{:.1f}%', 'Durasi (detik)': '{:.0f}'}),
+                use_container_width=True,
+                hide_index=True
+            )
+            best = top_options.iloc[0]
+            st.info(f"💡 Coba upload hari **{days_indo[best['upload_day']]}** jam **{best['upload_hour']:02d}:00** "
+                    f"dengan **{best['audio_type']}** (peluang trending {best['Prob_Trending']*100:.1f}%).")
+
+    st.markdown("---")
+
     # Comparison with average
     st.subheader("📈 Perbandingan dengan Rata-rata")
 
@@ -9,7 +9,6 @@ import numpy as np
 import sys
 from pathlib import Path
 from datetime import datetime
-import re
 from io import BytesIO
 
 # Add parent directory to path for imports
@@ -17,6 +16,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.model_handler import get_model_handler
 from utils.data_processor import get_data_processor
+from utils.raw_preprocessing import preprocess_raw_data
 
 # Page config
 st.set_page_config(
@@ -76,137 +76,6 @@ st.markdown("---")
 # Kita gunakan DataProcessor sebagai 'Source of Truth' untuk logika kategori
 dp = get_data_processor()
 
-def extract_hashtags(text):
-    """Extract hashtags from caption"""
-    if pd.isna(text):
-        return []
-    hashtags = re.findall(r'#\w+', str(text))
-    return hashtags
-
-def count_hashtags(text):
-    """Count number of hashtags"""
-    return len(extract_hashtags(text))
-
-def calculate_hours_since_publish(upload_time, reference_time=None):
-    """Calculate hours since publish"""
-    from datetime import timezone
-
-    if reference_time is None:
-        reference_time = datetime.now(timezone.utc)
-
-    # Ensure both datetimes have compatible timezone information
-    if upload_time.tzinfo is not None and reference_time.tzinfo is None:
-        reference_time = reference_time.replace(tzinfo=timezone.utc)
-    elif upload_time.tzinfo is None and reference_time.tzinfo is not None:
-        upload_time = upload_time.replace(tzinfo=timezone.utc)
-
-    time_diff = reference_time - upload_time
-    hours = time_diff.total_seconds() / 3600
-    return max(0, hours)
-
-# --- CORE PREPROCESSING FUNCTION (UPDATED) ---
-def preprocess_raw_data(df_raw, reference_time=None):
-    """
-    Preprocess raw TikTok data into model-ready features
-    Menggunakan logika DataProcessor agar konsisten dengan Notebook Langkah 4
-    """
-    df = df_raw.copy()
-
-    # 1. Basic engagement metrics & Rename
-    df['Suka'] = df['diggCount']
-    df['Komentar'] = df['commentCount']
-    df['Dibagikan'] = df['shareCount']
-    df['Durasi_Video'] = df['videoMeta.duration']
-
-    # 2. Caption analysis
-    df['Jumlah_Hashtag'] = df['text'].apply(count_hashtags)
-    df['Panjang_Caption'] = df['text'].apply(lambda x: len(str(x)) if not pd.isna(x) else 0)
-
-    # 3. Temporal features
-    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
-    
-    # Timezone handling for hours_since_publish
-    if reference_time is None:
-        from datetime import timezone
-        reference_time = datetime.now(timezone.utc)
-    
-    # Ensure UTC for calculations
-    if df['createTimeISO'].dt.tz is None:
-        iso_series = df['createTimeISO'].dt.tz_localize('UTC')
-    else:
-        iso_series = df['createTimeISO'].dt.tz_convert('UTC')
-
-    df['Jam_Sejak_Publikasi'] = iso_series.apply(
-        lambda x: calculate_hours_since_publish(x, reference_time)
-    )
-
-    # Fitur Waktu Model
-    df['Jam_Posting'] = df['createTimeISO'].dt.hour
-    df['Jam_Upload'] = df['Jam_Posting'] # Alias
-    df['Hari_Posting'] = df['createTimeISO'].dt.day_name()
-    # Is_Weekend (Fitur Baru)
-    df['Is_Weekend'] = df['Hari_Posting'].apply(lambda x: 1 if x in ['Saturday', 'Sunday'] else 0)
-    # Hari Upload (Numerik 0-6)
-    df['Hari_Upload'] = df['createTimeISO'].dt.dayofweek
-
-    # 4. Content & Audio Classification (Using DP Logic for Consistency)
-    # Gunakan logika kamus 10 kategori dari DataProcessor
-    df['content_type_detected'] = df['text'].apply(dp._classify_content_logic)
-    
-    # Audio Logic (Load Top 20 if needed)
-    if not dp.list_audio_populer and 'musicMeta.musicName' in df.columns:
-         dp.list_audio_populer = df['musicMeta.musicName'].value_counts().head(20).index.tolist()
-    
-    df['audio_type_detected'] = df.apply(dp._classify_audio_logic, axis=1)
-
-    # 5. One-hot Encoding (Dynamic based on Dictionary)
-    
-    # Kategori (Gaming, Fashion, dll)
-    all_categories = list(dp.KAMUS_KATEGORI.keys()) + ['Lainnya']
-    for cat in all_categories:
-        col_name = f"Kat_{cat}"
-        # Buat kolom 1/0
-        df[col_name] = (df['content_type_detected'] == cat).astype(int)
-        
-        # Buat juga alias Tipe_Konten_X jika diperlukan untuk kompatibilitas tampilan
-        df[f"Tipe_Konten_{cat}"] = df[col_name]
-
-    # Audio
-    all_audios = ['Audio Original', 'Audio Populer', 'Audio Lainnya']
-    for audio in all_audios:
-        col_name = f"Audio_{audio}"
-        df[col_name] = (df['audio_type_detected'] == audio).astype(int)
-        # Alias
-        df[f"Tipe_Audio_{audio}"] = df[col_name]
-
-    # 6. Interaction Features (Looping)
-    # Interaksi = Kat_X * Suka
-    for cat in all_categories:
-        cat_col = f"Kat_{cat}"
-        interaksi_col = f"Interaksi_{cat}_Suka"
-        df[interaksi_col] = df[cat_col] * df['Suka']
-
-    # 7. Additional Features (Legacy Support/Trends)
-    df['Kekuatan_Tren_Audio'] = df['audio_type_detected'].apply(lambda x: 0.9 if x == 'Audio Populer' else 0.5)
-    # Estimasi Tren Hashtag sederhana
-    hashtag_engagement = df['Suka'] + df['Komentar'] + df['Dibagikan']
-    p75 = hashtag_engagement.quantile(0.75) if not hashtag_engagement.empty else 0
-    df['Kekuatan_Tren_Hashtag'] = hashtag_engagement.apply(lambda x: 0.9 if x >= p75 else 0.5)
-    
-    df['Apakah_Kolaborasi'] = df['text'].apply(lambda x: 1 if any(k in str(x).lower() for k in ['collab', 'ft']) else 0)
-    df['Format_Konten_Video'] = 1 # Asumsi Vertical
-
-    # 8. Organize Columns
-    # Kita simpan semua kolom hasil engineering
-    # Tambahkan ID dan Caption untuk referensi
-    if 'Video_ID' not in df.columns:
-        df.insert(0, 'Video_ID', range(1, len(df) + 1))
-    
-    if 'text' in df.columns and 'Caption' not in df.columns:
-        df.insert(1, 'Caption', df['text'])
-
-    return df
-
 # --- DOWNLOAD TEMPLATE SECTION ---
 st.subheader("📥 Download Template Data Mentah")
 
@@ -307,7 +176,7 @@ if uploaded_file is not None:
         if st.button("🔧 Proses Data", use_container_width=True, type="primary"):
             with st.spinner("Sedang memproses data (Klasifikasi Konten & Audio)..."):
                 # Preprocess data
-                df_processed = preprocess_raw_data(df_raw, reference_time)
+                df_processed = preprocess_raw_data(df_raw, reference_time, data_processor=dp)
 
                 # Store in session state for Batch Prediction
                 st.session_state['preprocessed_data'] = df_processed.copy()
@@ -360,7 +229,7 @@ if uploaded_file is not None:
                 # Add Interaction columns preview
                 preview_cols += [c for c in df_processed.columns if 'Interaksi_' in c][:2] # Show 2 interaksi pertama
                 
-                st.dataframe(df_processed[[c for c in preview_cols if c in df_processed.columns]].head(10), use_container_width=True)
+                st.dataframe(df_processed[[c for c in preview_cols if c in df_processed]].head(10), use_container_width=True)
 
                 st.markdown("---")
 
@@ -403,9 +272,12 @@ if uploaded_file is not None:
 
                 col1, col2, col3 = st.columns(3)
 
+                # Kolom alias (Tipe_Konten_X, Tipe_Audio_X, Jam_Upload) ditulis ke file ekspor
+                df_export = df_processed.materialize()
+
                 # CSV Export (all features)
                 with col1:
-                    csv_processed = df_processed.to_csv(index=False)
+                    csv_processed = df_export.to_csv(index=False)
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
                     st.download_button(
@@ -421,9 +293,9 @@ if uploaded_file is not None:
                 with col2:
                     # Filter only features needed for model (exclude metadata like URL)
                     exclude_cols = ['webVideoUrl', 'createTimeISO', 'musicMeta.musicName', 'musicMeta.musicOriginal', 'text']
-                    model_cols = [c for c in df_processed.columns if c not in exclude_cols]
+                    model_cols = [c for c in df_export.columns if c not in exclude_cols]
                     
-                    df_for_prediction = df_processed[model_cols].copy()
+                    df_for_prediction = df_export[model_cols].copy()
                     csv_for_prediction = df_for_prediction.to_csv(index=False)
 
                     st.download_button(
@@ -440,7 +312,7 @@ if uploaded_file is not None:
                     buffer = BytesIO()
                     with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
                         # Buat salinan agar tidak merusak dataframe asli di session_state
-                        df_excel = df_processed.copy()
+                        df_excel = df_export.copy()
                         
                         # --- PERBAIKAN UTAMA: Hapus Zona Waktu ---
                         # Cari kolom datetime yang punya timezone
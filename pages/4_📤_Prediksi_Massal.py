@@ -6,17 +6,20 @@ CSV upload interface for bulk predictions
 import streamlit as st
 import pandas as pd
 import numpy as np
+import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from io import BytesIO
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from utils.model_handler import get_model_handler
+from utils.model_handler import get_model_handler, configured_workers, PREDICT_WORKERS_ENV
 from utils.data_processor import get_data_processor
 from utils.visualizations import create_pie_chart, create_bar_chart, create_heatmap
+from utils.batch_scoring import (iter_chunks, score_stream, csv_to_excel, download_plan,
+                                 CHUNK_SIZE, DOWNLOAD_MAX_BYTES, EXCEL_DOWNLOAD_MAX_ROWS)
 
 # Page config
 st.set_page_config(
@@ -33,7 +36,8 @@ st.markdown("Upload file CSV untuk memprediksi potensi *Trending* banyak video s
 @st.cache_resource
 def load_model():
     """Load and cache model"""
-    return get_model_handler()
+    # Batch besar dibagi ke beberapa proses sesuai TIKTOK_PREDICT_WORKERS (default 1 = serial)
+    return get_model_handler(n_workers=configured_workers())
 
 model_handler = load_model()
 
@@ -106,19 +110,29 @@ if st.session_state.get('auto_load_preprocessed', False) and st.session_state.ge
 if df is None:
     uploaded_file = st.file_uploader("Pilih file CSV", type=['csv'])
 
+# Sumber data: DataFrame hasil preproses atau file upload (dibaca per chunk, tidak sekaligus)
+source = df
+preview_df = df.head() if df is not None else None
+
 if uploaded_file is not None:
     try:
-        df = pd.read_csv(uploaded_file)
-        st.success(f"✅ File dimuat! Total: {len(df)} baris")
+        preview_df = pd.read_csv(uploaded_file, nrows=5)
+        uploaded_file.seek(0)
+        source = uploaded_file
+        st.success(f"✅ File dimuat! Ukuran: {uploaded_file.size / 1024 / 1024:.1f} MB "
+                   f"(diproses per {CHUNK_SIZE:,} baris, {model_handler.n_workers} proses)")
+        if model_handler.n_workers == 1:
+            st.caption(f"Atur variabel lingkungan {PREDICT_WORKERS_ENV} (angka atau 'auto') "
+                       "untuk memakai beberapa core CPU pada file besar.")
     except Exception as e:
         st.error(f"Gagal membaca file: {e}")
         st.stop()
 
 # --- PREDICTION LOGIC ---
-if df is not None:
-    # Validasi Kolom
+if source is not None:
+    # Validasi Kolom (cukup dari header)
     required_features = model_handler.feature_names
-    missing = [c for c in required_features if c not in df.columns]
+    missing = [c for c in required_features if c not in preview_df.columns]
     
     if missing:
         st.error("❌ Format File Tidak Sesuai")
@@ -126,20 +140,42 @@ if df is not None:
         st.stop()
 
     with st.expander("👁️ Preview Data Input"):
-        st.dataframe(df.head(), use_container_width=True)
+        st.dataframe(preview_df, use_container_width=True)
+
+    # Opsional: kontribusi per baris menambah waktu proses beberapa kali lipat
+    explain_rows = st.checkbox(
+        "Sertakan faktor penentu per video (3 fitur dengan kontribusi terbesar)",
+        value=False,
+        help="Menghitung kontribusi fitur untuk setiap baris; proses menjadi lebih lama pada file besar."
+    )
 
     if st.button("🚀 Jalankan Prediksi", type="primary", use_container_width=True):
         with st.spinner("Sedang memproses prediksi massal..."):
             try:
-                # Prediksi
-                X = df[required_features].copy()
-                preds, probs = model_handler.predict_batch(X)
-                
-                # Simpan Hasil
-                df['Prediksi'] = preds
-                df['Label_Prediksi'] = df['Prediksi'].map({0: 'Tidak Trending', 1: 'Trending'})
-                df['Confidence_Score'] = probs.max(axis=1)
-                
+                # Hapus file hasil dari proses sebelumnya
+                for old_path in st.session_state.pop('batch_output_paths', []):
+                    if os.path.exists(old_path):
+                        os.remove(old_path)
+
+                fd, output_path = tempfile.mkstemp(prefix="prediksi_", suffix=".csv")
+                os.close(fd)
+                st.session_state['batch_output_paths'] = [output_path]
+
+                # Prediksi per chunk + progress bar
+                progress = st.progress(0.0, text="Memproses...")
+
+                def update_progress(rows_done):
+                    if isinstance(source, pd.DataFrame):
+                        fraction = rows_done / max(len(source), 1)
+                    else:
+                        fraction = uploaded_file.tell() / max(uploaded_file.size, 1)
+                    progress.progress(min(fraction, 1.0), text=f"Memproses... {rows_done:,} baris selesai")
+
+                # Ukuran chunk tetap (memori terbatas); prediksi paralel (opsional) membagi tiap chunk
+                stats = score_stream(iter_chunks(source, CHUNK_SIZE), model_handler, output_path, update_progress,
+                                     explain_top_n=3 if explain_rows else 0)
+                progress.progress(1.0, text=f"Selesai: {stats.total:,} baris")
+
                 st.success("✅ Prediksi Selesai!")
                 st.markdown("---")
 
@@ -150,12 +186,12 @@ if df is not None:
 
                 # 1. Ringkasan Angka
                 c1, c2, c3, c4 = st.columns(4)
-                total = len(df)
-                trending = (df['Prediksi'] == 1).sum()
+                total = stats.total
+                trending = stats.trending
                 c1.metric("Total Video", total)
-                c2.metric("Diprediksi Trending", trending, f"{trending/total*100:.1f}%")
+                c2.metric("Diprediksi Trending", trending, f"{trending/total*100:.1f}%" if total else "0.0%")
                 c3.metric("Tidak Trending", total - trending)
-                c4.metric("Rerata Keyakinan", f"{df['Confidence_Score'].mean()*100:.1f}%")
+                c4.metric("Rerata Keyakinan", f"{stats.mean_confidence*100:.1f}%")
 
                 st.markdown("---")
 
@@ -164,14 +200,13 @@ if df is not None:
                 
                 with col_left:
                     st.subheader("Proporsi Prediksi")
-                    counts = df['Label_Prediksi'].value_counts()
+                    counts = stats.label_counts_series()
                     fig_pie = create_pie_chart(counts.values, counts.index, title="Trending vs Tidak", hole=0.4)
                     st.plotly_chart(fig_pie, use_container_width=True)
                     
                 with col_right:
                     st.subheader("Sebaran Keyakinan (Confidence)")
-                    conf_bins = pd.cut(df['Confidence_Score'], bins=5).value_counts().sort_index()
-                    conf_df = pd.DataFrame({'Range': conf_bins.index.astype(str), 'Jumlah': conf_bins.values})
+                    conf_df = stats.confidence_histogram()
                     fig_bar = create_bar_chart(conf_df, x='Range', y='Jumlah', title="Histogram Confidence", 
                                              xaxis_title="Rentang", yaxis_title="Jumlah", orientation='v')
                     st.plotly_chart(fig_bar, use_container_width=True)
@@ -213,10 +248,9 @@ if df is not None:
 
                 with col_b:
                     st.subheader("📈 Profil: Trending vs Tidak")
-                    # Bandingkan Rata-rata Metrik Utama
-                    if 'Suka' in df.columns:
-                        avg_stats = df.groupby('Label_Prediksi')[['Suka', 'Komentar', 'Dibagikan']].mean().reset_index()
-                        
+                    # Bandingkan Rata-rata Metrik Utama (dihitung bertahap per chunk)
+                    avg_stats = stats.profile()
+                    if avg_stats is not None:
                         # Tampilkan Chart Sederhana (Likes)
                         fig_comp = create_bar_chart(
                             avg_stats, 
@@ -241,23 +275,23 @@ if df is not None:
                 # ==========================================
                 # EVALUASI (Jika Ada Kolom Actual)
                 # ==========================================
-                if 'Actual' in df.columns:
+                if stats.confusion:
                     st.header("🎯 Evaluasi Akurasi")
-                    from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
                     
-                    y_true, y_pred = df['Actual'], df['Prediksi']
-                    acc = accuracy_score(y_true, y_pred)
+                    acc = stats.accuracy()
+                    classes, cm = stats.confusion_matrix()
                     
                     c1, c2 = st.columns(2)
                     with c1:
                         st.metric("Akurasi Batch Ini", f"{acc*100:.1f}%")
-                        cm = confusion_matrix(y_true, y_pred)
-                        fig_cm = create_heatmap(cm, x_labels=['Pred: 0', 'Pred: 1'], y_labels=['Act: 0', 'Act: 1'], title="Confusion Matrix")
+                        class_names = [f"{int(c)}" if float(c).is_integer() else f"{c}" for c in classes]
+                        fig_cm = create_heatmap(cm, x_labels=[f'Pred: {c}' for c in class_names],
+                                                y_labels=[f'Act: {c}' for c in class_names], title="Confusion Matrix")
                         st.plotly_chart(fig_cm, use_container_width=True)
                         
                     with c2:
                         st.text("Detail Laporan:")
-                        report = pd.DataFrame(classification_report(y_true, y_pred, output_dict=True)).transpose()
+                        report = stats.classification_report()
                         st.dataframe(report.style.format("{:.2f}"), use_container_width=True)
 
                 st.markdown("---")
@@ -267,28 +301,43 @@ if df is not None:
                 # ==========================================
                 st.subheader("📋 Data Hasil Prediksi")
                 
-                cols_show = ['Video_ID', 'Caption', 'Label_Prediksi', 'Confidence_Score']
-                cols_show = [c for c in cols_show if c in df.columns]
-                st.dataframe(df[cols_show], use_container_width=True)
+                preview_result = stats.preview()
+                cols_show = ['Video_ID', 'Caption', 'Label_Prediksi', 'Confidence_Score',
+                             'Faktor_Utama_1', 'Faktor_Utama_2', 'Faktor_Utama_3']
+                cols_show = [c for c in cols_show if c in preview_result.columns]
+                st.dataframe(preview_result[cols_show], use_container_width=True)
+                if stats.total > len(preview_result):
+                    st.caption(f"Menampilkan {len(preview_result):,} dari {stats.total:,} baris. Unduh file untuk data lengkap.")
 
                 st.subheader("💾 Simpan Hasil")
                 c1, c2 = st.columns(2)
                 tstamp = datetime.now().strftime("%Y%m%d_%H%M")
                 
+                serve_csv, build_excel = download_plan(stats.total, output_path)
                 with c1:
-                    st.download_button("📥 Unduh CSV", df.to_csv(index=False), f"prediksi_{tstamp}.csv", "text/csv", use_container_width=True)
+                    if serve_csv:
+                        with open(output_path, 'rb') as f:
+                            st.download_button("📥 Unduh CSV", f, f"prediksi_{tstamp}.csv", "text/csv", use_container_width=True)
+                    else:
+                        # Tombol unduh memuat seluruh file ke memori; file besar tetap di disk server
+                        st.info(f"File hasil lebih dari {DOWNLOAD_MAX_BYTES // (1024 * 1024)} MB, "
+                                f"tersimpan di server hingga prediksi berikutnya: `{output_path}`")
                 with c2:
-                    buffer = BytesIO()
-                    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                        df.to_excel(writer, index=False)
-                    st.download_button("📥 Unduh Excel", buffer.getvalue(), f"prediksi_{tstamp}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                    if build_excel:
+                        xlsx_path = output_path[:-len('.csv')] + '.xlsx'
+                        st.session_state['batch_output_paths'].append(xlsx_path)
+                        csv_to_excel(output_path, xlsx_path)
+                        with open(xlsx_path, 'rb') as f:
+                            st.download_button("📥 Unduh Excel", f, f"prediksi_{tstamp}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                    else:
+                        st.info(f"Unduhan Excel hanya untuk hasil hingga {EXCEL_DOWNLOAD_MAX_ROWS:,} baris, gunakan CSV.")
 
             except Exception as e:
                 st.error(f"Error proses: {e}")
                 st.exception(e)
 
 # Placeholder
-if df is None and not uploaded_file:
+if source is None:
     st.info("👈 Mulai dengan mengupload file CSV atau hasil preprocessing.")
 
 st.markdown("---")
@@ -122,9 +122,9 @@ with st.form("input_form"):
                 # --- UPDATE DASHBOARD AGAR TERBACA ---
                 st.cache_data.clear() # 1. Hapus cache view
                 
-                # 2. Paksa DataProcessor baca ulang file CSV dari disk
-                # (Ini penting agar dashboard tidak pakai data lama di RAM)
-                get_data_processor(force_reload=True) 
+                # 2. Tambahkan baris baru ke data di RAM (hanya baris baru yang diproses,
+                #    dataset lama tidak dibaca ulang dari disk)
+                get_data_processor().append_rows([input_data])
                 
                 # 3. Trigger rerun dashboard
                 st.session_state["data_changed"] = True 
@@ -0,0 +1,328 @@
+"""
+Baseline code paths (the implementation before the performance work),
+kept as the reference that the optimized paths must reproduce.
+"""
+import re
+from datetime import datetime, timezone
+
+import pandas as pd
+
+
+def classify_content(kamus, text):
+    """DataProcessor._classify_content_logic: substring scoring per keyword"""
+    if pd.isna(text): return 'Hiburan'
+    text_lower = str(text).lower()
+
+    scores = {k: 0 for k in kamus}
+    for kategori, keywords in kamus.items():
+        for keyword in keywords:
+            if keyword in text_lower:
+                scores[kategori] += 1
+
+    best_category = max(scores, key=scores.get)
+    if scores[best_category] == 0:
+        return 'Hiburan'
+    return best_category
+
+
+def classify_audio(row, list_audio_populer):
+    """DataProcessor._classify_audio_logic (df.apply(axis=1))"""
+    music_name = row.get('musicMeta.musicName', '')
+    if pd.isna(music_name) or str(music_name).strip() in ['', '-', 'nan']: return 'Tanpa Audio'
+
+    music_name_str = str(music_name)
+    music_name_lower = music_name_str.lower()
+    if music_name_lower in ['tidak ada musik', 'no music']: return 'Tanpa Audio'
+
+    is_original = row.get('musicMeta.musicOriginal', False)
+    if (str(is_original).lower() == 'true' or is_original == True) or \
+       ('original sound' in music_name_lower) or ('suara asli' in music_name_lower):
+        return 'Audio Original'
+    elif music_name_str in list_audio_populer: return 'Audio Populer'
+    else: return 'Audio Lainnya'
+
+
+def load_frame(data_path, kamus):
+    """
+    DataProcessor.load_data: eager pandas frame with every alias stored
+
+    Returns:
+        tuple: (DataFrame, list_audio_populer)
+    """
+    df = pd.read_csv(data_path, on_bad_lines='skip')
+
+    numeric_cols = ['diggCount', 'commentCount', 'shareCount', 'playCount', 'videoMeta.duration']
+    for col in numeric_cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        else:
+            df[col] = 0
+
+    df['engagement_rate'] = (
+        (df['diggCount'] + df['commentCount'] + df['shareCount']) /
+        df['playCount'].replace(0, 1)
+    ) * 100
+
+    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'], dayfirst=False, errors='coerce')
+    mask_rusak = df['createTimeISO'].isna()
+    if mask_rusak.any():
+        df.loc[mask_rusak, 'createTimeISO'] = pd.Timestamp.now()
+
+    df['Waktu_Posting'] = df['createTimeISO']
+    df['upload_date'] = df['createTimeISO'].dt.date
+    df['upload_hour'] = df['createTimeISO'].dt.hour
+    df['Jam_Posting'] = df['createTimeISO'].dt.hour
+    df['upload_day_english'] = df['createTimeISO'].dt.day_name()
+    df['upload_day'] = df['upload_day_english'].map({
+        'Monday': 'Senin', 'Tuesday': 'Selasa', 'Wednesday': 'Rabu',
+        'Thursday': 'Kamis', 'Friday': 'Jumat', 'Saturday': 'Sabtu', 'Sunday': 'Minggu'
+    })
+    df['Hari_Posting'] = df['upload_day_english']
+    df['upload_year'] = df['createTimeISO'].dt.year
+    df['upload_month'] = df['createTimeISO'].dt.month_name()
+    df['Is_Weekend'] = df['Hari_Posting'].apply(lambda x: 1 if x in ['Saturday', 'Sunday'] else 0)
+
+    df['content_type'] = df['text'].apply(lambda text: classify_content(kamus, text))
+    df['Kategori_Konten'] = df['content_type']
+
+    list_audio_populer = []
+    if 'musicMeta.musicName' in df.columns:
+        list_audio_populer = df['musicMeta.musicName'].value_counts().head(20).index.tolist()
+    df['audio_type'] = df.apply(lambda row: classify_audio(row, list_audio_populer), axis=1)
+    df['Tipe_Audio'] = df['audio_type']
+    return df, list_audio_populer
+
+
+
+def prepare_features_for_prediction(kamus, raw_features):
+    """DataProcessor.prepare_features_for_prediction: one-row frame built from a dict"""
+    detected_category = classify_content(kamus, raw_features.get('text_content', ''))
+    user_audio_choice = raw_features.get('audio_type', 'Audio Lainnya')
+
+    features = {
+        'Jam_Posting': raw_features.get('upload_hour', 12),
+        'Is_Weekend': 1 if raw_features.get('upload_day', 0) in [5, 6] else 0,
+        'Panjang_Caption': raw_features.get('caption_length', 0),
+        'Jumlah_Hashtag': raw_features.get('hashtag_count', 0),
+        'Suka': raw_features.get('likes', 0),
+        'Durasi_Video': raw_features.get('duration', 0)
+    }
+
+    all_categories = list(kamus.keys()) + ['Lainnya']
+    for cat in all_categories:
+        features[f"Kat_{cat}"] = 1 if detected_category == cat else 0
+
+    all_audios = ['Audio Original', 'Audio Populer', 'Audio Lainnya', 'Tanpa Audio']
+    for audio in all_audios:
+        features[f"Audio_{audio}"] = 1 if user_audio_choice == audio else 0
+
+    suka_val = features['Suka']
+    for cat in all_categories:
+        features[f"Interaksi_{cat}_Suka"] = features[f"Kat_{cat}"] * suka_val
+
+    return pd.DataFrame([features])
+
+def predict(model, feature_names, features):
+    """ModelHandler.predict: dict/frame -> (label, confidence, probabilities) from predict + predict_proba"""
+    if isinstance(features, dict):
+        features = pd.DataFrame([features])
+    for feature in feature_names:
+        if feature not in features.columns:
+            features[feature] = 0
+    features = features[feature_names]
+    prediction = model.predict(features)[0]
+    probabilities = model.predict_proba(features)[0]
+    return prediction, probabilities[prediction], probabilities
+
+
+def predict_batch(model, feature_names, features_df):
+    """ModelHandler.predict_batch: sklearn predict + predict_proba on the reordered frame"""
+    features_df = features_df.copy()
+    for feature in feature_names:
+        if feature not in features_df.columns:
+            features_df[feature] = 0
+    features_df = features_df[feature_names]
+    return model.predict(features_df), model.predict_proba(features_df)
+
+
+
+def model_info(model, feature_names):
+    """ModelHandler.get_model_info: read from the unpickled model"""
+    info = {
+        'model_type': type(model).__name__,
+        'n_features': len(feature_names),
+        'features': feature_names
+    }
+    if hasattr(model, 'n_estimators'):
+        info['n_estimators'] = model.n_estimators
+    if hasattr(model, 'max_depth'):
+        info['max_depth'] = model.max_depth
+    if hasattr(model, 'classes_'):
+        info['classes'] = list(model.classes_)
+    return info
+
+
+def feature_importance(model, feature_names):
+    """ModelHandler.get_feature_importance: importances sorted descending"""
+    if not hasattr(model, 'feature_importances_'):
+        return None
+    return pd.DataFrame({
+        'feature': feature_names,
+        'importance': model.feature_importances_
+    }).sort_values('importance', ascending=False)
+
+def batch_summary(model, feature_names, df):
+    """Prediksi Massal page: whole-frame predict, then metrics/profile/report on the full result"""
+    from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
+
+    df = df.copy()
+    preds, probs = predict_batch(model, feature_names, df[feature_names].copy())
+    df['Prediksi'] = preds
+    df['Label_Prediksi'] = df['Prediksi'].map({0: 'Tidak Trending', 1: 'Trending'})
+    df['Confidence_Score'] = probs.max(axis=1)
+
+    summary = {
+        'result': df,
+        'trending': int((df['Prediksi'] == 1).sum()),
+        'mean_confidence': df['Confidence_Score'].mean(),
+        'profile': df.groupby('Label_Prediksi')[['Suka', 'Komentar', 'Dibagikan']].mean().reset_index(),
+    }
+    if 'Actual' in df.columns:
+        y_true, y_pred = df['Actual'], df['Prediksi']
+        summary['accuracy'] = accuracy_score(y_true, y_pred)
+        summary['confusion'] = confusion_matrix(y_true, y_pred)
+        summary['report'] = pd.DataFrame(classification_report(y_true, y_pred, output_dict=True)).transpose()
+    return summary
+
+
+def save_new_data_to_csv(file_path, new_data_dict):
+    """input_handler.save_new_data_to_csv: read the whole CSV, concat one row, fill defaults, rewrite"""
+    df_old = pd.read_csv(file_path)
+    df_new = pd.DataFrame([new_data_dict])
+    df_final = pd.concat([df_old, df_new], ignore_index=True)
+    last_idx = df_final.index[-1]
+
+    num_cols = df_final.select_dtypes(include=['number']).columns
+    df_final.loc[last_idx, num_cols] = df_final.loc[last_idx, num_cols].fillna(0)
+    # 'string': kolom teks pandas >= 3 (dulu object)
+    obj_cols = df_final.select_dtypes(include=['object', 'string']).columns
+    df_final.loc[last_idx, obj_cols] = df_final.loc[last_idx, obj_cols].fillna("-")
+    bool_cols = df_final.select_dtypes(include=['bool']).columns
+    df_final.loc[last_idx, bool_cols] = df_final.loc[last_idx, bool_cols].fillna(False)
+
+    df_final.to_csv(file_path, index=False)
+    return True, "Data berhasil ditambahkan!"
+
+
+def dashboard_filter(df, author=None, start_date=None, end_date=None, year=None, month_name=None):
+    """Dashboard page filters: boolean masks over the whole frame (author first, then time)"""
+    if author is not None:
+        df = df[df['authorMeta.name'] == author]
+    if start_date is not None:
+        df = df[(df['createTimeISO'].dt.date >= start_date) & (df['createTimeISO'].dt.date <= end_date)]
+    if year is not None:
+        df = df[df['createTimeISO'].dt.year == year]
+        if month_name is not None:
+            df = df[df['createTimeISO'].dt.month_name() == month_name]
+    return df
+
+
+def dashboard_aggregates(df):
+    """DataProcessor summary / leaderboard / performance helpers (groupby over the rows)"""
+    def category(dimension):
+        perf = df.groupby(dimension).agg({'playCount': 'mean', 'webVideoUrl': 'count'})
+        perf.columns = ['Rata-rata Tayangan', 'Jumlah Video']
+        return perf.sort_values(by='Rata-rata Tayangan', ascending=False)
+
+    leaderboard = df.groupby('authorMeta.name').agg({
+        'playCount': 'sum', 'diggCount': 'sum', 'shareCount': 'sum',
+        'webVideoUrl': 'count', 'engagement_rate': 'mean'
+    }).reset_index()
+    leaderboard.rename(columns={
+        'authorMeta.name': 'Nama Akun', 'webVideoUrl': 'Jml Video',
+        'playCount': 'Total Penayangan', 'diggCount': 'Total Suka',
+        'shareCount': 'Total Bagikan', 'engagement_rate': 'Rata-rata ER (%)'
+    }, inplace=True)
+
+    summary = {}
+    if not df.empty:
+        summary = {
+            'total_videos': len(df),
+            'total_views': df['playCount'].sum(),
+            'total_likes': df['diggCount'].sum(),
+            'total_comments': df['commentCount'].sum(),
+            'total_shares': df['shareCount'].sum(),
+            'avg_views': df['playCount'].mean(),
+            'avg_likes': df['diggCount'].mean(),
+            'avg_engagement_rate': df['engagement_rate'].mean(),
+            'avg_duration': df['videoMeta.duration'].mean(),
+            'date_range': {'start': df['createTimeISO'].min(), 'end': df['createTimeISO'].max()}
+        }
+    day_order = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+    return {
+        'summary': summary,
+        'leaderboard': leaderboard.sort_values(by='Total Penayangan', ascending=False),
+        'by_day': df.groupby('upload_day')['playCount'].mean().reindex(day_order),
+        'by_hour': df.groupby('upload_hour')['playCount'].mean(),
+        'content_type': category('content_type'),
+        'audio_type': category('audio_type'),
+    }
+
+
+def _hours_since_publish(upload_time, reference_time):
+    if upload_time.tzinfo is not None and reference_time.tzinfo is None:
+        reference_time = reference_time.replace(tzinfo=timezone.utc)
+    elif upload_time.tzinfo is None and reference_time.tzinfo is not None:
+        upload_time = upload_time.replace(tzinfo=timezone.utc)
+    return max(0, (reference_time - upload_time).total_seconds() / 3600)
+
+
+def preprocess_raw_data(kamus, list_audio_populer, df_raw, reference_time):
+    """Preproses Data page: row-wise apply per feature, alias columns stored as copies"""
+    df = df_raw.copy()
+    df['Suka'] = df['diggCount']
+    df['Komentar'] = df['commentCount']
+    df['Dibagikan'] = df['shareCount']
+    df['Durasi_Video'] = df['videoMeta.duration']
+
+    df['Jumlah_Hashtag'] = df['text'].apply(lambda x: 0 if pd.isna(x) else len(re.findall(r'#\w+', str(x))))
+    df['Panjang_Caption'] = df['text'].apply(lambda x: len(str(x)) if not pd.isna(x) else 0)
+
+    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
+    if df['createTimeISO'].dt.tz is None:
+        iso_series = df['createTimeISO'].dt.tz_localize('UTC')
+    else:
+        iso_series = df['createTimeISO'].dt.tz_convert('UTC')
+    df['Jam_Sejak_Publikasi'] = iso_series.apply(lambda x: _hours_since_publish(x, reference_time))
+
+    df['Jam_Posting'] = df['createTimeISO'].dt.hour
+    df['Jam_Upload'] = df['Jam_Posting']
+    df['Hari_Posting'] = df['createTimeISO'].dt.day_name()
+    df['Is_Weekend'] = df['Hari_Posting'].apply(lambda x: 1 if x in ['Saturday', 'Sunday'] else 0)
+    df['Hari_Upload'] = df['createTimeISO'].dt.dayofweek
+
+    df['content_type_detected'] = df['text'].apply(lambda text: classify_content(kamus, text))
+    df['audio_type_detected'] = df.apply(lambda row: classify_audio(row, list_audio_populer), axis=1)
+
+    all_categories = list(kamus.keys()) + ['Lainnya']
+    for cat in all_categories:
+        df[f"Kat_{cat}"] = (df['content_type_detected'] == cat).astype(int)
+        df[f"Tipe_Konten_{cat}"] = df[f"Kat_{cat}"]
+    for audio in ['Audio Original', 'Audio Populer', 'Audio Lainnya']:
+        df[f"Audio_{audio}"] = (df['audio_type_detected'] == audio).astype(int)
+        df[f"Tipe_Audio_{audio}"] = df[f"Audio_{audio}"]
+    for cat in all_categories:
+        df[f"Interaksi_{cat}_Suka"] = df[f"Kat_{cat}"] * df['Suka']
+
+    df['Kekuatan_Tren_Audio'] = df['audio_type_detected'].apply(lambda x: 0.9 if x == 'Audio Populer' else 0.5)
+    hashtag_engagement = df['Suka'] + df['Komentar'] + df['Dibagikan']
+    p75 = hashtag_engagement.quantile(0.75) if not hashtag_engagement.empty else 0
+    df['Kekuatan_Tren_Hashtag'] = hashtag_engagement.apply(lambda x: 0.9 if x >= p75 else 0.5)
+    df['Apakah_Kolaborasi'] = df['text'].apply(lambda x: 1 if any(k in str(x).lower() for k in ['collab', 'ft']) else 0)
+    df['Format_Konten_Video'] = 1
+
+    if 'Video_ID' not in df.columns:
+        df.insert(0, 'Video_ID', range(1, len(df) + 1))
+    if 'text' in df.columns and 'Caption' not in df.columns:
+        df.insert(1, 'Caption', df['text'])
+    return df
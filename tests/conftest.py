@@ -0,0 +1,109 @@
+"""
+Shared fixtures: the real dataset / model are only read; caches, snapshots,
+column stores and compiled artifacts are written to tmp_path.
+"""
+import os
+import shutil
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.keyword_matcher as keyword_matcher
+from utils.data_processor import DataProcessor
+from utils.keyword_matcher import ClassificationCache
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'dataset_tiktok.csv')
+MODEL_PATH = os.path.join(ROOT_DIR, 'models', 'tiktok_model_final_CLASSIFIER.pkl')
+
+
+@pytest.fixture(autouse=True)
+def memory_classification_cache(monkeypatch):
+    """Cache klasifikasi bersama diganti cache memori (tidak menyentuh data/.cache)"""
+    cache = ClassificationCache(persist_path=None)
+    monkeypatch.setattr(keyword_matcher, '_classification_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def make_processor(tmp_path):
+    """DataProcessor atas dataset asli dengan snapshot / column store di tmp_path"""
+    def make(data_path=DATA_PATH):
+        dp = DataProcessor()
+        dp.data_path = str(data_path)
+        dp.snapshot_dir = str(tmp_path / '.cache')
+        return dp
+    return make
+
+
+@pytest.fixture(scope='session')
+def model_path(tmp_path_factory):
+    """Salinan file model (artefak hasil kompilasi ditulis di sampingnya)"""
+    path = tmp_path_factory.mktemp('models') / os.path.basename(MODEL_PATH)
+    shutil.copy(MODEL_PATH, path)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def model(model_path):
+    """Model sklearn asli (referensi)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # InconsistentVersionWarning (model dilatih dgn sklearn lain)
+        return joblib.load(model_path)
+
+
+def sample_features(model, n_rows, nan_fraction=0.0, seed=0):
+    """Nilai tiap fitur diambil di sekitar threshold pohon agar kedua cabang terlewati"""
+    rng = np.random.default_rng(seed)
+    X = np.zeros((n_rows, model.n_features_in_), dtype=np.float64)
+    splits = {}
+    for est in model.estimators_:
+        tree = est.tree_
+        for f, t in zip(tree.feature, tree.threshold):
+            if f >= 0:
+                splits.setdefault(f, []).append(t)
+    for f in range(X.shape[1]):
+        points = np.asarray(splits.get(f, [0.0]))
+        X[:, f] = rng.choice(points, n_rows) + rng.choice([-1e-3, 0.0, 1e-3, 1.0, -1.0], n_rows)
+    if nan_fraction:
+        X[rng.random(X.shape) < nan_fraction] = np.nan
+    return pd.DataFrame(X, columns=model.feature_names_in_)
+
+
+def assert_aggregates_match(dp, expected_df, cube=None):
+    """Ringkasan, leaderboard & performa per dimensi (dari cube) sama dengan groupby baseline"""
+    expected = baseline.dashboard_aggregates(expected_df)
+
+    summary = dp.get_summary_stats(cube=cube)
+    assert summary.keys() == expected['summary'].keys()
+    for key, value in expected['summary'].items():
+        if key == 'date_range':
+            assert summary[key] == value
+        else:
+            assert summary[key] == pytest.approx(value, rel=1e-12), key
+
+    for key, method in [('by_day', dp.get_performance_by_day), ('by_hour', dp.get_performance_by_hour)]:
+        result = method(cube=cube)
+        assert [str(x) for x in result.index] == [str(x) for x in expected[key].index], key
+        np.testing.assert_allclose(result.to_numpy(dtype=float), expected[key].to_numpy(dtype=float), rtol=1e-12)
+
+    for key, method in [('content_type', dp.get_content_type_performance),
+                        ('audio_type', dp.get_audio_type_performance)]:
+        result = method(cube=cube)
+        assert result['Rata-rata Tayangan'].is_monotonic_decreasing
+        # Urutan seri rata-rata tidak ditentukan: bandingkan per label
+        result, reference = (frame.set_axis(frame.index.astype(str)).sort_index() for frame in (result, expected[key]))
+        assert result.index.tolist() == reference.index.tolist(), key
+        np.testing.assert_allclose(result.to_numpy(dtype=float), reference.to_numpy(dtype=float), rtol=1e-12)
+
+    if cube is None:
+        leaderboard = dp.get_leaderboard()
+        assert leaderboard['Total Penayangan'].is_monotonic_decreasing
+        result, reference = (frame.set_index(frame['Nama Akun'].astype(str)).drop(columns='Nama Akun').sort_index()
+                             for frame in (leaderboard, expected['leaderboard']))
+        assert result.index.tolist() == reference.index.tolist()
+        np.testing.assert_allclose(result.to_numpy(dtype=float), reference.to_numpy(dtype=float), rtol=1e-12)
@@ -0,0 +1,77 @@
+"""Incremental DataProcessor.append_rows against a full baseline reload of the grown CSV"""
+import shutil
+
+import pandas as pd
+import pytest
+
+import baseline
+import utils.input_handler as input_handler
+from conftest import DATA_PATH, assert_aggregates_match
+from test_schema import _input_row, assert_matches_baseline
+
+
+@pytest.fixture
+def grown_csv(tmp_path, monkeypatch):
+    path = tmp_path / 'dataset_tiktok.csv'
+    shutil.copy(DATA_PATH, path)
+    monkeypatch.setattr(input_handler, '_get_dataset_path', lambda: str(path))
+    return path
+
+
+def _append(dp, rows):
+    """Alur halaman Input Data Baru: tulis ke CSV lalu perbarui data di memori"""
+    assert input_handler.save_new_rows_to_csv(rows)[0]
+    return dp.append_rows(rows)
+
+
+def _assert_reload_equivalent(dp, path):
+    expected, populer = baseline.load_frame(path, dp.KAMUS_KATEGORI)
+    assert_matches_baseline(dp.df, expected)
+    assert dp.list_audio_populer == populer
+    assert_aggregates_match(dp, expected)
+    subset = baseline.dashboard_filter(expected, author='amrepsss')
+    assert dp.filter_frame(author='amrepsss')['playCount'].tolist() == subset['playCount'].tolist()
+
+
+def test_appends_match_full_reload(make_processor, grown_csv):
+    dp = make_processor(grown_csv)
+    dp.load_data(use_snapshot=False, streaming=False)
+    dp.get_cube(), dp.get_row_index()  # cube & indeks lama harus ikut diperbarui
+
+    _append(dp, [_input_row('amrepsss', 'OOTD hijab', 123_456)])
+    _assert_reload_equivalent(dp, grown_csv)
+    _append(dp, [_input_row('kreator_baru', 'resep ayam goreng', 10 + i) for i in range(5)])
+    _assert_reload_equivalent(dp, grown_csv)
+
+
+def test_song_entering_top20_reclassifies_old_rows(make_processor, grown_csv):
+    dp = make_processor(grown_csv)
+    dp.load_data(use_snapshot=False, streaming=False)
+    counts = pd.read_csv(grown_csv)['musicMeta.musicName'].value_counts()
+    outsider = counts.index[25]
+    old_rows = (dp.df['musicMeta.musicName'] == outsider).sum()
+    assert outsider not in dp.list_audio_populer and old_rows > 0
+
+    rows = [dict(_input_row('kreator_baru', 'lagu viral', 1000 + i), **{'musicMeta.musicName': outsider})
+            for i in range(counts.iloc[0] + 1)]
+    _append(dp, rows)
+    assert outsider in dp.list_audio_populer
+    _assert_reload_equivalent(dp, grown_csv)
+
+
+def test_append_before_load_reads_csv(make_processor, grown_csv):
+    dp = make_processor(grown_csv)
+    _append(dp, [_input_row('amrepsss', 'vlog jakarta', 77)])
+    _assert_reload_equivalent(dp, grown_csv)
+
+
+def test_unsynced_append_is_replaced_on_next_load(make_processor, grown_csv):
+    dp = make_processor(grown_csv)
+    dp.load_data(use_snapshot=False, streaming=False)
+    n_rows = len(dp.df)
+    dp.append_rows([_input_row('hanya_di_memori', 'tes', 1)], source_synced=False)
+    assert len(dp.df) == n_rows + 1
+
+    # File tidak berubah, tapi data di memori tidak sinkron -> muat ulang dari CSV
+    assert len(dp.load_data(streaming=False)) == n_rows
+    _assert_reload_equivalent(dp, grown_csv)
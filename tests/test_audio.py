@@ -0,0 +1,56 @@
+"""Vectorised audio classification against the baseline row-wise df.apply"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from conftest import DATA_PATH
+
+NAMES = [np.nan, None, '', ' ', '-', ' - ', 'nan', 'NaN', 'No Music', 'tidak ada musik', 'Tidak Ada Musik ',
+         'original sound - kreator', 'Suara Asli - x', 'ORIGINAL SOUND', 'Lagu Populer', 'lagu populer',
+         'Lagu Lain', 123, 4.5]
+FLAGS = [True, False, 'True', 'true', 'TRUE', 'False', np.nan, None, 1, 0, 1.0, 'yes']
+POPULER = ['Lagu Populer', '123', 4.5, np.nan]
+
+
+def expected_labels(df, populer):
+    return df.apply(lambda row: baseline.classify_audio(row, populer), axis=1).tolist()
+
+
+def test_edge_cases_match_baseline(make_processor):
+    dp = make_processor()
+    dp.list_audio_populer = POPULER
+    pairs = list(itertools.product(NAMES, FLAGS))
+    df = pd.DataFrame({'musicMeta.musicName': pd.Series([n for n, _ in pairs], dtype=object),
+                       'musicMeta.musicOriginal': pd.Series([f for _, f in pairs], dtype=object)})
+    assert dp.classify_audio_series(df).tolist() == expected_labels(df, POPULER)
+
+
+@pytest.mark.parametrize('flag_dtype', [bool, object, str])
+def test_flag_column_dtypes(make_processor, flag_dtype):
+    dp = make_processor()
+    dp.list_audio_populer = POPULER
+    df = pd.DataFrame({'musicMeta.musicName': ['Lagu Populer', 'Lagu Lain', 'x'] * 2,
+                       'musicMeta.musicOriginal': np.array([True, False, True, False, False, True]).astype(flag_dtype)})
+    assert dp.classify_audio_series(df).tolist() == expected_labels(df, POPULER)
+
+
+def test_missing_columns(make_processor):
+    dp = make_processor()
+    dp.list_audio_populer = POPULER
+    only_names = pd.DataFrame({'musicMeta.musicName': ['Lagu Populer', 'suara asli', np.nan]})
+    assert dp.classify_audio_series(only_names).tolist() == expected_labels(only_names, POPULER)
+    no_names = pd.DataFrame({'musicMeta.musicOriginal': [True, False]})
+    assert dp.classify_audio_series(no_names).tolist() == expected_labels(no_names, POPULER)
+
+
+def test_dataset_matches_baseline(make_processor):
+    dp = make_processor()
+    df = pd.read_csv(DATA_PATH)
+    populer = df['musicMeta.musicName'].value_counts().head(20).index.tolist()
+    dp.list_audio_populer = populer
+    labels = dp.classify_audio_series(df)
+    assert labels.index.equals(df.index)
+    assert labels.tolist() == expected_labels(df, populer)
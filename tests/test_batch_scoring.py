@@ -0,0 +1,79 @@
+"""Chunked batch scoring (score_stream + BatchStats) against the baseline whole-frame page flow"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.batch_scoring as batch_scoring
+from conftest import sample_features
+from utils.batch_scoring import BatchStats, download_plan, iter_chunks, score_stream
+from utils.model_handler import ModelHandler
+
+
+@pytest.fixture(scope='module')
+def handler(model_path):
+    return ModelHandler(model_path=model_path, use_cache=False)
+
+
+def _batch(model, n_rows, seed=0):
+    df = sample_features(model, n_rows, seed=seed)
+    rng = np.random.default_rng(seed)
+    df.insert(0, 'Video_ID', np.arange(n_rows))
+    df['Actual'] = rng.integers(0, 2, n_rows)
+    for col in batch_scoring.PROFILE_COLUMNS:
+        df[col] = rng.integers(0, 100_000, n_rows).astype(float)
+    # NaN tidak ikut dalam rata-rata profil
+    df.loc[df.index[::11], 'Komentar'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 333, 7])
+def test_stream_matches_baseline_page(model, handler, tmp_path, chunk_size):
+    df = _batch(model, 1000)
+    expected = baseline.batch_summary(model, list(model.feature_names_in_), df)
+    output_path = str(tmp_path / 'hasil.csv')
+
+    stats = score_stream(iter_chunks(df, chunk_size), handler, output_path)
+
+    written = pd.read_csv(output_path)
+    pd.testing.assert_frame_equal(written, pd.read_csv(_to_csv(expected['result'], tmp_path)))
+    assert stats.total == len(df)
+    assert stats.trending == expected['trending']
+    assert stats.mean_confidence == pytest.approx(expected['mean_confidence'])
+    assert int(stats.confidence_hist.sum()) == len(df)
+
+    profile = stats.profile()
+    np.testing.assert_allclose(profile[batch_scoring.PROFILE_COLUMNS].to_numpy(),
+                               expected['profile'][batch_scoring.PROFILE_COLUMNS].to_numpy())
+    assert profile['Label_Prediksi'].tolist() == expected['profile']['Label_Prediksi'].tolist()
+
+    assert stats.accuracy() == pytest.approx(expected['accuracy'])
+    np.testing.assert_array_equal(stats.confusion_matrix()[1], expected['confusion'])
+    report = stats.classification_report()
+    assert report.index.tolist() == expected['report'].index.tolist()
+    np.testing.assert_allclose(report.to_numpy(dtype=float), expected['report'].to_numpy(dtype=float))
+
+
+def _to_csv(df, tmp_path):
+    path = tmp_path / 'baseline.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_stream_from_csv_keeps_only_preview(model, handler, tmp_path):
+    source = _to_csv(_batch(model, 2500, seed=1), tmp_path)
+    stats = score_stream(iter_chunks(str(source), 400), handler, str(tmp_path / 'hasil.csv'))
+    assert stats.total == 2500
+    assert len(stats.preview()) == stats.preview_rows
+
+
+def test_download_plan_thresholds(tmp_path):
+    path = tmp_path / 'hasil.csv'
+    path.write_bytes(b'x' * 1000)
+
+    assert download_plan(10, str(path)) == (True, True)
+    assert download_plan(10, str(path), excel_max_rows=5) == (True, False)
+    assert download_plan(batch_scoring.EXCEL_MAX_ROWS + 1, str(path),
+                         excel_max_rows=10**9) == (True, False)
+    # CSV terlalu besar: tidak ada unduhan lewat tombol, Excel juga tidak dibuat
+    assert download_plan(10, str(path), max_bytes=999) == (False, False)
@@ -0,0 +1,157 @@
+"""Caption classification (matcher + LRU cache) against the baseline substring loop"""
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import baseline
+import utils.data_processor as data_processor
+import utils.keyword_matcher as keyword_matcher
+from conftest import DATA_PATH
+from utils.keyword_matcher import ClassificationCache
+
+EDGE_CASES = [np.nan, None, 12345, '', ' ', 'FT. BANDS #a#b', 'OOTD hijab GAME win', 'ñandú café',
+              'winwin', 'xyzbca', 'GRWM makeup + masak resep', 'a' * 500]
+
+
+def _captions():
+    texts = pd.read_csv(DATA_PATH, usecols=['text'])['text'].tolist() + EDGE_CASES
+    return pd.Series(texts, dtype=object)
+
+
+def test_series_matches_baseline_cold_and_cached(make_processor, memory_classification_cache):
+    dp = make_processor()
+    texts = _captions()
+    expected = [baseline.classify_content(dp.KAMUS_KATEGORI, t) for t in texts]
+
+    assert dp.classify_content_series(texts).tolist() == expected
+    assert memory_classification_cache.stats()['size'] > 0
+    # Panggilan kedua seluruhnya dari cache
+    assert dp.classify_content_series(texts).tolist() == expected
+    assert [dp._classify_content_logic(t) for t in texts] == expected
+
+
+def test_single_caption_matches_baseline(make_processor):
+    dp = make_processor()
+    for text in _captions():
+        assert dp._classify_content_logic(text) == baseline.classify_content(dp.KAMUS_KATEGORI, text)
+
+
+def test_edited_kamus_invalidates_cache(make_processor):
+    dp = make_processor()
+    texts = _captions()
+    dp.classify_content_series(texts)
+
+    dp.KAMUS_KATEGORI['Kuliner'] = dp.KAMUS_KATEGORI['Kuliner'] + ['ootd', 'win']
+    expected = [baseline.classify_content(dp.KAMUS_KATEGORI, t) for t in texts]
+    assert dp.classify_content_series(texts).tolist() == expected
+    assert [dp._classify_content_logic(t) for t in texts] == expected
+
+
+def test_fingerprint_is_hashed_once_per_kamus_change(make_processor, monkeypatch):
+    dp = make_processor()
+    texts = _captions()
+    calls = []
+    original = data_processor.json.dumps
+    monkeypatch.setattr(data_processor.json, 'dumps', lambda *a, **k: calls.append(1) or original(*a, **k))
+
+    for text in texts:
+        dp._classify_content_logic(text)
+    dp.classify_content_series(texts)
+    assert len(calls) == 1
+
+    # Edit di tempat (append keyword / ganti daftar / ganti kamus) tetap terdeteksi
+    dp.KAMUS_KATEGORI['Daily'].append('ootd')
+    assert [dp._classify_content_logic(t) for t in texts] == [baseline.classify_content(dp.KAMUS_KATEGORI, t) for t in texts]
+    dp.KAMUS_KATEGORI = {k: list(v) for k, v in dp.KAMUS_KATEGORI.items() if k != 'Fashion'}
+    assert dp.classify_content_series(texts).tolist() == [baseline.classify_content(dp.KAMUS_KATEGORI, t) for t in texts]
+    assert len(calls) == 3
+
+
+def test_processor_pickle_reattaches_shared_cache(make_processor, memory_classification_cache):
+    dp = make_processor()
+    dp.load_data(use_snapshot=False, streaming=False)
+
+    clone = pickle.loads(pickle.dumps(dp))
+    assert clone.classification_cache is memory_classification_cache
+    pd.testing.assert_frame_equal(pd.DataFrame(clone.df), pd.DataFrame(dp.df))
+    texts = _captions()
+    assert clone.classify_content_series(texts).tolist() == dp.classify_content_series(texts).tolist()
+
+
+def test_cache_pickle_keeps_entries():
+    cache = ClassificationCache(persist_path=None)
+    cache.put('ootd hari ini', 'fp', 'Fashion')
+
+    clone = pickle.loads(pickle.dumps(cache))
+    assert clone.get('ootd hari ini', 'fp') == 'Fashion'
+    clone.put('resep', 'fp', 'Kuliner')  # lock baru berfungsi
+    assert clone.stats()['size'] == 2
+
+
+def test_save_is_throttled_and_atomic(tmp_path):
+    path = tmp_path / 'cache.pkl'
+    cache = ClassificationCache(persist_path=str(path), save_interval=3600)
+
+    cache.put('ootd', 'fp', 'Fashion')
+    assert cache.save()                      # penyimpanan pertama tidak ditunda
+    cache.put('resep', 'fp', 'Kuliner')
+    assert not cache.save()                  # dalam save_interval: ditunda
+    assert ClassificationCache(persist_path=str(path)).stats()['size'] == 1
+
+    assert cache.save(force=True)
+    reloaded = ClassificationCache(persist_path=str(path))
+    assert reloaded.get('resep', 'fp') == 'Kuliner'
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_shared_cache_singleton(memory_classification_cache):
+    assert keyword_matcher.get_classification_cache() is memory_classification_cache
+
+
+def test_matcher_hit_matrix_matches_substring_scan(make_processor):
+    dp = make_processor()
+    matcher = keyword_matcher.KeywordMatcher(dp.KAMUS_KATEGORI)
+    # Keyword tumpang tindih dan karakter di luar alfabet keyword
+    texts = pd.Series(_captions().tolist() + ['ootdhijabgamer', 'résumé 🎮 game', 'gamegame'], dtype=object)
+
+    hits = matcher.hit_matrix(texts).toarray()
+    for i, text in enumerate(texts):
+        lower = '' if pd.isna(text) else str(text).lower()
+        expected = [int(keyword in lower) for keyword in matcher.keywords]
+        assert hits[i].tolist() == expected
+        assert sorted(matcher.find_keywords(lower)) == [k for k, hit in enumerate(expected) if hit]
+
+    assert matcher.classify_series(texts).tolist() == \
+        [baseline.classify_content(dp.KAMUS_KATEGORI, t) for t in texts]
+
+
+def test_matcher_without_keywords():
+    matcher = keyword_matcher.KeywordMatcher({'Edukasi': [], 'Gaming': []})
+    texts = pd.Series(['apa saja', np.nan], dtype=object)
+    assert matcher.hit_matrix(texts).nnz == 0
+    assert matcher.classify_series(texts).tolist() == ['Hiburan', 'Hiburan']
+
+
+def test_matcher_fuzz_against_baseline():
+    # Keyword ganda antar kategori, keyword di dalam keyword lain, daftar kosong, seri skor
+    kamus = {
+        'Gaming': ['game', 'gamer', 'mobile legend', 'ml'],
+        'Fashion': ['ootd', 'hijab', 'ootdhijab', 'outfit'],
+        'Beauty': ['makeup', 'hijab', 'skincare', 'make'],
+        'Kosong': [],
+        'Kuliner': ['masak', 'resep', 'mas', 'game'],
+    }
+    matcher = keyword_matcher.KeywordMatcher(kamus)
+    pieces = [kw for keywords in kamus.values() for kw in keywords] + ['a', 'x', ' ', '#', 'é', 'ML', 'GAME']
+    rng = np.random.default_rng(0)
+    texts = [''.join(rng.choice(pieces, rng.integers(0, 8))) for _ in range(3000)] + [np.nan, None, 42]
+
+    for text in texts:
+        lower = '' if pd.isna(text) else str(text).lower()
+        expected_scores = [sum(keyword in lower for keyword in keywords) for keywords in kamus.values()]
+        assert matcher.score(lower) == expected_scores
+        assert (matcher.classify(lower) if not pd.isna(text) else 'Hiburan') == baseline.classify_content(kamus, text)
+    assert matcher.classify_series(pd.Series(texts, dtype=object)).tolist() == \
+        [baseline.classify_content(kamus, t) for t in texts]
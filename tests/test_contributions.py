@@ -0,0 +1,54 @@
+"""Per-prediction contributions against a Saabas reference built from sklearn decision paths"""
+import numpy as np
+import pandas as pd
+
+from conftest import sample_features
+from utils.model_handler import ModelHandler
+from utils.tree_engine import CompiledForest
+
+
+def reference_contributions(model, X):
+    """Saabas langsung dari decision_path sklearn (per pohon, per baris)"""
+    n_rows, n_features = X.shape
+    n_classes = len(model.classes_)
+    total = np.zeros((n_rows, n_features, n_classes))
+    bias = np.zeros(n_classes)
+    for est in model.estimators_:
+        tree = est.tree_
+        value = tree.value[:, 0, :] / tree.value[:, 0, :].sum(axis=1, keepdims=True)
+        bias += value[0]
+        paths = est.decision_path(X)
+        for row in range(n_rows):
+            nodes = paths.indices[paths.indptr[row]:paths.indptr[row + 1]]
+            for parent, kid in zip(nodes[:-1], nodes[1:]):
+                total[row, tree.feature[parent]] += value[kid] - value[parent]
+    return bias / len(model.estimators_), total / len(model.estimators_)
+
+
+def test_contributions_match_decision_path_reference(model):
+    X = sample_features(model, 60, 0.1, seed=11).to_numpy(dtype=np.float32)
+    bias, contributions = CompiledForest(model).contributions(X)
+    expected_bias, expected = reference_contributions(model, X)
+    np.testing.assert_allclose(bias, expected_bias, atol=1e-12)
+    np.testing.assert_allclose(contributions, expected, atol=1e-12)
+
+
+def test_contributions_across_blocks_sum_to_probability(model):
+    X = sample_features(model, CompiledForest.CHUNK_SIZE * 2 + 7, 0.1, seed=12).to_numpy()
+    bias, contributions = CompiledForest(model).contributions(X)
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), model.predict_proba(X), atol=1e-9)
+
+
+def test_top_contributions_rank_by_magnitude(model, model_path):
+    handler = ModelHandler(model_path=model_path, use_cache=False)
+    X = sample_features(model, 25, seed=13)
+    bias, contributions_df = handler.get_contributions(X)
+    top = handler.get_top_contributions(X, top_n=3)
+
+    assert list(top.columns) == ['Faktor_Utama_1', 'Faktor_Utama_2', 'Faktor_Utama_3']
+    for (_, row), (_, values) in zip(top.iterrows(), contributions_df.iterrows()):
+        expected = values.abs().sort_values(ascending=False, kind='stable').index[:3]
+        assert [cell.rsplit(' (', 1)[0] for cell in row] == list(expected)
+    positive = handler._positive_class_index()
+    np.testing.assert_allclose(bias + contributions_df.sum(axis=1), model.predict_proba(X)[:, positive], atol=1e-9)
+    assert isinstance(contributions_df, pd.DataFrame)
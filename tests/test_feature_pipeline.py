@@ -0,0 +1,69 @@
+"""FeaturePipeline (single + batch) against the baseline prepare_features_for_prediction"""
+import numpy as np
+import pandas as pd
+
+import baseline
+from utils.feature_pipeline import FeaturePipeline
+
+TEXTS = [
+    'tutorial makeup natural untuk kuliah', 'ootd hijab kondangan', 'resep ayam geprek pedas',
+    'main mobile legends rank mythic', '', None, 'vlog jalan jalan ke bali', 'random caption tanpa kata kunci'
+]
+AUDIOS = ['Audio Original', 'Audio Populer', 'Audio Lainnya', 'Tanpa Audio', 'Audio Aneh']
+
+
+def _raw_records(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n_rows):
+        raw = {
+            'upload_hour': int(rng.integers(0, 24)), 'upload_day': int(rng.integers(0, 7)),
+            'caption_length': int(rng.integers(0, 300)), 'hashtag_count': int(rng.integers(0, 12)),
+            'likes': int(rng.integers(0, 100_000)), 'duration': int(rng.integers(1, 600)),
+            'text_content': TEXTS[i % len(TEXTS)], 'audio_type': AUDIOS[i % len(AUDIOS)],
+        }
+        # Sebagian kunci hilang -> default dict.get
+        for key in rng.choice(list(raw), size=int(rng.integers(0, 3)), replace=False):
+            del raw[key]
+        records.append(raw)
+    return records
+
+
+def test_single_prediction_features_match_baseline(make_processor):
+    dp = make_processor()
+    for raw in _raw_records(40, seed=19):
+        expected = baseline.prepare_features_for_prediction(dp.KAMUS_KATEGORI, raw)
+        pd.testing.assert_frame_equal(dp.prepare_features_for_prediction(raw), expected)
+
+
+def test_model_feature_order_matches_baseline_alignment(make_processor, model):
+    dp = make_processor()
+    feature_names = list(model.feature_names_in_)
+    for raw in _raw_records(20, seed=20):
+        features = baseline.prepare_features_for_prediction(dp.KAMUS_KATEGORI, raw)
+        # Kolom model yang tidak dibangun pipeline diisi 0 (seperti baseline predict)
+        expected = features.reindex(columns=feature_names, fill_value=0)
+        actual = dp.prepare_features_for_prediction(raw, feature_names=feature_names)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_batch_equals_stacked_single_rows(make_processor):
+    dp = make_processor()
+    records = _raw_records(200, seed=21)
+    expected = pd.concat(
+        [baseline.prepare_features_for_prediction(dp.KAMUS_KATEGORI, raw) for raw in records], ignore_index=True
+    )
+    actual = dp.get_feature_pipeline().transform_frame(dp.build_base_records(records))
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_interaction_keeps_nan_likes():
+    pipeline = FeaturePipeline(['Suka', 'Kat_Fashion', 'Interaksi_Fashion_Suka', 'Interaksi_Lainnya_Suka'])
+    records = pd.DataFrame({'Suka': [10.0, np.nan], 'content_type': ['Fashion', 'Hiburan']})
+    expected = pd.DataFrame({
+        'Suka': records['Suka'],
+        'Kat_Fashion': [1, 0],
+        'Interaksi_Fashion_Suka': [10.0, np.nan],   # 0 * NaN = NaN seperti Kat_X * Suka
+        'Interaksi_Lainnya_Suka': [0.0, np.nan],
+    })
+    pd.testing.assert_frame_equal(pipeline.transform_frame(records), expected)
@@ -0,0 +1,93 @@
+"""Append-only CSV writes against the baseline read-concat-rewrite"""
+import shutil
+
+import pandas as pd
+import pytest
+
+import baseline
+import utils.input_handler as input_handler
+from conftest import DATA_PATH
+
+# Kolom yang kosong di seluruh dataset: baseline memberi default dari dtype hasil baca
+# (float -> 0), skema tetap memberi default sesuai arti kolom; diisi eksplisit di sini
+EMPTY_IN_DATASET = {'authorMeta.nickName': 'nick', 'authorMeta.verified': 1.0, 'videoMeta.height': 1920.0,
+                    'videoMeta.width': 1080.0, 'id': 7.0}
+
+
+def _row(**values):
+    row = {'authorMeta.name': 'kreator_baru', 'text': 'resep ayam, "pedas"\nenak 🍗', 'diggCount': 3,
+           'shareCount': 1, 'playCount': 1000, 'commentCount': 2, 'videoMeta.duration': 30,
+           'musicMeta.musicName': 'Sound (Audio Lainnya)', 'musicMeta.musicOriginal': False,
+           'createTimeISO': '2025-03-01T10:15:00.000Z', 'webVideoUrl': 'manual_input', **EMPTY_IN_DATASET}
+    row.update(values)
+    return {k: v for k, v in row.items() if v is not None}
+
+
+ROWS = [
+    _row(),
+    _row(text=None, playCount=None, collectCount=None),  # default diisi
+    _row(**{'musicMeta.musicName': None, 'musicMeta.musicAuthor': None, 'musicMeta.musicOriginal': True}),
+    _row(text='baris, dengan "kutip" & koma', diggCount=10 ** 10),
+]
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    new, old = tmp_path / 'new.csv', tmp_path / 'baseline.csv'
+    shutil.copy(DATA_PATH, new)
+    shutil.copy(DATA_PATH, old)
+    monkeypatch.setattr(input_handler, '_get_dataset_path', lambda: str(new))
+    return new, old
+
+
+def assert_same_file_content(new, old):
+    # Tulis ulang baseline menjadikan kolom int yang sempat NaN float ("0.0"); nilainya sama
+    pd.testing.assert_frame_equal(pd.read_csv(new), pd.read_csv(old), check_dtype=False)
+
+
+def test_single_rows_match_baseline(paths):
+    new, old = paths
+    for row in ROWS:
+        assert input_handler.save_new_data_to_csv(row) == (True, "Data berhasil ditambahkan!")
+        baseline.save_new_data_to_csv(old, row)
+        assert_same_file_content(new, old)
+
+
+def test_batch_append_matches_sequential_baseline(paths):
+    new, old = paths
+    assert input_handler.save_new_rows_to_csv(ROWS)[0]
+    for row in ROWS:
+        baseline.save_new_data_to_csv(old, row)
+    assert_same_file_content(new, old)
+
+
+def test_missing_trailing_newline(paths):
+    new, old = paths
+    for path in (new, old):
+        path.write_bytes(path.read_bytes().rstrip(b'\n'))
+    input_handler.save_new_data_to_csv(ROWS[0])
+    baseline.save_new_data_to_csv(old, ROWS[0])
+    assert_same_file_content(new, old)
+
+
+def test_unknown_column_uses_rewrite(paths):
+    new, old = paths
+    row = _row(kolom_baru='x')
+    success, message = input_handler.save_new_data_to_csv(row)
+    assert success
+    baseline.save_new_data_to_csv(old, row)
+    assert_same_file_content(new, old)
+    assert pd.read_csv(new)['kolom_baru'].iloc[-1] == 'x'
+
+
+def test_empty_columns_get_schema_defaults(paths):
+    new, _ = paths
+    input_handler.save_new_data_to_csv({'authorMeta.name': 'minimal'})
+    last = pd.read_csv(new, keep_default_na=False).iloc[-1]
+    assert last['authorMeta.nickName'] == '-' and last['id'] == '-'
+    assert last['playCount'] == 0 and str(last['musicMeta.musicOriginal']) == 'False'
+
+
+def test_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(input_handler, '_get_dataset_path', lambda: str(tmp_path / 'tidak_ada.csv'))
+    assert input_handler.save_new_data_to_csv(ROWS[0]) == (False, "File database tidak ditemukan!")
@@ -0,0 +1,95 @@
+"""Lazy alias / derived columns against the baseline eagerly stored columns"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.keyword_matcher as keyword_matcher
+from conftest import DATA_PATH
+from utils.data_processor import LAZY_COLUMNS, DataProcessor
+from utils.keyword_matcher import ClassificationCache
+from utils.lazy_frame import LazyFrame
+
+
+def _normalize(values):
+    """Bandingkan nilai, bukan tipe (category vs object, int8 vs int64, satuan datetime)"""
+    values = pd.Series(values).reset_index(drop=True)
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.astype('datetime64[ns, UTC]')
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.astype(np.float64)
+    return values.astype(object)
+
+
+def _assert_same(actual, expected):
+    pd.testing.assert_series_equal(_normalize(actual), _normalize(expected), check_names=False)
+
+
+@pytest.fixture(scope='module')
+def frames(tmp_path_factory):
+    """(frame DataProcessor dengan kolom lazy, frame baseline dengan alias tersimpan)"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(keyword_matcher, '_classification_cache', ClassificationCache(persist_path=None))
+        dp = DataProcessor()
+        dp.snapshot_dir = str(tmp_path_factory.mktemp('cache'))
+        dp.load_data(use_snapshot=False, streaming=False)
+    expected, _ = baseline.load_frame(DATA_PATH, dp.KAMUS_KATEGORI)
+    return dp.df, expected
+
+
+@pytest.mark.parametrize('name', list(LAZY_COLUMNS))
+def test_lazy_column_access_paths(frames, name):
+    df, expected = frames
+    mask = (df['playCount'] > df['playCount'].median()).to_numpy()
+
+    assert isinstance(df, LazyFrame)
+    assert name in df
+    assert name not in df.columns and name in df.lazy_columns
+    _assert_same(df[name], expected[name])
+    _assert_same(df.get(name), expected[name])
+    _assert_same(getattr(df, name), expected[name])
+    _assert_same(df.loc[:, name], expected[name])
+    _assert_same(df.loc[mask, name], expected.loc[mask, name])
+    _assert_same(df[[name, 'playCount']][name], expected[name])
+    _assert_same(df.loc[mask, [name, 'playCount']][name], expected.loc[mask, name])
+    # Hasil slicing tetap LazyFrame
+    _assert_same(df[mask][name], expected.loc[mask, name])
+    _assert_same(df.iloc[:10][name], expected[name].iloc[:10])
+
+
+def test_materialize_matches_baseline_columns(frames):
+    df, expected = frames
+    full = df.materialize()
+    assert set(LAZY_COLUMNS) <= set(full.columns)
+    for name in full.columns:
+        if name in expected.columns:
+            _assert_same(full[name], expected[name])
+
+
+def test_get_default_and_missing_names(frames):
+    df, _ = frames
+    assert df.get('tidak_ada') is None
+    assert 'tidak_ada' not in df
+    with pytest.raises(KeyError):
+        df['tidak_ada']
+    with pytest.raises(AttributeError):
+        df.tidak_ada
+
+
+def test_stored_column_wins_and_loc_assignment():
+    frame = LazyFrame.wrap(pd.DataFrame({'a': [1, 2], 'b': [3, 4]}), {'b': 'a', 'c': 'a'})
+    assert frame['b'].tolist() == [3, 4]
+    assert frame['c'].tolist() == [1, 2]
+
+    frame.loc[0, 'a'] = 10
+    assert frame['a'].tolist() == [10, 2]
+    assert frame['c'].tolist() == [10, 2]  # alias mengikuti sumbernya
+
+
+def test_pickle_keeps_lazy_columns(frames):
+    df, expected = frames
+    clone = pickle.loads(pickle.dumps(df))
+    assert isinstance(clone, LazyFrame)
+    _assert_same(clone['Kategori_Konten'], expected['Kategori_Konten'])
@@ -0,0 +1,221 @@
+"""ModelHandler predict paths and prediction cache against the baseline predict + predict_proba"""
+import copy
+import shutil
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from conftest import sample_features
+from utils.model_handler import ModelHandler
+from utils.prediction_cache import PredictionCache, get_prediction_cache
+
+
+def _handler(model_path, **kwargs):
+    kwargs.setdefault('use_cache', False)
+    return ModelHandler(model_path=model_path, **kwargs)
+
+
+@pytest.mark.parametrize('use_compiled', [True, False])
+def test_single_predict_matches_baseline(model, model_path, use_compiled):
+    handler = _handler(model_path, use_compiled=use_compiled)
+    names = list(model.feature_names_in_)
+    X = sample_features(model, 40, 0.05, seed=11)
+    for i in range(len(X)):
+        row = X.iloc[[i]]
+        record = {k: v for k, v in row.iloc[0].items() if not np.isnan(v) or i % 2}  # sebagian fitur hilang
+        for features in (row, record):
+            label, confidence, probabilities = handler.predict(features)
+            expected = baseline.predict(model, names, features.copy())
+            assert label == expected[0]
+            assert confidence == pytest.approx(expected[1], abs=1e-12)
+            np.testing.assert_allclose(probabilities, expected[2], rtol=0, atol=1e-12)
+
+
+def test_one_ensemble_pass_per_call(model, model_path, monkeypatch):
+    handler = _handler(model_path, use_compiled=False)
+    sklearn_model = handler.model
+    calls = []
+    monkeypatch.setattr(sklearn_model, 'predict', lambda X: pytest.fail('predict() dipanggil terpisah'),
+                        raising=False)
+    original = type(sklearn_model).predict_proba
+    monkeypatch.setattr(sklearn_model, 'predict_proba', lambda X: calls.append(len(X)) or original(sklearn_model, X),
+                        raising=False)
+
+    X = sample_features(model, 50, seed=12)
+    labels, probabilities = handler.predict_batch(X)
+    handler.predict(X.iloc[[0]])
+    assert calls == [50, 1]
+    np.testing.assert_array_equal(labels, model.predict(X))
+
+
+def test_input_is_not_modified(model, model_path):
+    handler = _handler(model_path)
+    names = list(model.feature_names_in_)
+    frame = sample_features(model, 5, seed=13).drop(columns=names[:3])
+    record = frame.iloc[0].to_dict()
+    before_frame, before_record = frame.copy(), dict(record)
+
+    handler.predict_batch(frame)
+    handler.predict(record)
+    # Baseline menambah kolom yang hilang ke objek pemanggil; jalur baru tidak
+    pd.testing.assert_frame_equal(frame, before_frame)
+    assert record == before_record
+
+
+def test_dtypes_duplicates_and_extra_columns(model, model_path):
+    handler = _handler(model_path)
+    names = list(model.feature_names_in_)
+    X = sample_features(model, 300, seed=14)
+    X[names[1]] = (X[names[1]] > 0)                      # bool
+    X[names[2]] = X[names[2]].round().astype(np.int64)   # int
+    frame = pd.concat([X, X[[names[0]]].rename(columns={names[0]: 'lain'}), X[[names[3]]] * 0 + 99.0], axis=1)
+    frame.columns = list(X.columns) + ['lain', names[3]]  # kolom duplikat: kemunculan pertama dipakai
+
+    labels, probabilities = handler.predict_batch(frame)
+    expected_labels, expected_proba = baseline.predict_batch(model, names, X)
+    np.testing.assert_array_equal(labels, expected_labels)
+    np.testing.assert_allclose(probabilities, expected_proba, rtol=0, atol=1e-12)
+
+
+def test_plans_are_cached_per_schema_and_bounded(model, model_path):
+    handler = _handler(model_path)
+    names = list(model.feature_names_in_)
+    plan = handler._alignment_plan(names[::-1])
+    assert handler._alignment_plan(names[::-1]) is plan
+    assert handler._alignment_plan(names) is not plan
+
+    for i in range(ModelHandler.MAX_ALIGNMENT_PLANS + 5):
+        handler._alignment_plan(names[:i % len(names)] + [f'extra_{i}'])
+    assert len(handler._alignment_plans) <= ModelHandler.MAX_ALIGNMENT_PLANS
+
+    handler.load_model()  # model dimuat ulang -> rencana lama dibuang
+    assert handler._alignment_plans == {}
+
+
+def test_invalid_values_fail_like_baseline(model, model_path):
+    handler = _handler(model_path)
+    record = {name: 0.0 for name in model.feature_names_in_}
+    record[model.feature_names_in_[0]] = 'bukan angka'
+    assert handler.predict(record) == (None, None, None)
+    assert handler.predict_batch(pd.DataFrame([record])) == (None, None)
+
+
+@pytest.mark.parametrize('n_rows', [1, ModelHandler.COMPILED_MAX_ROWS + 1])
+def test_sklearn_path_without_feature_name_warning(model, model_path, n_rows):
+    handler = _handler(model_path, use_compiled=n_rows > 1)
+    X = sample_features(model, n_rows, seed=15)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('error', message='X does not have valid feature names')
+        labels, _ = handler.predict_batch(X)
+    np.testing.assert_array_equal(labels, model.predict(X))
+
+
+def _count_scored_rows(handler, monkeypatch):
+    scored = []
+    original = handler._predict_proba
+    monkeypatch.setattr(handler, '_predict_proba', lambda X: scored.append(len(X)) or original(X))
+    return scored
+
+
+def test_cache_scores_each_distinct_vector_once(model, model_path, monkeypatch):
+    handler = _handler(model_path, use_cache=True)
+    handler.prediction_cache = PredictionCache()
+    scored = _count_scored_rows(handler, monkeypatch)
+    X = sample_features(model, 100, 0.1, seed=16)
+    batch = pd.concat([X, X.iloc[:40]], ignore_index=True)  # 40 baris duplikat dalam satu batch
+    expected = baseline.predict_batch(model, list(model.feature_names_in_), batch)
+
+    for _ in range(2):
+        labels, probabilities = handler.predict_batch(batch)
+        np.testing.assert_array_equal(labels, expected[0])
+        np.testing.assert_allclose(probabilities, expected[1], rtol=0, atol=1e-12)
+    assert scored == [100]  # panggilan kedua seluruhnya dari cache
+
+    # Hasil yang diubah pemanggil tidak merusak isi cache
+    probabilities[:] = -1
+    np.testing.assert_allclose(handler.predict_batch(batch)[1], expected[1], rtol=0, atol=1e-12)
+
+
+def test_cache_is_invalidated_by_a_new_model(model, model_path, tmp_path, monkeypatch):
+    path = tmp_path / 'model.pkl'
+    shutil.copy(model_path, path)
+    cache = PredictionCache()
+    handler = ModelHandler(model_path=str(path), use_cache=True)
+    handler.prediction_cache = cache
+    X = sample_features(model, 60, seed=17)
+    handler.predict_batch(X)
+    assert cache.stats()['size'] == 60
+
+    # Model lain di path yang sama (setengah pohon): fingerprint berubah, prediksi lama dibuang
+    smaller = copy.deepcopy(model)
+    smaller.estimators_ = smaller.estimators_[: len(model.estimators_) // 2]
+    smaller.n_estimators = len(smaller.estimators_)
+    joblib.dump(smaller, path)
+    labels, probabilities = handler.predict_batch(X)
+    np.testing.assert_array_equal(labels, smaller.predict(X))
+    np.testing.assert_allclose(probabilities, smaller.predict_proba(X), rtol=0, atol=1e-12)
+    assert cache.stats()['size'] == 60 and cache.fingerprint == handler.model_fingerprint
+
+
+def test_lru_eviction():
+    cache = PredictionCache(max_size=3)
+    for key in 'abcd':
+        cache.put_many([(key, np.array([float(ord(key))]))], 'fp')
+    assert cache.get_many(['a'], 'fp') == [None]  # paling lama -> dibuang
+    cache.get_many(['b'], 'fp')                   # b dipakai lagi -> c yang dibuang berikutnya
+    cache.put_many([('e', np.array([0.0]))], 'fp')
+    assert [x is not None for x in cache.get_many(['b', 'c', 'd', 'e'], 'fp')] == [True, False, True, True]
+    assert cache.stats()['evictions'] == 2
+    assert cache.get_many(['b'], 'fp-baru') == [None]  # fingerprint lain: cache dikosongkan
+
+
+def test_handlers_share_the_process_cache(model_path):
+    assert _handler(model_path, use_cache=True).prediction_cache is get_prediction_cache()
+    assert _handler(model_path, use_cache=False).prediction_cache is None
+
+
+def _no_unpickle(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('model di-unpickle padahal artefak sudah ada')
+    monkeypatch.setattr('utils.model_handler.joblib.load', fail)
+
+
+def test_lazy_load_serves_info_and_predictions_from_the_artifact(model, model_path, monkeypatch):
+    feature_names = list(model.feature_names_in_)
+    _handler(model_path).load_model()  # Artefak ditulis (atau sudah ada)
+
+    handler = _handler(model_path)
+    assert handler._meta is None and handler._model is None  # __init__ tidak memuat apa pun
+    _no_unpickle(monkeypatch)
+
+    assert handler.get_model_info() == baseline.model_info(model, feature_names)
+    pd.testing.assert_frame_equal(
+        handler.get_feature_importance(), baseline.feature_importance(model, feature_names)
+    )
+    X = sample_features(model, 50, 0.1, seed=18)
+    labels, probabilities = handler.predict_batch(X)
+    expected = baseline.predict_batch(model, feature_names, X)
+    np.testing.assert_array_equal(labels, expected[0])
+    np.testing.assert_allclose(probabilities, expected[1], rtol=0, atol=1e-12)
+    assert handler._model is None
+
+
+def test_lazy_load_reloads_a_changed_model_file(model, model_path, tmp_path):
+    path = tmp_path / 'model.pkl'
+    shutil.copy(model_path, path)
+    handler = ModelHandler(model_path=str(path), use_cache=False)
+    assert handler.get_model_info()['n_estimators'] == model.n_estimators
+
+    smaller = copy.deepcopy(model)
+    smaller.estimators_ = smaller.estimators_[:3]
+    smaller.n_estimators = 3
+    joblib.dump(smaller, path)
+    feature_names = list(model.feature_names_in_)
+    assert handler.get_model_info() == baseline.model_info(smaller, feature_names)
+    pd.testing.assert_frame_equal(
+        handler.get_feature_importance(), baseline.feature_importance(smaller, feature_names)
+    )
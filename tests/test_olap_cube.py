@@ -0,0 +1,92 @@
+"""Pre-aggregated dashboard cube (slice / roll-up / merge) against the baseline groupby helpers"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.keyword_matcher as keyword_matcher
+from conftest import DATA_PATH, assert_aggregates_match
+from utils.data_processor import CORRELATION_COLUMNS, DataProcessor
+from utils.keyword_matcher import ClassificationCache
+from utils.olap_cube import OlapCube, RunningMoments
+
+SLICES = [
+    {},
+    {'author': 'amrepsss'},
+    {'year': 2024},
+    {'year': 2024, 'month_name': 'March'},
+    {'start_date': date(2024, 1, 1), 'end_date': date(2024, 6, 30)},
+    {'author': 'amrepsss', 'start_date': date(2023, 1, 1), 'end_date': date(2024, 12, 31)},
+    {'year': 1999},
+]
+
+
+@pytest.fixture(scope='module')
+def loaded(tmp_path_factory):
+    """(DataProcessor mode memori, frame baseline)"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(keyword_matcher, '_classification_cache', ClassificationCache(persist_path=None))
+        dp = DataProcessor()
+        dp.snapshot_dir = str(tmp_path_factory.mktemp('cache'))
+        dp.load_data(use_snapshot=False, streaming=False)
+    expected, _ = baseline.load_frame(DATA_PATH, dp.KAMUS_KATEGORI)
+    return dp, expected
+
+
+def test_full_cube_matches_baseline(loaded):
+    dp, expected = loaded
+    assert_aggregates_match(dp, expected)
+    assert_aggregates_match(dp, expected, cube=dp.get_cube())
+
+
+@pytest.mark.parametrize('filters', SLICES)
+def test_slices_match_filtered_baseline(loaded, filters):
+    dp, expected = loaded
+    author = filters.get('author')
+    time_filter = {k: v for k, v in filters.items() if k != 'author'}
+    # Alur halaman Dashboard: cube kreator, lalu filter waktu
+    cube = dp.get_cube().slice(author=author).slice(**time_filter)
+    subset = baseline.dashboard_filter(expected, **filters)
+    if subset.empty:
+        assert cube.empty and dp.get_summary_stats(cube=cube) == {}
+        return
+    assert_aggregates_match(dp, subset, cube=cube)
+
+    std = cube.std_by('upload_day')
+    reference = subset.groupby('upload_day')['playCount'].std()
+    np.testing.assert_allclose(std.reindex(reference.index).to_numpy(dtype=float),
+                               reference.to_numpy(dtype=float), rtol=1e-9)
+
+
+@pytest.mark.parametrize('n_parts', [2, 7])
+def test_merged_parts_equal_whole(loaded, n_parts):
+    dp, expected = loaded
+    frame = pd.DataFrame(dp.df)
+    parts = np.array_split(np.arange(len(frame)), n_parts)
+    cube = OlapCube.from_frame(frame.iloc[parts[0]])
+    for part in parts[1:]:
+        cube = cube.merge(OlapCube.from_frame(frame.iloc[part]))
+
+    whole = OlapCube.from_frame(frame)
+    assert len(cube.cells) == len(whole.cells)
+    assert cube.totals().keys() == whole.totals().keys()
+    for key, value in whole.totals().items():
+        if key.startswith('createTimeISO'):
+            assert cube.totals()[key] == value
+        else:
+            assert cube.totals()[key] == pytest.approx(value, rel=1e-12), key
+    assert_aggregates_match(dp, expected, cube=cube)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 97, 5000])
+def test_running_moments_match_pandas_corr(loaded, chunk_size):
+    _, expected = loaded
+    moments = RunningMoments(CORRELATION_COLUMNS)
+    for start in range(0, len(expected), chunk_size):
+        moments.update(expected.iloc[start:start + chunk_size])
+    reference = expected[CORRELATION_COLUMNS].corr()
+    np.testing.assert_allclose(moments.corr().to_numpy(), reference.to_numpy(), atol=1e-9)
+    np.testing.assert_allclose(RunningMoments.from_dict(moments.to_dict()).corr().to_numpy(),
+                               reference.to_numpy(), atol=1e-9)
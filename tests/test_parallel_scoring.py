@@ -0,0 +1,109 @@
+"""Process-pool batch scoring against in-process scoring and the baseline predict_batch"""
+import sys
+
+import numpy as np
+import pytest
+
+import baseline
+import utils.model_handler as model_handler_module
+from conftest import sample_features
+from utils.model_handler import ModelHandler, configured_workers, PREDICT_WORKERS_ENV
+
+
+def _sklearn_modules(_=None):
+    """Dijalankan di dalam worker: modul sklearn yang sudah diimpor proses tersebut"""
+    return sorted(name for name in sys.modules if name.startswith('sklearn'))
+
+
+@pytest.fixture(scope='module')
+def parallel_handler(model_path):
+    handler = ModelHandler(model_path=model_path, use_cache=False, n_workers=2, min_shard_rows=100)
+    yield handler
+    handler.shutdown()
+
+
+def test_serial_is_default(model_path):
+    handler = ModelHandler(model_path=model_path)
+    assert handler.n_workers == 1
+    assert handler._n_shards(10 ** 7) == 1
+
+
+@pytest.mark.parametrize('value, expected', [(None, 1), ('', 1), ('3', 3), ('0', 1), ('banyak', 1)])
+def test_configured_workers(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(PREDICT_WORKERS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(PREDICT_WORKERS_ENV, value)
+    assert configured_workers() == expected
+
+
+def test_get_model_handler_applies_worker_count(monkeypatch, model_path):
+    monkeypatch.setattr(model_handler_module, '_model_handler', ModelHandler(model_path=model_path))
+    assert model_handler_module.get_model_handler().n_workers == 1
+    monkeypatch.setenv(PREDICT_WORKERS_ENV, '4')
+    handler = model_handler_module.get_model_handler(n_workers=configured_workers())  # seperti halaman 4
+    assert handler.n_workers == 4
+    assert model_handler_module.get_model_handler().n_workers == 4  # halaman lain tidak mengubahnya
+
+
+@pytest.mark.parametrize('n_rows', [99, 1000, ModelHandler.COMPILED_MAX_ROWS + 500])
+def test_parallel_matches_serial_and_baseline(model, model_path, parallel_handler, n_rows):
+    X = sample_features(model, n_rows, 0.1, seed=n_rows)
+    serial = ModelHandler(model_path=model_path, use_cache=False)
+
+    labels, probabilities = parallel_handler.predict_batch(X)
+    serial_labels, serial_proba = serial.predict_batch(X)
+    expected_labels, expected_proba = baseline.predict_batch(model, list(model.feature_names_in_), X)
+
+    # Worker selalu memakai engine terkompilasi: identik dengan engine di proses ini
+    np.testing.assert_array_equal(probabilities, serial.engine.predict_proba(serial._align(X)))
+    np.testing.assert_allclose(probabilities, serial_proba, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(labels, serial_labels)
+    np.testing.assert_array_equal(labels, expected_labels)
+    np.testing.assert_allclose(probabilities, expected_proba, rtol=0, atol=1e-12)
+
+
+def test_worker_never_loads_sklearn_model(model, parallel_handler):
+    parallel_handler.predict_batch(sample_features(model, 6000, seed=5))  # shard > COMPILED_MAX_ROWS
+    assert parallel_handler._n_shards(6000) == 2
+    for modules in parallel_handler._get_executor().map(_sklearn_modules, range(4)):
+        assert modules == []
+
+
+def test_score_shard_uses_engine_only(model, model_path, monkeypatch):
+    handler = ModelHandler(model_path=model_path, use_cache=False)
+    handler.feature_names  # muat & tulis artefak
+    monkeypatch.setattr(model_handler_module.joblib, 'load', lambda *a, **k: pytest.fail("sklearn model loaded"))
+    model_handler_module._init_worker(handler._artifact_path)
+
+    X = handler._align(sample_features(model, ModelHandler.COMPILED_MAX_ROWS * 3, 0.1, seed=6))
+    np.testing.assert_allclose(model_handler_module._score_shard(X), model.predict_proba(X), rtol=0, atol=1e-12)
+
+
+def test_pool_is_reused_and_shut_down(model, parallel_handler, monkeypatch):
+    registered = []
+    monkeypatch.setattr(model_handler_module.atexit, 'register', registered.append)
+    parallel_handler.shutdown()
+    parallel_handler._shutdown_registered = False
+
+    X = sample_features(model, 400, seed=7)
+    parallel_handler.predict_batch(X)
+    executor = parallel_handler._executor
+    assert executor is not None
+    parallel_handler.predict_batch(X)
+    assert parallel_handler._executor is executor
+
+    parallel_handler.shutdown()
+    assert parallel_handler._executor is None
+    labels, _ = parallel_handler.predict_batch(X)  # pool baru dibuat saat dibutuhkan
+    assert len(labels) == len(X)
+    assert parallel_handler._executor is not executor
+    assert len(registered) == 1  # handler atexit tidak menumpuk
+
+
+def test_no_parallel_without_compiled_artifact(model, model_path):
+    handler = ModelHandler(model_path=model_path, use_compiled=False, use_cache=False, n_workers=2, min_shard_rows=100)
+    X = sample_features(model, 1000, seed=8)
+    labels, probabilities = handler.predict_batch(X)
+    assert handler._n_shards(len(X)) == 1 and handler._executor is None
+    np.testing.assert_allclose(probabilities, model.predict_proba(X), rtol=0, atol=1e-12)
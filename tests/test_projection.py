@@ -0,0 +1,84 @@
+"""Column projections and on-demand detail columns against the baseline full-CSV load"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.keyword_matcher as keyword_matcher
+from conftest import DATA_PATH
+from utils.data_processor import DETAIL_COLUMNS, PROJECTIONS, DataProcessor
+from utils.keyword_matcher import ClassificationCache
+
+FILTERS = [{}, {'author': 'amrepsss'}, {'start_date': date(2024, 1, 1), 'end_date': date(2024, 6, 30)}]
+
+
+@pytest.fixture(scope='module')
+def processors(tmp_path_factory):
+    """(DataProcessor mode memori, DataProcessor mode streaming, frame baseline dengan semua kolom CSV)"""
+    cache_dir = str(tmp_path_factory.mktemp('cache'))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(keyword_matcher, '_classification_cache', ClassificationCache(persist_path=None))
+        memory = DataProcessor()
+        memory.snapshot_dir = cache_dir
+        memory.load_data(use_snapshot=False, streaming=False)
+        streaming = DataProcessor()
+        streaming.snapshot_dir = cache_dir
+        streaming.load_streaming(chunk_size=137)
+    expected, _ = baseline.load_frame(DATA_PATH, memory.KAMUS_KATEGORI)
+    return memory, streaming, expected
+
+
+def assert_columns_match(frame, expected, columns):
+    for col in columns:
+        actual, reference = frame[col], expected.loc[frame.index, col]
+        if col == 'createTimeISO':
+            pd.testing.assert_series_equal(actual.astype('datetime64[ns, UTC]'),
+                                           reference.astype('datetime64[ns, UTC]'), check_names=False)
+        elif pd.api.types.is_numeric_dtype(reference):
+            np.testing.assert_array_equal(actual.to_numpy(dtype=np.float64), reference.to_numpy(dtype=np.float64), err_msg=col)
+        else:
+            assert actual.astype(object).where(actual.notna(), None).tolist() == \
+                reference.astype(object).where(reference.notna(), None).tolist(), col
+
+
+def test_load_skips_detail_columns(processors):
+    memory, _, expected = processors
+    assert set(DETAIL_COLUMNS) <= set(expected.columns)
+    assert not set(DETAIL_COLUMNS) & set(memory.df.columns)
+
+
+@pytest.mark.parametrize('consumer', sorted(PROJECTIONS))
+def test_projection_matches_baseline(processors, consumer):
+    memory, streaming, expected = processors
+    for dp in (memory, streaming):
+        frame = dp.get_projection(consumer)
+        assert list(frame.columns) == PROJECTIONS[consumer]
+        assert len(frame) == len(expected)
+        assert_columns_match(frame, expected, PROJECTIONS[consumer])
+
+
+def test_reference_stats_match_baseline(processors):
+    memory, streaming, expected = processors
+    for dp in (memory, streaming):
+        stats = dp.get_reference_stats()
+        assert stats['avg_likes'] == pytest.approx(expected['diggCount'].mean(), rel=1e-12)
+        assert stats['avg_comments'] == pytest.approx(expected['commentCount'].mean(), rel=1e-12)
+        assert stats['avg_shares'] == pytest.approx(expected['shareCount'].mean(), rel=1e-12)
+        assert stats['avg_duration'] == pytest.approx(expected['videoMeta.duration'].mean(), rel=1e-12)
+        assert stats['trending_threshold'] == pytest.approx(np.percentile(expected['playCount'], 75), rel=1e-12)
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_with_details_matches_full_load(processors, filters):
+    memory, streaming, expected = processors
+    wanted = DETAIL_COLUMNS + ['text', 'webVideoUrl']
+    for dp in (memory, streaming):
+        frame = dp.filter_frame(columns=PROJECTIONS['dashboard'], **filters)
+        # Urutan acak (mis. hasil nlargest): kolom detail mengikuti index baris
+        frame = frame.sample(frac=0.3, random_state=25) if len(frame) > 10 else frame
+        detailed = dp.with_details(frame, wanted)
+        assert list(detailed.columns) == PROJECTIONS['dashboard'] + wanted
+        assert detailed.index.equals(frame.index)
+        assert_columns_match(detailed, expected, PROJECTIONS['dashboard'] + wanted)
@@ -0,0 +1,55 @@
+"""Vectorized preprocess_raw_data against the baseline row-wise page code"""
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from conftest import DATA_PATH
+from utils.raw_preprocessing import preprocess_raw_data
+
+REFERENCE_TIME = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def assert_matches_baseline(dp, df_raw, reference_time):
+    actual = preprocess_raw_data(df_raw, reference_time, data_processor=dp)
+    # Lagu populer diisi fungsi dari data ini (dp kosong), baseline memakai daftar yang sama
+    expected = baseline.preprocess_raw_data(dp.KAMUS_KATEGORI, dp.list_audio_populer, df_raw, reference_time)
+
+    materialized = actual.materialize()
+    assert set(materialized.columns) == set(expected.columns)
+    for col in expected.columns:
+        # Kolom int dari apply/astype(int) boleh berbeda lebar dtype, nilainya harus identik
+        pd.testing.assert_series_equal(materialized[col], expected[col], check_dtype=False, obj=col)
+    for alias in ('Jam_Upload', 'Tipe_Konten_Lainnya', 'Tipe_Audio_Audio Populer'):
+        assert alias in actual.lazy_columns
+        pd.testing.assert_series_equal(actual[alias], expected[alias], check_dtype=False)
+
+
+def test_dataset_export_matches_baseline(make_processor):
+    df_raw = pd.read_csv(DATA_PATH, nrows=3000)
+    assert_matches_baseline(make_processor(), df_raw, REFERENCE_TIME)
+
+
+@pytest.mark.parametrize('reference_time', [REFERENCE_TIME, datetime(2024, 1, 16, 9, 0)])
+def test_edge_cases_match_baseline(make_processor, reference_time):
+    texts = [
+        '#a#b #c', 'tanpa hashtag', None, '#', 'Collab bareng #OOTD', 'FT. teman', 'after gift',
+        '#makanan_enak #日本 #123', '', '   ', 'tutorial makeup #beauty', np.nan,
+    ]
+    n = len(texts)
+    rng = np.random.default_rng(20)
+    df_raw = pd.DataFrame({
+        'text': texts,
+        'diggCount': rng.integers(0, 5000, n),
+        'commentCount': rng.integers(0, 300, n),
+        'shareCount': rng.integers(0, 200, n),
+        'videoMeta.duration': rng.integers(1, 300, n),
+        'musicMeta.musicName': ['original sound', 'Lagu A', None, 'Lagu A', '-', 'suara asli - x',
+                                'Lagu B', 'no music', 'Lagu A', 'Lagu C', 'Lagu B', 'Lagu A'],
+        'musicMeta.musicOriginal': [False, False, False, True, False, False, False, False, False, False, 'true', False],
+        # Naif (dianggap UTC); sebagian setelah waktu referensi -> 0 jam
+        'createTimeISO': pd.date_range('2024-01-15 22:30', periods=n, freq='7h').strftime('%Y-%m-%dT%H:%M:%S'),
+    })
+    assert_matches_baseline(make_processor(), df_raw, reference_time)
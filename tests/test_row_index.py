@@ -0,0 +1,83 @@
+"""Author / upload-time indexes against the baseline Dashboard boolean masks"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from conftest import DATA_PATH
+from utils.row_index import RowIndex
+
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September',
+          'October', 'November', 'December']
+
+
+def _frame(tz):
+    """Kolom kreator & waktu dataset asli (UTC), dalam zona lain, atau naive; plus kreator kosong"""
+    df = pd.read_csv(DATA_PATH, usecols=['authorMeta.name', 'createTimeISO'])
+    times = pd.to_datetime(df['createTimeISO'])
+    if tz is None:
+        times = times.dt.tz_localize(None)
+    elif tz != 'UTC':
+        times = times.dt.tz_convert(tz)
+    df['createTimeISO'] = times
+    df.loc[df.index[::50], 'authorMeta.name'] = np.nan
+    return df
+
+
+def _random_filters(df, n, seed=0):
+    rng = np.random.default_rng(seed)
+    authors = df['authorMeta.name'].dropna().unique().tolist() + [None, None, 'tidak_ada']
+    dates = df['createTimeISO'].dt.date
+    lo, hi = dates.min() - timedelta(days=3), dates.max() + timedelta(days=3)
+    span = (hi - lo).days
+    years = sorted(df['createTimeISO'].dt.year.unique().tolist()) + [1999]
+    for _ in range(n):
+        filters = {'author': authors[rng.integers(len(authors))]}
+        mode = rng.integers(4)
+        if mode == 1:
+            start = lo + timedelta(days=int(rng.integers(span)))
+            filters.update(start_date=start, end_date=start + timedelta(days=int(rng.integers(0, 120))))
+        elif mode >= 2:
+            filters['year'] = years[rng.integers(len(years))]
+            if mode == 3:
+                filters['month_name'] = MONTHS[rng.integers(12)]
+        yield filters
+
+
+@pytest.mark.parametrize('tz', ['UTC', None, 'Asia/Jakarta', 'America/New_York'])
+def test_positions_match_baseline_masks(tz):
+    df = _frame(tz)
+    index = RowIndex(df)
+    for filters in _random_filters(df, 300):
+        expected = baseline.dashboard_filter(df, **filters).index.to_numpy()
+        np.testing.assert_array_equal(index.positions(**filters), expected, err_msg=str(filters))
+
+
+@pytest.mark.parametrize('tz', ['UTC', None, 'Asia/Jakarta'])
+def test_sidebar_options_match_baseline(tz):
+    df = _frame(tz)
+    index = RowIndex(df)
+    for author in [None, 'amrepsss', 'tidak_ada']:
+        base = df if author is None else df[df['authorMeta.name'] == author]
+        assert index.count(author) == len(base)
+        if base.empty:
+            assert index.date_bounds(author) == (None, None)
+            continue
+        # Baseline: min/max tanggal, tahun unik, bulan dalam tahun (urut kalender)
+        times = base['createTimeISO']
+        assert index.date_bounds(author) == (times.min().date(), times.max().date())
+        years = sorted(times.dt.year.unique())
+        assert index.available_years(author) == years
+        for year in years:
+            months = times[times.dt.year == year].dt.month_name().unique()
+            assert index.available_months(year, author) == sorted(months, key=MONTHS.index)
+
+
+def test_date_objects_and_timestamps_agree():
+    df = _frame('UTC')
+    index = RowIndex(df)
+    start, end = date(2024, 1, 1), date(2024, 3, 31)
+    np.testing.assert_array_equal(index.positions(start_date=start, end_date=end),
+                                  index.positions(start_date=pd.Timestamp(start), end_date=pd.Timestamp(end)))
@@ -0,0 +1,105 @@
+"""Compact dtype schema of the processed frame against the baseline float64/object frame"""
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.input_handler as input_handler
+from conftest import DATA_PATH
+from utils.data_processor import COUNT_DTYPES, SMALL_INT_COLUMNS, DataProcessor
+
+LABEL_COLUMNS = ['upload_day', 'upload_day_english', 'upload_month', 'content_type', 'audio_type']
+
+
+def assert_matches_baseline(frame, expected):
+    """Nilai sama dengan frame baseline (tipe boleh lebih ringkas)"""
+    assert len(frame) == len(expected)
+    for col in COUNT_DTYPES:
+        np.testing.assert_array_equal(frame[col].to_numpy(dtype=np.float64), expected[col].to_numpy(dtype=np.float64))
+    np.testing.assert_array_equal(frame['engagement_rate'].to_numpy(), expected['engagement_rate'].to_numpy())
+    for col in SMALL_INT_COLUMNS:
+        np.testing.assert_array_equal(frame[col].to_numpy(dtype=np.int64), expected[col].to_numpy(dtype=np.int64))
+    for col in LABEL_COLUMNS:
+        assert frame[col].astype(str).tolist() == expected[col].astype(str).tolist(), col
+    pd.testing.assert_series_equal(frame['createTimeISO'].astype('datetime64[ns, UTC]'),
+                                   expected['createTimeISO'].astype('datetime64[ns, UTC]'), check_names=False)
+
+
+@pytest.fixture
+def csv_copy(tmp_path):
+    path = tmp_path / 'dataset_tiktok.csv'
+    shutil.copy(DATA_PATH, path)
+    return path
+
+
+def test_fixed_dtypes_and_baseline_values(make_processor):
+    dp = make_processor()
+    dp.load_data(use_snapshot=False, streaming=False)
+    expected, populer = baseline.load_frame(DATA_PATH, dp.KAMUS_KATEGORI)
+
+    for col, dtype in COUNT_DTYPES.items():
+        assert dp.df[col].dtype == dtype, col
+    for col, dtype in SMALL_INT_COLUMNS.items():
+        assert dp.df[col].dtype == dtype, col
+    for col in LABEL_COLUMNS:
+        assert isinstance(dp.df[col].dtype, pd.CategoricalDtype), col
+    assert_matches_baseline(dp.df, expected)
+    assert dp.list_audio_populer == populer
+
+
+def test_snapshot_keeps_schema(make_processor):
+    first = make_processor()
+    first.load_data()
+    second = make_processor()
+    second.load_data()  # dari snapshot
+    pd.testing.assert_frame_equal(pd.DataFrame(second.df), pd.DataFrame(first.df))
+
+
+def _input_row(author, text, play_count, duration=30, share_count=1):
+    """Baris seperti yang dibuat halaman Input Data Baru"""
+    return {
+        'authorMeta.name': author, 'authorMeta.nickName': author, 'authorMeta.verified': False,
+        'text': text, 'videoMeta.duration': duration, 'musicMeta.musicOriginal': False,
+        'musicMeta.musicName': 'Sound (Audio Lainnya)', 'musicMeta.musicAuthor': '-',
+        'playCount': play_count, 'diggCount': 3, 'shareCount': share_count, 'commentCount': 2,
+        'createTimeISO': '2025-03-01T10:15:00.000Z', 'webVideoUrl': 'manual_input',
+        'videoMeta.height': 1920, 'videoMeta.width': 1080, 'id': f'manual_{play_count}',
+    }
+
+
+def test_append_keeps_widths_and_widens_only_when_needed(make_processor, csv_copy, monkeypatch):
+    monkeypatch.setattr(input_handler, '_get_dataset_path', lambda: str(csv_copy))
+    dp = make_processor(csv_copy)
+    dp.load_data(use_snapshot=False, streaming=False)
+
+    # Alur halaman Input Data Baru: tulis ke CSV, lalu append_rows di memori
+    rows = [_input_row('amrepsss', 'OOTD hijab', 5_000_000_000),   # > int32: playCount memang int64
+            _input_row('kreator_baru', 'resep ayam goreng', 12)]
+    assert input_handler.save_new_rows_to_csv(rows)[0]
+    dp.append_rows(rows)
+
+    expected, populer = baseline.load_frame(csv_copy, dp.KAMUS_KATEGORI)
+    for col, dtype in COUNT_DTYPES.items():
+        assert dp.df[col].dtype == dtype, col
+    assert_matches_baseline(dp.df, expected)
+    assert dp.list_audio_populer == populer
+
+    # Nilai pecahan / di luar rentang int32: disimpan float64, bukan dipotong
+    more = [_input_row('amrepsss', 'vlog jakarta', 40, duration=12.5, share_count=2 ** 31)]
+    assert input_handler.save_new_rows_to_csv(more)[0]
+    dp.append_rows(more)
+
+    expected, _ = baseline.load_frame(csv_copy, dp.KAMUS_KATEGORI)
+    assert dp.df['videoMeta.duration'].dtype == np.float64
+    assert dp.df['shareCount'].dtype == np.float64
+    assert dp.df['commentCount'].dtype == np.int32
+    assert_matches_baseline(dp.df, expected)
+
+
+def test_count_column_fallbacks():
+    values = pd.Series([1.0, 2.0, np.nan])
+    assert DataProcessor._count_column(values, np.int32).dtype == np.float64
+    assert DataProcessor._count_column(pd.Series([1.0, 2.0]), np.int32).dtype == np.int32
+    assert DataProcessor._count_column(pd.Series([float(2 ** 40)]), np.int64).tolist() == [2 ** 40]
@@ -0,0 +1,74 @@
+"""Binary snapshot of the processed frame against the baseline CSV load"""
+import os
+import shutil
+
+import pytest
+
+import baseline
+import utils.data_processor as data_processor
+from conftest import DATA_PATH
+from test_schema import assert_matches_baseline
+
+
+@pytest.fixture
+def csv_copy(tmp_path):
+    path = tmp_path / 'dataset_tiktok.csv'
+    shutil.copy(DATA_PATH, path)
+    return path
+
+
+def _no_derive(monkeypatch):
+    """Pemuatan berikutnya harus dari snapshot (tanpa parsing / turunan kolom)"""
+    def fail(self, df, time_reference=None):
+        raise AssertionError('CSV diproses ulang')
+    monkeypatch.setattr(data_processor.DataProcessor, '_derive_features', fail)
+
+
+def test_snapshot_matches_baseline(make_processor, csv_copy, monkeypatch):
+    make_processor(csv_copy).load_data(streaming=False)
+    expected, populer = baseline.load_frame(csv_copy, make_processor().KAMUS_KATEGORI)
+
+    _no_derive(monkeypatch)
+    dp = make_processor(csv_copy)
+    assert_matches_baseline(dp.load_data(streaming=False), expected)
+    assert dp.list_audio_populer == populer
+
+
+def test_touch_keeps_snapshot(make_processor, csv_copy, monkeypatch):
+    make_processor(csv_copy).load_data(streaming=False)
+    stat = os.stat(csv_copy)
+    os.utime(csv_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    _no_derive(monkeypatch)
+    assert make_processor(csv_copy).load_data(streaming=False) is not None
+
+
+def test_changed_source_or_kamus_rebuilds(make_processor, csv_copy):
+    make_processor(csv_copy).load_data(streaming=False)
+
+    # Isi berubah dengan ukuran sama: hash konten menolak snapshot
+    content = csv_copy.read_bytes()
+    csv_copy.write_bytes(content.replace(b'amrepsss', b'amrepzzz', 1))
+    dp = make_processor(csv_copy)
+    expected, _ = baseline.load_frame(csv_copy, dp.KAMUS_KATEGORI)
+    assert_matches_baseline(dp.load_data(streaming=False), expected)
+    assert (dp.df['authorMeta.name'] == 'amrepzzz').any()
+
+    # Kamus diubah: klasifikasi konten dihitung ulang
+    dp = make_processor(csv_copy)
+    dp.KAMUS_KATEGORI = {**dp.KAMUS_KATEGORI, 'Gaming': ['ootd']}
+    expected, _ = baseline.load_frame(csv_copy, dp.KAMUS_KATEGORI)
+    frame = dp.load_data(streaming=False)
+    assert frame['content_type'].astype(str).tolist() == expected['content_type'].tolist()
+
+
+def test_version_bump_rebuilds(make_processor, csv_copy, monkeypatch):
+    make_processor(csv_copy).load_data(streaming=False)
+    monkeypatch.setattr(data_processor, 'SNAPSHOT_VERSION', data_processor.SNAPSHOT_VERSION + 1)
+    dp = make_processor(csv_copy)
+    calls = []
+    derive = data_processor.DataProcessor._derive_features
+    monkeypatch.setattr(data_processor.DataProcessor, '_derive_features',
+                        lambda self, df, time_reference=None: calls.append(1) or derive(self, df, time_reference))
+    dp.load_data(streaming=False)
+    assert calls
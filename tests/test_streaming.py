@@ -0,0 +1,138 @@
+"""Streaming column-store mode against the in-memory mode and the baseline Dashboard computations"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+import utils.data_processor as data_processor
+import utils.keyword_matcher as keyword_matcher
+from conftest import DATA_PATH
+from utils.data_processor import CORRELATION_COLUMNS, DataProcessor
+from utils.keyword_matcher import ClassificationCache
+
+FILTERS = [
+    {},
+    {'author': 'amrepsss'},
+    {'year': 2024},
+    {'year': 2024, 'month_name': 'March'},
+    {'start_date': date(2024, 1, 1), 'end_date': date(2024, 6, 30)},
+    {'author': 'tidak_ada'},
+]
+
+
+@pytest.fixture(scope='module')
+def processors(tmp_path_factory):
+    """(DataProcessor mode memori, DataProcessor mode streaming, frame baseline)"""
+    cache_dir = str(tmp_path_factory.mktemp('cache'))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(keyword_matcher, '_classification_cache', ClassificationCache(persist_path=None))
+        memory = DataProcessor()
+        memory.snapshot_dir = cache_dir
+        memory.load_data(use_snapshot=False, streaming=False)
+        streaming = DataProcessor()
+        streaming.snapshot_dir = cache_dir
+        streaming.load_streaming(chunk_size=137)  # chunk kecil: banyak batas chunk
+    expected, _ = baseline.load_frame(DATA_PATH, memory.KAMUS_KATEGORI)
+    return memory, streaming, expected
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(data_processor, 'STREAM_CHUNK_SIZE', 97)
+
+
+def test_store_is_used(processors):
+    _, streaming, expected = processors
+    assert streaming.df is None and streaming.store is not None
+    assert streaming.row_count() == len(expected)
+
+
+def test_aggregates_match_baseline(processors):
+    memory, streaming, expected = processors
+    for dp in (memory, streaming):
+        stats = dp.get_summary_stats()
+        assert stats['total_videos'] == len(expected)
+        assert stats['total_views'] == expected['playCount'].sum()
+        assert stats['avg_engagement_rate'] == pytest.approx(expected['engagement_rate'].mean(), rel=1e-12)
+
+        leaderboard = dp.get_leaderboard()
+        assert leaderboard['Nama Akun'].tolist()[:5] == (
+            expected.groupby('authorMeta.name')['playCount'].sum().sort_values(ascending=False).index.tolist()[:5])
+
+        corr = dp.get_correlation_matrix()
+        np.testing.assert_allclose(corr.to_numpy(), expected[CORRELATION_COLUMNS].corr().to_numpy(), atol=1e-9)
+
+        top = dp.get_top_videos(n=10)
+        assert top['playCount'].tolist() == expected.nlargest(10, 'playCount')['playCount'].tolist()
+    assert memory.list_audio_populer == streaming.list_audio_populer
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_filter_frame_matches_baseline(processors, filters):
+    memory, streaming, expected = processors
+    subset = baseline.dashboard_filter(expected, **filters)
+    for dp in (memory, streaming):
+        frame = dp.filter_frame(**filters)
+        assert len(frame) == len(subset)
+        assert frame['playCount'].tolist() == subset['playCount'].tolist()
+        assert frame['content_type'].astype(str).tolist() == subset['content_type'].tolist()
+
+
+@pytest.mark.parametrize('timeline_max_points', [5_000, 50])
+@pytest.mark.parametrize('filters', FILTERS)
+def test_dashboard_panels_match_baseline(processors, monkeypatch, filters, timeline_max_points):
+    monkeypatch.setattr(data_processor, 'TIMELINE_MAX_POINTS', timeline_max_points)
+    memory, streaming, expected = processors
+    subset = baseline.dashboard_filter(expected, **filters)
+
+    for dp in (memory, streaming):
+        panels = dp.get_dashboard_panels(**filters)
+        assert panels['n_videos'] == len(subset)
+        if subset.empty:
+            continue
+        assert panels['median_views'] == subset['playCount'].median()
+
+        counts, edges = np.histogram(subset['engagement_rate'], bins=30)
+        np.testing.assert_array_equal(panels['engagement_hist']['Frekuensi'].to_numpy(), counts)
+        np.testing.assert_allclose(panels['engagement_hist']['Batas Bawah'].to_numpy(), edges[:-1])
+
+        np.testing.assert_allclose(panels['correlation'].to_numpy(),
+                                   subset[CORRELATION_COLUMNS].corr().to_numpy(), atol=1e-9)
+
+        for key, metric in [('top_views', 'playCount'), ('top_likes', 'diggCount'), ('top_comments', 'commentCount')]:
+            top = subset.nlargest(10, metric)
+            assert panels[key][metric].tolist() == top[metric].tolist()
+            assert panels[key]['text'].tolist() == top['text'].tolist()
+
+        series = panels['time_series'].reset_index(drop=True)
+        if len(subset) <= timeline_max_points:
+            # Satu titik per video (urutan waktu)
+            rows = subset[['createTimeISO', 'playCount']].sort_values(['createTimeISO', 'playCount'])
+            series = series.sort_values(['createTimeISO', 'playCount'])
+            assert series['playCount'].tolist() == rows['playCount'].tolist()
+            assert (series['createTimeISO'].astype('datetime64[ns, UTC]').tolist()
+                    == rows['createTimeISO'].astype('datetime64[ns, UTC]').tolist())
+        else:
+            # Total tayangan harian
+            daily = subset.groupby(subset['createTimeISO'].dt.date)['playCount'].sum()
+            assert series['playCount'].tolist() == daily.tolist()
+            assert [ts.date() for ts in series['createTimeISO']] == daily.index.tolist()
+
+
+def test_unfiltered_panels_never_read_the_whole_store(processors, monkeypatch):
+    monkeypatch.setattr(data_processor, 'TIMELINE_MAX_POINTS', 50)
+    _, streaming, _ = processors
+    reads = []
+    original = streaming._frame_from_store
+
+    def recording(positions=None, columns=None):
+        reads.append(streaming.row_count() if positions is None else len(positions))
+        return original(positions, columns)
+
+    monkeypatch.setattr(streaming, '_frame_from_store', recording)
+    streaming.get_dashboard_panels(n_top=10)
+    # Hanya kandidat top-n dibaca: paling banyak ~n baris per blok (seri ikut), bukan seluruh store
+    n_blocks = -(-streaming.row_count() // data_processor.STREAM_CHUNK_SIZE)
+    assert reads and max(reads) <= 2 * 10 * n_blocks < streaming.row_count()
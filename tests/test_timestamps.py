@@ -0,0 +1,154 @@
+"""createTimeISO parsing (scraper fast path + default-parser fallback) against the baseline pd.to_datetime"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline
+from conftest import DATA_PATH
+from utils.column_store import ColumnStore
+from utils.timestamp_parser import epoch_parts, first_timestamp, parse_iso_timestamps
+
+SCRAPER = ['2024-06-03T12:50:13.000Z', '2023-12-31T23:59:59.999Z', '2024-02-29T00:00:00.000Z']
+COLUMNS = {
+    'scraper': SCRAPER + [np.nan, None],
+    'scraper_invalid_day': SCRAPER + ['2024-02-30T10:00:00.000Z'],
+    'scraper_then_variants': SCRAPER + ['2024-06-04T01:00:00Z', '2024-06-03T12:50:13.5Z',
+                                        '2024-06-03T19:50:13.000+07:00', '2024-06-04 01:00:00', 'rusak', ''],
+    'naive_first': ['2024-06-04 01:00:00', '2024-06-05 13:15:00'] + SCRAPER + ['rusak', np.nan],
+    'naive_only': ['2024-06-04 01:00:00', '2024-01-15 23:30:00', np.nan],
+    'offset_first': ['2024-06-03T12:50:13+07:00', '2024-01-01T00:30:00+07:00', SCRAPER[0]],
+    'null_strings_first': ['nan', 'NaT', '2024-06-04 01:00:00', SCRAPER[0]],
+    'empty': [np.nan, None],
+}
+
+
+def baseline_parse(values):
+    try:
+        return pd.to_datetime(values, dayfirst=False, errors='coerce')
+    except ValueError:
+        # Baseline gagal memuat data (offset campuran); parser baru menyamakan ke UTC
+        return pd.to_datetime(values, dayfirst=False, errors='coerce', utc=True)
+
+
+@pytest.mark.parametrize('name', COLUMNS)
+def test_parse_matches_default_parser(name):
+    values = pd.Series(COLUMNS[name], dtype=object, name='createTimeISO')
+    times, n_fallback = parse_iso_timestamps(values)
+    pd.testing.assert_series_equal(times, baseline_parse(values))
+    assert (n_fallback == 0) == (name in ('scraper', 'empty'))
+
+
+def test_mixed_offsets_fall_back_to_utc():
+    values = pd.Series(COLUMNS['scraper_then_variants'], dtype=object)
+    with pytest.raises(ValueError):
+        pd.to_datetime(values, dayfirst=False, errors='coerce')
+    times, _ = parse_iso_timestamps(values)
+    assert str(times.dt.tz) == 'UTC'
+    assert times.iloc[:len(SCRAPER)].tolist() == pd.to_datetime(pd.Series(SCRAPER)).tolist()
+
+
+@pytest.mark.parametrize('name', COLUMNS)
+def test_chunks_with_reference_match_whole_column(name):
+    values = pd.Series(COLUMNS[name], dtype=object, name='createTimeISO')
+    reference = first_timestamp(values)
+    chunks = [parse_iso_timestamps(values.iloc[i:i + 2], reference=reference)[0] for i in range(0, len(values), 2)]
+    expected = baseline_parse(values)
+    if not expected.isna().all():
+        pd.testing.assert_series_equal(pd.concat(chunks), expected)
+
+
+def test_first_timestamp_skips_null_strings():
+    assert first_timestamp(pd.Series([np.nan, '', 'NaT', 'nan', 'x'], dtype=object)) == 'x'
+    assert first_timestamp(pd.Series([np.nan, None], dtype=object)) is None
+
+
+@pytest.mark.parametrize('tz', [None, 'UTC', 'UTC+07:00'])
+def test_epoch_parts_follow_wall_clock(tz):
+    naive = pd.Series(pd.date_range('2023-12-30 20:00', periods=200, freq='37min'))
+    times = naive if tz is None else pd.to_datetime(naive.dt.strftime('%Y-%m-%dT%H:%M:%S') + (
+        'Z' if tz == 'UTC' else '+07:00'))
+    parts = epoch_parts(times)
+    np.testing.assert_array_equal(parts['hour'], times.dt.hour)
+    np.testing.assert_array_equal(parts['weekday'], times.dt.weekday)
+    np.testing.assert_array_equal(parts['year'], times.dt.year)
+    np.testing.assert_array_equal(parts['month'], times.dt.month)
+
+
+@pytest.mark.parametrize('name', ['scraper', 'naive_only', 'offset_first'])
+def test_column_store_keeps_timezone(tmp_path, name):
+    times = baseline_parse(pd.Series(COLUMNS[name], dtype=object)).dropna().reset_index(drop=True)
+    store = ColumnStore.create(str(tmp_path / 'store'), {'createTimeISO': 'datetime'})
+    store.append(pd.DataFrame({'createTimeISO': times.iloc[:1]}))
+    store.append(pd.DataFrame({'createTimeISO': times.iloc[1:]}))
+    store.close()
+    read = ColumnStore(str(tmp_path / 'store')).column('createTimeISO')
+    pd.testing.assert_series_equal(read, times.dt.as_unit('us'), check_names=False)
+
+
+@pytest.fixture
+def mixed_csv(tmp_path):
+    """Dataset asli dengan createTimeISO campuran; baris pertama naive -> kolom baseline naive"""
+    df = pd.read_csv(DATA_PATH)
+    rng = np.random.default_rng(0)
+    raw = df['createTimeISO'].astype(object)
+    parsed = pd.to_datetime(raw)
+    pick = rng.random(len(df))
+    naive = parsed.dt.strftime('%Y-%m-%d %H:%M:%S')
+    raw = raw.where(pick >= 0.3, naive)                      # terbaca (format acuan)
+    raw = raw.where((pick < 0.3) | (pick >= 0.35), 'rusak')  # tidak terbaca -> waktu sekarang
+    raw = raw.where((pick < 0.35) | (pick >= 0.4), np.nan)
+    raw.iloc[0] = naive.iloc[0]
+    df['createTimeISO'] = raw
+    path = tmp_path / 'dataset_tiktok.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def assert_times_match_baseline(frame, expected):
+    now = pd.Timestamp.now()
+    filled = (expected['createTimeISO'] - now).abs() < pd.Timedelta(minutes=5)
+    assert filled.any() and not filled.all()
+    assert frame['createTimeISO'].dt.tz is None
+    pd.testing.assert_series_equal(frame['createTimeISO'][~filled].dt.as_unit('us'),
+                                   expected['createTimeISO'][~filled].dt.as_unit('us'), check_names=False)
+    assert ((frame['createTimeISO'][filled] - now).abs() < pd.Timedelta(minutes=5)).all()
+    for col in ['upload_hour', 'upload_year', 'Is_Weekend']:
+        np.testing.assert_array_equal(frame[col][~filled].to_numpy(dtype=np.int64),
+                                      expected[col][~filled].to_numpy(dtype=np.int64))
+    for col in ['upload_day', 'upload_day_english', 'upload_month']:
+        assert frame[col][~filled].astype(str).tolist() == expected[col][~filled].astype(str).tolist()
+
+
+def test_mixed_naive_file_matches_baseline_load(make_processor, mixed_csv):
+    dp = make_processor(mixed_csv)
+    expected, _ = baseline.load_frame(mixed_csv, dp.KAMUS_KATEGORI)
+    assert expected['createTimeISO'].dt.tz is None
+
+    assert_times_match_baseline(dp.load_data(use_snapshot=False, streaming=False), expected)
+    # Snapshot menyimpan kolom naive apa adanya
+    dp.load_data(use_snapshot=True, streaming=False)
+    assert_times_match_baseline(make_processor(mixed_csv).load_data(use_snapshot=True, streaming=False), expected)
+
+
+def test_mixed_naive_file_streaming_matches_baseline(make_processor, mixed_csv):
+    dp = make_processor(mixed_csv)
+    expected, _ = baseline.load_frame(mixed_csv, dp.KAMUS_KATEGORI)
+    # Chunk berikutnya bisa diawali baris format scraper: format tetap dari baris pertama file
+    dp.load_streaming(chunk_size=50)
+    columns = ['createTimeISO', 'upload_hour', 'upload_year', 'Is_Weekend', 'upload_day',
+               'upload_day_english', 'upload_month']
+    assert_times_match_baseline(dp.filter_frame(columns=columns), expected)
+
+
+def test_appended_rows_follow_file_format(make_processor, mixed_csv):
+    full = pd.read_csv(mixed_csv)
+    dp = make_processor(mixed_csv)
+    expected, _ = baseline.load_frame(mixed_csv, dp.KAMUS_KATEGORI)
+
+    full.iloc[:-40].to_csv(mixed_csv, index=False)
+    dp.load_data(use_snapshot=False, streaming=False)
+    full.to_csv(mixed_csv, index=False)
+    tail = full.iloc[-40:]
+    # Baris tambahan diawali format scraper, kolom tetap naive seperti pemuatan ulang baseline
+    assert tail['createTimeISO'].str.endswith('Z').any()
+    assert_times_match_baseline(dp.append_rows(tail), expected)
@@ -0,0 +1,62 @@
+"""Compiled tree engine / ModelHandler scoring against sklearn and the baseline predict_batch"""
+import numpy as np
+import pytest
+
+import baseline
+from conftest import sample_features
+from utils.model_handler import ModelHandler
+from utils.tree_engine import CompiledForest
+
+
+@pytest.mark.parametrize('nan_fraction', [0.0, 0.2])
+def test_compiled_forest_matches_sklearn(model, nan_fraction):
+    X = sample_features(model, 3000, nan_fraction)
+    engine = CompiledForest(model)
+
+    expected = model.predict_proba(X)
+    np.testing.assert_allclose(engine.predict_proba(X.to_numpy()), expected, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(engine.predict(X.to_numpy()), model.predict(X))
+
+
+def test_saved_artifact_matches_sklearn(model, tmp_path):
+    X = sample_features(model, 1000, 0.2, seed=1)
+    CompiledForest(model).save(tmp_path / 'engine')
+    engine = CompiledForest.load(tmp_path / 'engine', mmap_mode='r')
+    np.testing.assert_allclose(engine.predict_proba(X.to_numpy()), model.predict_proba(X), rtol=0, atol=1e-12)
+
+
+def test_contributions_sum_to_probability(model):
+    X = sample_features(model, 200, 0.2, seed=2).to_numpy()
+    engine = CompiledForest(model)
+    bias, contributions = engine.contributions(X)
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), model.predict_proba(X), rtol=0, atol=1e-9)
+
+
+def test_infinity_rejected(model):
+    X = sample_features(model, 5).to_numpy(copy=True)
+    X[0, 0] = np.inf
+    with pytest.raises(ValueError):
+        CompiledForest(model).predict_proba(X)
+
+
+@pytest.mark.parametrize('n_rows', [1, 500, ModelHandler.COMPILED_MAX_ROWS + 100])
+def test_predict_batch_matches_baseline(model, model_path, n_rows):
+    handler = ModelHandler(model_path=model_path, use_cache=False)
+    X = sample_features(model, n_rows, 0.1, seed=n_rows)
+    # Skema masukan berbeda: kolom teracak, satu kolom hilang (diisi 0), kolom tambahan diabaikan
+    frame = X.drop(columns=X.columns[0]).sample(frac=1.0, axis=1, random_state=0).assign(extra=1.0)
+
+    labels, probabilities = handler.predict_batch(frame)
+    expected_labels, expected_proba = baseline.predict_batch(model, list(model.feature_names_in_), frame)
+    np.testing.assert_array_equal(labels, expected_labels)
+    np.testing.assert_allclose(probabilities, expected_proba, rtol=0, atol=1e-12)
+
+
+def test_cached_predictions_match_baseline(model, model_path):
+    handler = ModelHandler(model_path=model_path, use_cache=True)
+    X = sample_features(model, 300, 0.1, seed=3)
+    expected_labels, expected_proba = baseline.predict_batch(model, list(model.feature_names_in_), X)
+    for _ in range(2):  # kedua kalinya dari prediction cache
+        labels, probabilities = handler.predict_batch(X)
+        np.testing.assert_array_equal(labels, expected_labels)
+        np.testing.assert_allclose(probabilities, expected_proba, rtol=0, atol=1e-12)
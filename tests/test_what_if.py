@@ -0,0 +1,48 @@
+"""What-if sweep against the baseline: one form re-submitted per combination"""
+import itertools
+
+import numpy as np
+
+import baseline
+from utils.model_handler import ModelHandler
+from utils.what_if import sweep_posting_options
+
+RAW_INPUT = {
+    'likes': 1200, 'comments': 40, 'shares': 15, 'duration': 35, 'hashtag_count': 4,
+    'caption_length': 80, 'text_content': 'tutorial makeup natural untuk kuliah',
+    'hours_since_publish': 24, 'upload_day': 2, 'upload_hour': 19, 'audio_type': 'Audio Populer'
+}
+
+
+def test_sweep_matches_one_baseline_prediction_per_combination(make_processor, model, model_path):
+    dp = make_processor()
+    handler = ModelHandler(model_path=model_path, use_cache=False)
+    hours, days = range(0, 24, 5), range(7)
+    audio_types = ['Audio Original', 'Audio Populer', 'Audio Lainnya']
+    durations = [10, 35, 90, 240]
+
+    result = sweep_posting_options(dp, handler, RAW_INPUT, hours=hours, days=days,
+                                   audio_types=audio_types, durations=durations)
+    ranked = result['ranked']
+    assert len(ranked) == len(hours) * len(days) * len(audio_types) * len(durations)
+
+    feature_names = list(model.feature_names_in_)
+    trending_idx = list(model.classes_).index(1)
+    expected = {}
+    for hour, day, audio, duration in itertools.product(hours, days, audio_types, durations):
+        raw = dict(RAW_INPUT, upload_hour=hour, upload_day=day, audio_type=audio, duration=duration)
+        features = baseline.prepare_features_for_prediction(dp.KAMUS_KATEGORI, raw)
+        label, _, probabilities = baseline.predict(model, feature_names, features)
+        expected[(hour, day, audio, duration)] = (label, probabilities[trending_idx])
+
+    keys = list(zip(ranked['upload_hour'], ranked['upload_day'], ranked['audio_type'], ranked['duration']))
+    assert sorted(keys) == sorted(expected)
+    np.testing.assert_array_equal(ranked['Prediksi'].to_numpy(), [expected[k][0] for k in keys])
+    np.testing.assert_allclose(ranked['Prob_Trending'].to_numpy(), [expected[k][1] for k in keys], rtol=0, atol=1e-12)
+    assert ranked['Prob_Trending'].is_monotonic_decreasing
+
+    # Heatmap: probabilitas terbaik per (hari, jam) di atas audio & durasi
+    heatmap = result['heatmap']
+    for day, hour in itertools.product(days, hours):
+        best = max(expected[(hour, day, a, d)][1] for a, d in itertools.product(audio_types, durations))
+        assert abs(heatmap.loc[day, hour] - best) <= 1e-12
@@ -0,0 +1,285 @@
+"""
+Batch Scoring Module
+Chunked (streaming) batch prediction with incremental summary statistics
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# Jumlah baris per chunk saat membaca & memprediksi file besar
+CHUNK_SIZE = 20_000
+
+# Batas baris data pada satu sheet Excel (1.048.576 termasuk header)
+EXCEL_MAX_ROWS = 1_048_575
+
+# st.download_button membaca seluruh file ke memori server (dan dikirim ke browser sekaligus).
+# Di atas batas ini CSV tidak disajikan lewat tombol unduh (hanya path file di server),
+# dan file Excel tidak dibuat sama sekali.
+DOWNLOAD_MAX_BYTES = 200 * 1024 * 1024
+EXCEL_DOWNLOAD_MAX_ROWS = 200_000
+
+LABELS = {0: 'Tidak Trending', 1: 'Trending'}
+
+# Metrik yang dirata-rata per kelompok prediksi (panel "Trending vs Tidak")
+PROFILE_COLUMNS = ['Suka', 'Komentar', 'Dibagikan']
+
+
+class BatchStats:
+    """Running aggregates of a streamed batch prediction (memory independent of row count)"""
+
+    def __init__(self, n_bins=5, preview_rows=1000):
+        """
+        Args:
+            n_bins (int): Number of confidence histogram bins
+            preview_rows (int): Number of result rows kept for the preview table
+        """
+        self.n_bins = n_bins
+        self.preview_rows = preview_rows
+        self.total = 0
+        self.confidence_sum = 0.0
+        self.label_counts = {}
+        self.bin_edges = None
+        self.confidence_hist = np.zeros(n_bins, dtype=np.int64)
+        self.profile_sums = {}
+        self.profile_counts = {}
+        self.confusion = {}
+        self._preview = []
+        self._preview_len = 0
+
+    def update(self, result, n_classes=2):
+        """
+        Add one scored chunk
+
+        Args:
+            result (pd.DataFrame): Chunk with Prediksi, Label_Prediksi, Confidence_Score
+            n_classes (int): Number of model classes (sets the histogram range)
+        """
+        self.total += len(result)
+        confidence = result['Confidence_Score'].to_numpy(dtype=np.float64)
+        self.confidence_sum += float(confidence.sum())
+
+        # Histogram dengan batas tetap [1/n_kelas, 1] agar bisa dijumlah antar chunk
+        if self.bin_edges is None:
+            self.bin_edges = np.linspace(1.0 / n_classes, 1.0, self.n_bins + 1)
+        bins = np.searchsorted(self.bin_edges, confidence, side='left') - 1
+        self.confidence_hist += np.bincount(np.clip(bins, 0, self.n_bins - 1), minlength=self.n_bins)
+
+        for label, count in result['Label_Prediksi'].value_counts().items():
+            self.label_counts[label] = self.label_counts.get(label, 0) + int(count)
+
+        # Jumlah & count per label untuk rata-rata metrik profil
+        profile_cols = [c for c in PROFILE_COLUMNS if c in result.columns]
+        if len(profile_cols) == len(PROFILE_COLUMNS):
+            grouped = result.groupby('Label_Prediksi')[profile_cols]
+            for label, sums in grouped.sum().iterrows():
+                self.profile_sums[label] = self.profile_sums.get(label, 0) + sums.to_numpy(dtype=np.float64)
+            for label, counts in grouped.count().iterrows():
+                self.profile_counts[label] = self.profile_counts.get(label, 0) + counts.to_numpy(dtype=np.float64)
+
+        # Confusion matrix kumulatif (jika ada label aktual)
+        if 'Actual' in result.columns:
+            actual = pd.to_numeric(result['Actual'], errors='coerce')
+            valid = actual.notna().to_numpy()
+            pairs = pd.DataFrame({'actual': actual[valid].to_numpy(),
+                                  'pred': result['Prediksi'].to_numpy()[valid]})
+            for (a, p), count in pairs.value_counts().items():
+                self.confusion[(a, p)] = self.confusion.get((a, p), 0) + int(count)
+
+        if self._preview_len < self.preview_rows:
+            head = result.iloc[:self.preview_rows - self._preview_len]
+            self._preview.append(head)
+            self._preview_len += len(head)
+
+    # --- HASIL ---
+    @property
+    def trending(self):
+        return self.label_counts.get(LABELS[1], 0)
+
+    @property
+    def mean_confidence(self):
+        return self.confidence_sum / self.total if self.total else 0.0
+
+    def preview(self):
+        """First preview_rows result rows"""
+        if not self._preview:
+            return pd.DataFrame()
+        return pd.concat(self._preview, ignore_index=True)
+
+    def label_counts_series(self):
+        """Prediction counts per label, largest first"""
+        return pd.Series(self.label_counts, dtype=np.int64).sort_values(ascending=False)
+
+    def confidence_histogram(self):
+        """
+        Returns:
+            pd.DataFrame: Range (interval label) and Jumlah per bin
+        """
+        if self.bin_edges is None:
+            return pd.DataFrame({'Range': [], 'Jumlah': []})
+        intervals = pd.IntervalIndex.from_breaks(np.round(self.bin_edges, 3))
+        return pd.DataFrame({'Range': intervals.astype(str), 'Jumlah': self.confidence_hist})
+
+    def profile(self):
+        """
+        Mean of PROFILE_COLUMNS per predicted label
+
+        Returns:
+            pd.DataFrame or None: Label_Prediksi + mean columns (None if columns absent)
+        """
+        if not self.profile_sums:
+            return None
+        labels = sorted(self.profile_sums)
+        means = [self.profile_sums[label] / self.profile_counts[label] for label in labels]
+        profile = pd.DataFrame(means, columns=PROFILE_COLUMNS)
+        profile.insert(0, 'Label_Prediksi', labels)
+        return profile
+
+    def confusion_matrix(self):
+        """
+        Returns:
+            tuple: (sorted class labels, confusion matrix as np.ndarray)
+        """
+        classes = sorted({a for a, _ in self.confusion} | {p for _, p in self.confusion})
+        position = {label: i for i, label in enumerate(classes)}
+        matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+        for (a, p), count in self.confusion.items():
+            matrix[position[a], position[p]] = count
+        return classes, matrix
+
+    def accuracy(self):
+        _, matrix = self.confusion_matrix()
+        total = matrix.sum()
+        return np.trace(matrix) / total if total else 0.0
+
+    def classification_report(self):
+        """
+        Precision / recall / f1 / support from the cumulative confusion matrix
+        (same layout as sklearn classification_report(output_dict=True) transposed)
+
+        Returns:
+            pd.DataFrame: One row per class plus accuracy, macro avg, weighted avg
+        """
+        classes, matrix = self.confusion_matrix()
+        tp = np.diag(matrix).astype(np.float64)
+        support = matrix.sum(axis=1).astype(np.float64)
+        predicted = matrix.sum(axis=0).astype(np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(predicted > 0, tp / predicted, 0.0)
+            recall = np.where(support > 0, tp / support, 0.0)
+            denom = precision + recall
+            f1 = np.where(denom > 0, 2 * precision * recall / denom, 0.0)
+
+        rows = {}
+        for i, label in enumerate(classes):
+            key = str(int(label)) if float(label).is_integer() else str(label)
+            rows[key] = {'precision': precision[i], 'recall': recall[i], 'f1-score': f1[i], 'support': support[i]}
+
+        n = support.sum()
+        accuracy = tp.sum() / n if n else 0.0
+        rows['accuracy'] = {'precision': accuracy, 'recall': accuracy, 'f1-score': accuracy, 'support': accuracy}
+        rows['macro avg'] = {'precision': precision.mean(), 'recall': recall.mean(),
+                             'f1-score': f1.mean(), 'support': n}
+        weights = support / n if n else support
+        rows['weighted avg'] = {'precision': (precision * weights).sum(), 'recall': (recall * weights).sum(),
+                                'f1-score': (f1 * weights).sum(), 'support': n}
+        return pd.DataFrame(rows).transpose()
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """
+    Yield DataFrame chunks from an in-memory DataFrame or a CSV path / file object
+
+    Args:
+        source (pd.DataFrame, str or file): Input data
+        chunk_size (int): Rows per chunk
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start:start + chunk_size]
+    else:
+        with pd.read_csv(source, chunksize=chunk_size) as reader:
+            yield from reader
+
+
+def score_stream(chunks, model_handler, output_path, progress_callback=None, explain_top_n=0):
+    """
+    Score chunks one at a time, append each result to a CSV file and
+    update running statistics (only one chunk is held in memory)
+
+    Args:
+        chunks (iterable): DataFrame chunks (see iter_chunks)
+        model_handler (ModelHandler): Loaded model handler
+        output_path (str): CSV file receiving input columns + prediction columns
+        progress_callback (callable): Called with the number of rows scored so far
+        explain_top_n (int): Attach the top-N contributing features per row (0 = off)
+
+    Returns:
+        BatchStats: Aggregated results
+    """
+    stats = BatchStats()
+    first = True
+    for chunk in chunks:
+        preds, probs = model_handler.predict_batch(chunk)
+        if preds is None:
+            raise ValueError("Prediksi batch gagal, periksa format data input.")
+
+        result = chunk.assign(Prediksi=preds)
+        result['Label_Prediksi'] = result['Prediksi'].map(LABELS)
+        result['Confidence_Score'] = probs.max(axis=1)
+
+        if explain_top_n:
+            top = model_handler.get_top_contributions(chunk, top_n=explain_top_n)
+            if top is not None:
+                result = pd.concat([result, top.set_axis(result.index)], axis=1)
+
+        result.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+        stats.update(result, n_classes=probs.shape[1])
+        first = False
+
+        if progress_callback is not None:
+            progress_callback(stats.total)
+    return stats
+
+
+def csv_to_excel(csv_path, xlsx_path, chunk_size=CHUNK_SIZE):
+    """
+    Convert the scored CSV to Excel chunk by chunk (openpyxl write-only mode)
+
+    Args:
+        csv_path (str): Scored CSV written by score_stream
+        xlsx_path (str): Target .xlsx file
+        chunk_size (int): Rows per chunk
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    for i, chunk in enumerate(iter_chunks(csv_path, chunk_size)):
+        if i == 0:
+            sheet.append(list(chunk.columns))
+        # NaN ditulis sebagai sel kosong (sama seperti DataFrame.to_excel)
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(xlsx_path)
+
+
+def download_plan(n_rows, csv_path, max_bytes=DOWNLOAD_MAX_BYTES, excel_max_rows=EXCEL_DOWNLOAD_MAX_ROWS):
+    """
+    Decide which downloads can be offered for a scored batch. st.download_button
+    holds the whole payload in memory, so large outputs are only kept on disk.
+
+    Args:
+        n_rows (int): Number of scored rows
+        csv_path (str): Scored CSV written by score_stream
+        max_bytes (int): Largest CSV served through the download button
+        excel_max_rows (int): Largest row count converted to Excel
+
+    Returns:
+        tuple: (serve_csv, build_excel)
+    """
+    serve_csv = os.path.getsize(csv_path) <= max_bytes
+    build_excel = serve_csv and n_rows <= min(excel_max_rows, EXCEL_MAX_ROWS)
+    return serve_csv, build_excel
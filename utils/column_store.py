@@ -0,0 +1,259 @@
+"""
+Column Store Module
+Append-only on-disk columnar table (one binary file per column, memory-mapped on read)
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Tipe kolom yang didukung -> dtype file biner
+NUMERIC_KINDS = {'float64': np.float64, 'int64': np.int64, 'int16': np.int16, 'int8': np.int8, 'bool': np.bool_}
+KINDS = set(NUMERIC_KINDS) | {'datetime', 'category', 'string'}
+
+SCHEMA_FILE = 'schema.json'
+
+
+class ColumnStore:
+    """
+    Columnar table on disk:
+    - numeric columns: raw little-endian arrays
+    - datetime: int64 epoch microseconds (UTC; naive columns as wall-clock time) + timezone in schema.json
+    - category: int32 codes + category list kept in schema.json
+    - string: UTF-8 bytes + int64 end offsets + validity mask
+    Rows are appended chunk by chunk; reads memory-map the files, so only
+    the requested columns / rows are paged in.
+    """
+
+    def __init__(self, directory):
+        """
+        Open an existing store
+
+        Args:
+            directory (str): Directory written by create() / close()
+        """
+        self.directory = directory
+        with open(os.path.join(directory, SCHEMA_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        self.schema = meta['schema']
+        self.categories = meta['categories']
+        self.n_rows = meta['n_rows']
+        self.attrs = meta.get('attrs', {})
+        # Store lama tanpa 'timezones' selalu berisi waktu UTC
+        self.timezones = meta.get('timezones', {col: 'UTC' for col, kind in self.schema.items() if kind == 'datetime'})
+        self._writable = False
+
+    @classmethod
+    def create(cls, directory, schema):
+        """
+        Start a new (empty) store for appending
+
+        Args:
+            directory (str): Target directory (created if missing, must be empty)
+            schema (dict): column name -> kind (see KINDS)
+
+        Returns:
+            ColumnStore: Writable store (call close() when done)
+        """
+        unknown = {col: kind for col, kind in schema.items() if kind not in KINDS}
+        if unknown:
+            raise ValueError(f"Unsupported column kinds: {unknown}")
+        os.makedirs(directory, exist_ok=True)
+
+        store = cls.__new__(cls)
+        store.directory = directory
+        store.schema = dict(schema)
+        store.categories = {col: [] for col, kind in schema.items() if kind == 'category'}
+        store.n_rows = 0
+        store.attrs = {}
+        store.timezones = {}
+        store._writable = True
+        store._category_codes = {col: {} for col in store.categories}
+        store._string_offset = {col: 0 for col, kind in schema.items() if kind == 'string'}
+        for col, kind in schema.items():
+            for path in store._paths(col, kind):
+                open(path, 'wb').close()
+        return store
+
+    def _paths(self, col, kind=None):
+        kind = kind or self.schema[col]
+        base = os.path.join(self.directory, col.replace(os.sep, '_'))
+        if kind == 'string':
+            return [f'{base}.data', f'{base}.offsets', f'{base}.valid']
+        return [f'{base}.bin']
+
+    # --- TULIS ---
+    def append(self, frame):
+        """
+        Append a chunk (must contain every schema column)
+
+        Args:
+            frame (pd.DataFrame): Rows to append
+        """
+        if not self._writable:
+            raise RuntimeError("ColumnStore is read-only; use ColumnStore.create() to write")
+        for col, kind in self.schema.items():
+            values = frame[col]
+            paths = self._paths(col, kind)
+            if kind in NUMERIC_KINDS:
+                chunks = [values.to_numpy(dtype=NUMERIC_KINDS[kind])]
+            elif kind == 'datetime':
+                chunks = [self._encode_times(col, values)]
+            elif kind == 'category':
+                chunks = [self._encode_categories(col, values)]
+            else:
+                chunks = self._encode_strings(col, values)
+            for path, chunk in zip(paths, chunks):
+                with open(path, 'ab') as f:
+                    f.write(np.ascontiguousarray(chunk).tobytes())
+        self.n_rows += len(frame)
+
+    def _encode_times(self, col, values):
+        # Zona waktu kolom diambil dari chunk pertama; chunk berikutnya disesuaikan ke zona itu
+        tz = values.dt.tz
+        if col not in self.timezones:
+            self.timezones[col] = None if tz is None else str(tz)
+        if tz is not None and self.timezones[col] is None:
+            values = values.dt.tz_localize(None)
+        elif tz is None and self.timezones[col] is not None:
+            values = values.dt.tz_localize(self.timezones[col])
+        # Nilai tz-aware -> epoch UTC; naive -> jam dinding apa adanya
+        return values.to_numpy(dtype='datetime64[us]').view(np.int64)
+
+    def _encode_categories(self, col, values):
+        # Kamus kategori global bertambah per chunk; kode lama tetap valid
+        mapping = self._category_codes[col]
+        codes, uniques = pd.factorize(values.astype(object))
+        lookup = np.empty(len(uniques), dtype=np.int32)
+        for i, label in enumerate(uniques):
+            label = str(label)
+            if label not in mapping:
+                mapping[label] = len(self.categories[col])
+                self.categories[col].append(label)
+            lookup[i] = mapping[label]
+        result = np.full(len(codes), -1, dtype=np.int32)
+        present = codes >= 0
+        result[present] = lookup[codes[present]]
+        return result
+
+    def _encode_strings(self, col, values):
+        valid = values.notna().to_numpy()
+        encoded = [str(v).encode('utf-8') if ok else b'' for v, ok in zip(values.to_numpy(dtype=object), valid)]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        ends = self._string_offset[col] + np.cumsum(lengths)
+        if len(ends):
+            self._string_offset[col] = int(ends[-1])
+        return [np.frombuffer(b''.join(encoded), dtype=np.uint8), ends, valid.astype(np.uint8)]
+
+    def close(self, attrs=None):
+        """
+        Write schema.json (row count, category lists, attrs); the store is
+        only valid once this file exists
+
+        Args:
+            attrs (dict): JSON-serializable metadata stored with the table
+        """
+        if attrs:
+            self.attrs.update(attrs)
+        self.save_attrs()
+        self._writable = False
+
+    def save_attrs(self):
+        """Rewrite schema.json (e.g. after updating attrs of an existing store)"""
+        meta = {'schema': self.schema, 'categories': self.categories, 'n_rows': self.n_rows,
+                'timezones': self.timezones, 'attrs': self.attrs}
+        with open(os.path.join(self.directory, SCHEMA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    # --- BACA ---
+    def __len__(self):
+        return self.n_rows
+
+    @property
+    def columns(self):
+        return list(self.schema)
+
+    def _map(self, path, dtype):
+        if self.n_rows == 0 or os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r')
+
+    def array(self, name):
+        """
+        Raw memory-mapped array of a numeric column (no copy; pages are read on access)
+
+        Args:
+            name (str): Column name (numeric kind)
+
+        Returns:
+            np.ndarray: Read-only memmap (empty array for an empty store)
+        """
+        kind = self.schema[name]
+        if kind not in NUMERIC_KINDS:
+            raise ValueError(f"Column {name} is not numeric ({kind})")
+        return self._map(self._paths(name, kind)[0], NUMERIC_KINDS[kind])
+
+    def column(self, name, positions=None):
+        """
+        Read one column
+
+        Args:
+            name (str): Column name
+            positions (np.ndarray): Row positions to read (None = all rows)
+
+        Returns:
+            pd.Series: Column values (numeric columns without positions stay memory-mapped)
+        """
+        kind = self.schema[name]
+        index = pd.RangeIndex(self.n_rows) if positions is None else pd.Index(positions)
+        paths = self._paths(name, kind)
+
+        if kind in NUMERIC_KINDS:
+            # copy=False: tanpa positions, Series tetap menunjuk ke memmap (tanpa salinan)
+            values = self.array(name)
+            return pd.Series(values if positions is None else values[positions], index=index, name=name, copy=False)
+
+        if kind == 'datetime':
+            values = self._map(paths[0], np.int64)
+            values = values if positions is None else values[positions]
+            times = pd.Series(np.asarray(values).view('datetime64[us]'), index=index, name=name)
+            tz = self.timezones.get(name)
+            if tz is None:
+                return times
+            times = times.dt.tz_localize('UTC')
+            return times if tz == 'UTC' else times.dt.tz_convert(tz)
+
+        if kind == 'category':
+            codes = self._map(paths[0], np.int32)
+            codes = np.asarray(codes if positions is None else codes[positions])
+            categorical = pd.Categorical.from_codes(codes, categories=self.categories[name])
+            return pd.Series(categorical, index=index, name=name)
+
+        data = self._map(paths[0], np.uint8)
+        ends = self._map(paths[1], np.int64)
+        valid = self._map(paths[2], np.uint8)
+        rows = np.arange(self.n_rows) if positions is None else np.asarray(positions)
+        result = np.empty(len(rows), dtype=object)
+        for i, row in enumerate(rows):
+            if valid[row]:
+                start = ends[row - 1] if row > 0 else 0
+                result[i] = bytes(data[start:ends[row]]).decode('utf-8')
+            else:
+                result[i] = np.nan
+        return pd.Series(result, index=index, name=name)
+
+    def frame(self, columns=None, positions=None):
+        """
+        Read several columns into a DataFrame
+
+        Args:
+            columns (list): Column names (None = all)
+            positions (np.ndarray): Row positions (None = all rows)
+
+        Returns:
+            pd.DataFrame: Index = row positions
+        """
+        columns = self.columns if columns is None else [c for c in columns if c in self.schema]
+        index = pd.RangeIndex(self.n_rows) if positions is None else pd.Index(positions)
+        return pd.DataFrame({col: self.column(col, positions) for col in columns}, index=index)
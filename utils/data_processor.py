@@ -8,6 +8,105 @@ import numpy as np
 from datetime import datetime
 import re
 import os
+import json
+import hashlib
+import calendar
+import shutil
+
+from utils.keyword_matcher import KeywordMatcher, get_classification_cache
+from utils.olap_cube import OlapCube, RunningMoments
+from utils.column_store import ColumnStore
+from utils.row_index import RowIndex
+from utils.feature_pipeline import FeaturePipeline
+from utils.lazy_frame import LazyFrame
+from utils.timestamp_parser import parse_iso_timestamps, epoch_parts, first_timestamp
+
+# Versi format snapshot. Naikkan angka ini setiap kali logika turunan kolom berubah
+# agar snapshot lama otomatis dianggap basi.
+SNAPSHOT_VERSION = 6
+
+# Tipe audio yang dikenal model (kolom one-hot Audio_*)
+AUDIO_TYPES = ['Audio Original', 'Audio Populer', 'Audio Lainnya', 'Tanpa Audio']
+
+# Bucket durasi (detik) default untuk simulasi what-if
+WHAT_IF_DURATIONS = [15, 30, 60, 90, 180]
+
+# --- SKEMA TIPE DATA (HEMAT MEMORI) ---
+DAY_NAMES = list(calendar.day_name)          # Monday ... Sunday
+MONTH_NAMES = list(calendar.month_name)[1:]  # January ... December
+HARI_INDO = dict(zip(DAY_NAMES, ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']))
+
+# Kolom hitungan -> lebar integer tetap (tidak ditebak dari data, agar append_rows / concat
+# tidak overflow atau berubah tipe diam-diam). playCount bisa melewati 2^31 -> int64.
+# Kolom berisi nilai pecahan atau di luar rentang tipe disimpan float64 (tanpa kehilangan presisi).
+COUNT_DTYPES = {
+    'diggCount': np.int32, 'commentCount': np.int32, 'shareCount': np.int32,
+    'playCount': np.int64, 'videoMeta.duration': np.int32,
+}
+
+# Kolom kecil (jam, hari, flag) dengan tipe tetap
+SMALL_INT_COLUMNS = {'upload_hour': np.int8, 'Is_Weekend': np.int8, 'upload_year': np.int16}
+
+
+def _upload_date(df):
+    """Tanggal upload (objek datetime.date) dari createTimeISO"""
+    return df['createTimeISO'].dt.date
+
+# Kolom lazy self.df: alias -> nama kolom sumber, turunan -> fungsi(frame).
+# Tidak disimpan; baru dihitung saat dibaca lewat df[nama] (lihat LazyFrame)
+LAZY_COLUMNS = {
+    'Waktu_Posting': 'createTimeISO',
+    'Jam_Posting': 'upload_hour',
+    'Hari_Posting': 'upload_day_english',
+    'Kategori_Konten': 'content_type',
+    'Tipe_Audio': 'audio_type',
+    'upload_date': _upload_date,
+}
+
+# --- PROYEKSI KOLOM ---
+# Kolom mentah yang tidak dipakai fitur, cube maupun panel mana pun (avatar = URL CDN panjang,
+# lebih dari separuh isi CSV): dilewati saat load_data, dibaca dari CSV lewat with_details()
+DETAIL_COLUMNS = [
+    'authorMeta.avatar', 'authorMeta.nickName', 'authorMeta.verified', 'musicMeta.musicAuthor',
+    'collectCount', 'videoMeta.height', 'videoMeta.width', 'id'
+]
+
+# Kolom olahan yang dibutuhkan tiap konsumen (filter_frame / get_projection)
+# Leaderboard & panel agregat Dashboard dilayani cube, tanpa membaca baris
+PROJECTIONS = {
+    'dashboard': ['authorMeta.name', 'createTimeISO', 'playCount', 'diggCount', 'commentCount', 'shareCount',
+                  'videoMeta.duration', 'engagement_rate'],
+    'reference': ['playCount', 'diggCount', 'commentCount', 'shareCount', 'videoMeta.duration'],
+}
+
+# --- MODE STREAMING (DATASET LEBIH BESAR DARI RAM) ---
+# CSV sebesar ini atau lebih otomatis dibaca per chunk ke column store di disk
+STREAMING_MIN_BYTES = 512 * 1024 * 1024
+STREAM_CHUNK_SIZE = 100_000
+STORE_VERSION = 2
+
+# Kolom mentah yang dibaca saat streaming (skema column store tetap; DETAIL_COLUMNS ikut dilewati)
+STREAM_USECOLS = [
+    'authorMeta.name', 'text', 'diggCount', 'shareCount', 'playCount', 'commentCount',
+    'videoMeta.duration', 'musicMeta.musicName', 'musicMeta.musicOriginal', 'createTimeISO', 'webVideoUrl'
+]
+
+# Kolom olahan yang disimpan di column store -> tipe penyimpanan (lihat ColumnStore)
+STORE_SCHEMA = {
+    'authorMeta.name': 'category', 'text': 'string', 'webVideoUrl': 'string', 'musicMeta.musicName': 'string',
+    'diggCount': 'float64', 'commentCount': 'float64', 'shareCount': 'float64', 'playCount': 'float64',
+    'videoMeta.duration': 'float64', 'engagement_rate': 'float64', 'createTimeISO': 'datetime',
+    'upload_hour': 'int8', 'upload_day': 'category', 'upload_day_english': 'category', 'upload_year': 'int16',
+    'upload_month': 'category', 'Is_Weekend': 'int8', 'content_type': 'category', 'audio_type': 'category',
+}
+
+# Panel baris Dashboard (get_dashboard_panels): titik tren per video maksimal sebanyak ini,
+# di atasnya tren dibaca dari cube (total tayangan harian)
+TIMELINE_MAX_POINTS = 5_000
+HISTOGRAM_BINS = 30
+
+# Metrik matriks korelasi (get_correlation_matrix)
+CORRELATION_COLUMNS = ['playCount', 'diggCount', 'commentCount', 'shareCount', 'videoMeta.duration', 'engagement_rate']
 
 class DataProcessor:
     """Handle data loading and preprocessing"""
@@ -17,11 +116,31 @@ class DataProcessor:
         current_file_dir = os.path.dirname(os.path.abspath(__file__))
         root_project_dir = os.path.dirname(current_file_dir)
         self.data_path = os.path.join(root_project_dir, 'data', 'dataset_tiktok.csv')
+        # Snapshot biner hasil load_data (disimpan di samping dataset)
+        self.snapshot_dir = os.path.join(root_project_dir, 'data', '.cache')
         
         print(f"🔗 [SYSTEM PATH] Menggunakan file: {self.data_path}")
         
         self.df = None
         self.list_audio_populer = [] 
+        self._keyword_matcher = None
+        self._keyword_matcher_fingerprint = None
+        self._kamus_shape = None            # (id kamus, (kategori, id daftar, panjang)...) saat sidik jari dihitung
+        self._kamus_fingerprint_value = None
+        self._audio_counts = None   # hitungan musicMeta.musicName, urutan kemunculan (untuk Top 20 inkremental)
+        self._source_stat = None    # (ukuran, mtime) CSV saat self.df dibangun
+        self.data_version = 0       # Naik setiap kali self.df diganti / ditambah
+        self._cube = None
+        self._cube_version = -1
+        self._row_index = None
+        self._feature_pipelines = {}  # FeaturePipeline per daftar kolom output
+        self._row_index_version = -1
+        self.store = None           # ColumnStore (mode streaming); self.df = None selama mode ini aktif
+        self._moments = None        # RunningMoments korelasi (mode streaming)
+        # Cache klasifikasi caption (LRU, dibagi antar instance & disimpan ke disk)
+        self.classification_cache = get_classification_cache(
+            persist_path=os.path.join(self.snapshot_dir, 'classification_cache.pkl')
+        )
 
         # --- KAMUS KATEGORI LENGKAP (DARI NOTEBOOK ANDA) ---
         # Kita pakai ini agar akurasi tetap tinggi tanpa NLTK
@@ -127,95 +246,592 @@ class DataProcessor:
             ]
         }
 
-    def load_data(self):
-        """Membaca data dari CSV dengan AMAN (Tanpa Drop Baris)."""
+    # Objek ikut di-pickle oleh st.cache_data: cache klasifikasi (singleton, ber-lock) tidak ikut
+    # diserialisasi, tetapi disambungkan kembali ke cache bersama saat unpickle
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('classification_cache', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.classification_cache = get_classification_cache(
+            persist_path=os.path.join(self.snapshot_dir, 'classification_cache.pkl')
+        )
+
+    def load_data(self, use_snapshot=True, streaming=None):
+        """Membaca data dari CSV dengan AMAN (Tanpa Drop Baris).
+
+        Jika sumber CSV tidak berubah (ukuran, mtime & hash konten sama),
+        hasil olahan dibaca langsung dari snapshot biner tanpa parsing ulang.
+
+        Args:
+            use_snapshot (bool): Pakai snapshot / column store yang masih valid
+            streaming (bool): True = mode streaming (load_streaming), False = seluruh
+                data di memori, None = otomatis streaming jika CSV >= STREAMING_MIN_BYTES
+
+        Returns:
+            pd.DataFrame (mode biasa), ColumnStore (mode streaming), atau None jika gagal
+        """
         try:
             if not os.path.exists(self.data_path):
                 print(f"❌ Error: File tidak ditemukan di {self.data_path}")
                 return None
 
-            # 1. BACA CSV
-            df = pd.read_csv(self.data_path, on_bad_lines='skip')
+            if streaming is None:
+                streaming = os.path.getsize(self.data_path) >= STREAMING_MIN_BYTES
+            if streaming:
+                return self.load_streaming(use_store=use_snapshot)
+
+            # 0a. DATA DI MEMORI MASIH SESUAI FILE (mis. setelah append_rows)
+            if use_snapshot and self.df is not None and self._source_stat == self._current_source_stat():
+                return self.df
+
+            # 0b. SNAPSHOT (Jalur Cepat)
+            if use_snapshot:
+                snapshot_df = self._load_snapshot()
+                if snapshot_df is not None:
+                    self.df = LazyFrame.wrap(snapshot_df, LAZY_COLUMNS)
+                    self.store = None
+                    self.data_version += 1
+                    self._audio_counts = None
+                    self._source_stat = self._current_source_stat()
+                    print(f"⚡ [SNAPSHOT] Data dimuat dari cache: {len(self.df)} baris.")
+                    return self.df
+
+            source_stat = self._current_source_stat()
+
+            # 1. BACA CSV (tanpa DETAIL_COLUMNS)
+            df = pd.read_csv(self.data_path, usecols=lambda col: col not in DETAIL_COLUMNS, on_bad_lines='skip')
             print(f"📊 [DEBUG] Membaca {len(df)} baris dari CSV.")
 
-            # 2. BERSIHKAN ANGKA
-            numeric_cols = ['diggCount', 'commentCount', 'shareCount', 'playCount', 'videoMeta.duration']
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                else:
-                    df[col] = 0
-
-            # 3. ENGAGEMENT
-            df['engagement_rate'] = (
-                (df['diggCount'] + df['commentCount'] + df['shareCount']) /
-                df['playCount'].replace(0, 1)
-            ) * 100
-
-            # 4. WAKTU (FIX: JANGAN DROP)
-            df['createTimeISO'] = pd.to_datetime(df['createTimeISO'], dayfirst=False, errors='coerce')
-            mask_rusak = df['createTimeISO'].isna()
-            if mask_rusak.any():
-                df.loc[mask_rusak, 'createTimeISO'] = pd.Timestamp.now()
-
-            df['Waktu_Posting'] = df['createTimeISO']
-            df['upload_date'] = df['createTimeISO'].dt.date
-            df['upload_hour'] = df['createTimeISO'].dt.hour
-            df['Jam_Posting'] = df['createTimeISO'].dt.hour 
-            
-            df['upload_day_english'] = df['createTimeISO'].dt.day_name()
-            df['upload_day'] = df['upload_day_english'].map({
-                'Monday': 'Senin', 'Tuesday': 'Selasa', 'Wednesday': 'Rabu',
-                'Thursday': 'Kamis', 'Friday': 'Jumat', 'Saturday': 'Sabtu', 'Sunday': 'Minggu'
-            })
-            df['Hari_Posting'] = df['upload_day_english'] 
-            df['upload_year'] = df['createTimeISO'].dt.year
-            df['upload_month'] = df['createTimeISO'].dt.month_name()
-            df['Is_Weekend'] = df['Hari_Posting'].apply(lambda x: 1 if x in ['Saturday', 'Sunday'] else 0)
-            
-            # 5. NLP KATEGORI (VERSI RINGAN & CEPAT)
-            # Tanpa NLTK, tapi menggunakan KAMUS LENGKAP NOTEBOOK Anda
-            df['content_type'] = df['text'].apply(self._classify_content_logic)
-            df['Kategori_Konten'] = df['content_type']
-
-            # 6. AUDIO
+            # 6a. AUDIO POPULER (Top 20, dihitung dari seluruh data)
             if 'musicMeta.musicName' in df.columns:
-                self.list_audio_populer = df['musicMeta.musicName'].value_counts().head(20).index.tolist()
-            
-            df['audio_type'] = df.apply(self._classify_audio_logic, axis=1)
-            df['Tipe_Audio'] = df['audio_type']
+                self._audio_counts = df['musicMeta.musicName'].value_counts(sort=False)
+                self.list_audio_populer = self._top_audio()
+
+            df = self._derive_features(df)
 
             self.df = df
+            self.store = None
+            self.data_version += 1
+            self._source_stat = source_stat
             print(f"✅ [SUCCESS] Data siap: {len(self.df)} baris.")
+
+            if use_snapshot:
+                self._save_snapshot(df)
             return self.df
 
         except Exception as e:
             print(f"❌ Error loading data: {str(e)}")
             self.df = None
             return None
+
+    def _derive_features(self, df, time_reference=None):
+        """Turunkan kolom olahan untuk baris mentah (list_audio_populer harus sudah siap).
+
+        Args:
+            df (pd.DataFrame): Baris mentah
+            time_reference (object): createTimeISO acuan seluruh file jika df hanya sebagian
+                baris (lihat first_timestamp); None = df adalah seluruh data
+        """
+        # 2. BERSIHKAN ANGKA
+        numeric_cols = ['diggCount', 'commentCount', 'shareCount', 'playCount', 'videoMeta.duration']
+        for col in numeric_cols:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+            else:
+                df[col] = 0
+
+        # 3. ENGAGEMENT
+        df['engagement_rate'] = (
+            (df['diggCount'] + df['commentCount'] + df['shareCount']) /
+            df['playCount'].replace(0, 1)
+        ) * 100
+
+        # 4. WAKTU (FIX: JANGAN DROP)
+        # Jalur cepat format scraper; kolom dengan format lain memakai parser bawaan pandas
+        times, n_fallback = parse_iso_timestamps(df['createTimeISO'], reference=time_reference)
+        mask_rusak = times.isna()
+        if mask_rusak.any():
+            # Waktu sekarang dalam zona kolom (naive = jam lokal, seperti pd.Timestamp.now())
+            times = times.copy()
+            times[mask_rusak] = pd.Timestamp.now(tz=times.dt.tz)
+        if n_fallback:
+            print(f"⚠️ [WAKTU] {n_fallback} baris di luar format scraper, {int(mask_rusak.sum())} tidak terbaca.")
+        df['createTimeISO'] = times
+
+        # Jam/hari/tahun/bulan dari aritmetika epoch int64; nama hari & bulan = lookup kategori kecil
+        # (Waktu_Posting, upload_date, Jam_Posting & Hari_Posting: kolom lazy, lihat LAZY_COLUMNS)
+        parts = epoch_parts(times)
+        df['upload_hour'] = parts['hour']
+        df['upload_day_english'] = pd.Categorical.from_codes(parts['weekday'], categories=DAY_NAMES)
+        df['upload_day'] = pd.Categorical.from_codes(parts['weekday'], categories=list(HARI_INDO.values()))
+        df['upload_year'] = parts['year']
+        df['upload_month'] = pd.Categorical.from_codes(parts['month'] - 1, categories=MONTH_NAMES)
+        df['Is_Weekend'] = (parts['weekday'] >= 5).astype(np.int8)
         
-    # --- LOGIKA KLASIFIKASI RINGAN (SUBSTRING MATCHING) ---
+        # 5. NLP KATEGORI (VERSI RINGAN & CEPAT)
+        # Tanpa NLTK, tapi menggunakan KAMUS LENGKAP NOTEBOOK Anda
+        df['content_type'] = self.classify_content_series(df['text'])
+
+        # 6b. AUDIO
+        df['audio_type'] = self.classify_audio_series(df)
+        return self._apply_schema(df)
+
+    def _apply_schema(self, df):
+        """
+        Ubah frame olahan ke skema ringkas: label -> category, hitungan -> integer
+        selebar COUNT_DTYPES, jam/hari/flag -> int8; alias & kolom turunan disajikan lazy.
+        """
+        fixed_categories = {
+            'content_type': list(self.KAMUS_KATEGORI.keys()),
+            'audio_type': AUDIO_TYPES,
+            'upload_day': list(HARI_INDO.values()),
+            'upload_day_english': DAY_NAMES,
+            'upload_month': MONTH_NAMES,
+            'authorMeta.name': [],
+        }
+        for col, categories in fixed_categories.items():
+            if col not in df.columns:
+                continue
+            values = df[col]
+            observed = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique()
+            # Label di luar daftar tetap (mis. nama kreator) ditambahkan terurut di belakang
+            extra = sorted(set(observed) - set(categories), key=str)
+            df[col] = values.astype(pd.CategoricalDtype(list(categories) + extra))
+
+        for col, dtype in COUNT_DTYPES.items():
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col].dtype):
+                df[col] = self._count_column(df[col], dtype)
+
+        for col, dtype in SMALL_INT_COLUMNS.items():
+            if col in df.columns:
+                df[col] = df[col].astype(dtype)
+        return LazyFrame.wrap(df, LAZY_COLUMNS)
+
+    @staticmethod
+    def _count_column(values, dtype):
+        """Kolom hitungan dalam tipe tetap; float64 jika ada nilai pecahan / di luar rentang dtype."""
+        if values.dtype == dtype:
+            return values
+        numbers = values.to_numpy(dtype=np.float64)
+        limits = np.iinfo(dtype)
+        if np.isfinite(numbers).all() and (numbers == np.round(numbers)).all() \
+                and (numbers >= limits.min).all() and (numbers <= limits.max).all():
+            return values.astype(dtype)
+        return values.astype(np.float64)
+
+    def _merge_audio_counts(self, music_names):
+        """Tambahkan hitungan lagu dari baris baru (urutan kemunculan pertama tetap terjaga)."""
+        counts = music_names.value_counts(sort=False)
+        if self._audio_counts is None:
+            self._audio_counts = counts
+            return
+        self._audio_counts = pd.concat([self._audio_counts, counts]).groupby(level=0, sort=False).sum()
+
+    def _top_audio(self, n=20):
+        """Top n lagu; seri diurutkan sesuai kemunculan pertama (sama dengan value_counts penuh)."""
+        return self._audio_counts.sort_values(ascending=False, kind='stable').head(n).index.tolist()
+
+    def _time_reference(self):
+        """createTimeISO pertama di CSV (acuan format waktu untuk baris tambahan)"""
+        if not os.path.exists(self.data_path):
+            return None
+        try:
+            with pd.read_csv(self.data_path, usecols=['createTimeISO'], chunksize=STREAM_CHUNK_SIZE,
+                             on_bad_lines='skip') as reader:
+                for chunk in reader:
+                    reference = first_timestamp(chunk['createTimeISO'])
+                    if reference is not None:
+                        return reference
+        except ValueError:
+            pass  # kolom createTimeISO tidak ada
+        return None
+
+    def _current_source_stat(self):
+        stat = os.stat(self.data_path)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    # --- UPDATE INKREMENTAL (SETELAH INPUT DATA BARU) ---
+    def append_rows(self, rows, source_synced=True):
+        """
+        Tambahkan baris baru ke self.df tanpa memproses ulang seluruh dataset.
+
+        Args:
+            rows (list[dict] | pd.DataFrame): Baris mentah (format kolom dataset_tiktok.csv)
+            source_synced (bool): True jika baris yang sama sudah ditulis ke CSV,
+                sehingga data di memori dianggap sinkron dengan file.
+
+        Returns:
+            pd.DataFrame: self.df yang sudah diperbarui (None jika gagal)
+        """
+        try:
+            if self.df is None:
+                # Belum dimuat / mode streaming: CSV (sudah berisi baris baru) dimuat ulang
+                return self.load_data()
+
+            new_df = rows.copy() if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+            if new_df.empty:
+                return self.df
+            new_df = new_df.drop(columns=DETAIL_COLUMNS, errors='ignore')  # dibaca dari CSV bila perlu
+            if 'text' not in new_df.columns:
+                new_df['text'] = np.nan
+
+            # Perbarui hitungan audio & Top 20 secara inkremental
+            music_col = 'musicMeta.musicName'
+            old_populer = list(self.list_audio_populer)
+            if music_col in new_df.columns and music_col in self.df.columns:
+                if self._audio_counts is None:
+                    self._audio_counts = self.df[music_col].value_counts(sort=False)
+                self._merge_audio_counts(new_df[music_col])
+                self.list_audio_populer = self._top_audio()
+
+            new_df = self._derive_features(new_df, time_reference=self._time_reference())
+            start = len(self.df)
+            new_df.index = pd.RangeIndex(start, start + len(new_df))
+            # Skema diterapkan ulang: kategori baru (mis. kreator baru) & lebar integer digabung
+            self.df = self._apply_schema(pd.concat([self.df, new_df], ignore_index=True))
+
+            # Cube agregat: gabungkan cube baris baru ke cube lama (tanpa agregasi ulang)
+            cube_current = self._cube is not None and self._cube_version == self.data_version
+            self.data_version += 1
+            if cube_current:
+                self._cube = self._cube.merge(OlapCube.from_frame(new_df))
+                self._cube_version = self.data_version
+
+            # Lagu yang masuk/keluar Top 20 -> klasifikasi ulang hanya baris lagu tersebut
+            changed = {x for x in set(old_populer) ^ set(self.list_audio_populer) if isinstance(x, str)}
+            if changed:
+                mask = self.df[music_col].astype(str).isin(changed).to_numpy().copy()
+                mask[start:] = False
+                if mask.any():
+                    labels = self.classify_audio_series(self.df.loc[mask])
+                    self.df.loc[mask, 'audio_type'] = labels
+                    self._cube = None  # audio_type baris lama berubah -> cube dibangun ulang
+
+            if source_synced:
+                self._source_stat = self._current_source_stat()
+            else:
+                # Baris hanya ada di memori: load_data berikutnya membaca ulang file
+                self._source_stat = None
+            print(f"➕ [APPEND] {len(new_df)} baris ditambahkan. Total: {len(self.df)} baris.")
+            return self.df
+
+        except Exception as e:
+            print(f"❌ Error appending data: {str(e)}")
+            return None
+
+    # --- SNAPSHOT BINER (CACHE HASIL LOAD_DATA) ---
+    def _kamus_fingerprint(self):
+        """
+        Sidik jari KAMUS_KATEGORI. Hash (json + SHA-1) hanya dihitung ulang jika kamus diganti,
+        atau daftar keyword suatu kategori diganti / bertambah / berkurang; cek ini murah
+        sehingga aman dipanggil per caption.
+        """
+        kamus = self.KAMUS_KATEGORI
+        shape = (id(kamus), tuple((k, id(v), len(v)) for k, v in kamus.items()))
+        if shape != self._kamus_shape:
+            payload = json.dumps(kamus, sort_keys=True, ensure_ascii=False)
+            self._kamus_fingerprint_value = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+            self._kamus_shape = shape
+        return self._kamus_fingerprint_value
+
+    def _hash_source(self):
+        """Hash konten CSV (dibaca per blok agar hemat memori)."""
+        digest = hashlib.sha1()
+        with open(self.data_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _source_stamp(self, version):
+        """Identitas CSV + kamus saat ini (disimpan bersama snapshot / column store)."""
+        stat = os.stat(self.data_path)
+        return {
+            'version': version,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha1': self._hash_source(),
+            'kamus': self._kamus_fingerprint(),
+        }
+
+    def _stamp_is_current(self, stamp, version):
+        """
+        True jika stamp masih sesuai CSV & kamus. Jika hanya mtime yang berubah
+        (isi sama), stamp['mtime_ns'] diperbarui; pemanggil menyimpannya kembali.
+        """
+        if stamp.get('version') != version or stamp.get('kamus') != self._kamus_fingerprint():
+            return False
+
+        stat = os.stat(self.data_path)
+        if stamp.get('size') != stat.st_size:
+            return False
+        if stamp.get('mtime_ns') != stat.st_mtime_ns:
+            # mtime berubah (mis. file di-touch): cek ulang isi sebelum menolak
+            if stamp.get('sha1') != self._hash_source():
+                return False
+            stamp['mtime_ns'] = stat.st_mtime_ns
+        return True
+
+    def _snapshot_paths(self):
+        base = os.path.splitext(os.path.basename(self.data_path))[0]
+        meta_path = os.path.join(self.snapshot_dir, f"{base}.meta.json")
+        return meta_path, os.path.join(self.snapshot_dir, base)
+
+    def _load_snapshot(self):
+        """Kembalikan DataFrame dari snapshot jika masih valid, selain itu None."""
+        meta_path, data_base = self._snapshot_paths()
+        try:
+            if not os.path.exists(meta_path):
+                return None
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+            mtime_ns = meta.get('mtime_ns')
+            if not self._stamp_is_current(meta, SNAPSHOT_VERSION):
+                return None
+            if meta['mtime_ns'] != mtime_ns:
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+
+            data_path = f"{data_base}.{meta['format']}"
+            if meta['format'] == 'parquet':
+                df = pd.read_parquet(data_path)
+            else:
+                df = pd.read_pickle(data_path)
+
+            self.list_audio_populer = meta.get('list_audio_populer', [])
+            return df
+        except Exception as e:
+            print(f"⚠️ [SNAPSHOT] Snapshot tidak dapat dibaca, membaca ulang CSV: {str(e)}")
+            return None
+
+    def _save_snapshot(self, df):
+        """Simpan hasil olahan sebagai snapshot biner (Parquet jika tersedia, jika tidak Pickle)."""
+        meta_path, data_base = self._snapshot_paths()
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            meta = self._source_stamp(SNAPSHOT_VERSION)
+            meta['list_audio_populer'] = [str(x) for x in self.list_audio_populer]
+            # Snapshot hanya berisi kolom tersimpan (kolom lazy dihitung ulang saat dibaca)
+            df = pd.DataFrame(df)
+            try:
+                df.to_parquet(f"{data_base}.parquet", index=False)
+                meta['format'] = 'parquet'
+            except Exception:
+                # pyarrow/fastparquet tidak terpasang atau tipe kolom tidak didukung
+                df.to_pickle(f"{data_base}.pkl")
+                meta['format'] = 'pkl'
+
+            # Meta ditulis terakhir: snapshot hanya valid jika datanya sudah lengkap
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except Exception as e:
+            print(f"⚠️ [SNAPSHOT] Gagal menyimpan snapshot: {str(e)}")
+        
+    # --- MODE STREAMING (COLUMN STORE DI DISK) ---
+    def _store_dir(self):
+        base = os.path.splitext(os.path.basename(self.data_path))[0]
+        return os.path.join(self.snapshot_dir, f"{base}.store")
+
+    def load_streaming(self, chunk_size=STREAM_CHUNK_SIZE, use_store=True):
+        """
+        Mode streaming untuk dataset yang lebih besar dari RAM: CSV dibaca per chunk
+        (hanya STREAM_USECOLS), fitur diturunkan per chunk lalu dimasukkan ke cube
+        agregat, akumulator korelasi & column store di disk. self.df tidak dibangun;
+        baris dibaca sesuai kebutuhan lewat filter_frame / get_column / get_top_videos.
+
+        Args:
+            chunk_size (int): Baris per chunk
+            use_store (bool): Pakai column store yang masih valid tanpa membaca ulang CSV
+
+        Returns:
+            ColumnStore: Store hasil olahan (None jika gagal)
+        """
+        try:
+            store_dir = self._store_dir()
+            if use_store and self.store is not None and self._source_stat == self._current_source_stat():
+                return self.store
+            if use_store:
+                store = self._open_store(store_dir)
+                if store is not None:
+                    self._activate_store(store)
+                    print(f"⚡ [STORE] Data dimuat dari column store: {len(store)} baris.")
+                    return self.store
+
+            source_stat = self._current_source_stat()
+            header = pd.read_csv(self.data_path, nrows=0).columns
+            usecols = [col for col in STREAM_USECOLS if col in header]
+
+            # Lintasan 1: hitungan lagu (Top 20 audio populer dihitung dari seluruh data)
+            self._audio_counts = None
+            self.list_audio_populer = []
+            if 'musicMeta.musicName' in usecols:
+                with pd.read_csv(self.data_path, usecols=['musicMeta.musicName'], chunksize=chunk_size,
+                                 on_bad_lines='skip') as reader:
+                    for chunk in reader:
+                        self._merge_audio_counts(chunk['musicMeta.musicName'])
+                self.list_audio_populer = self._top_audio()
+
+            # Lintasan 2: fitur per chunk -> cube, akumulator korelasi, column store (folder sementara)
+            tmp_dir = f"{store_dir}.tmp-{os.getpid()}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            store, cube = None, None
+            moments = RunningMoments(CORRELATION_COLUMNS)
+            time_reference = None
+            with pd.read_csv(self.data_path, usecols=usecols, chunksize=chunk_size, on_bad_lines='skip') as reader:
+                for chunk in reader:
+                    if time_reference is None and 'createTimeISO' in chunk.columns:
+                        time_reference = first_timestamp(chunk['createTimeISO'])
+                    chunk = self._derive_features(chunk, time_reference=time_reference)
+                    if store is None:
+                        schema = {col: kind for col, kind in STORE_SCHEMA.items() if col in chunk.columns}
+                        store = ColumnStore.create(tmp_dir, schema)
+                    store.append(chunk)
+                    chunk_cube = OlapCube.from_frame(chunk)
+                    cube = chunk_cube if cube is None else cube.merge(chunk_cube)
+                    moments.update(chunk)
+                    print(f"📊 [STREAM] {len(store)} baris diproses.")
+            if store is None:
+                raise ValueError("CSV tidak berisi baris data")
+
+            # schema.json ditulis terakhir (close): store hanya valid jika semua file lengkap
+            cube.cells.to_pickle(os.path.join(tmp_dir, 'cube.pkl'))
+            stamp = self._source_stamp(STORE_VERSION)
+            store.close(attrs={
+                'stamp': stamp,
+                'list_audio_populer': [str(x) for x in self.list_audio_populer],
+                'moments': moments.to_dict(),
+            })
+            shutil.rmtree(store_dir, ignore_errors=True)
+            os.replace(tmp_dir, store_dir)
+
+            self._activate_store(ColumnStore(store_dir), cube=cube, moments=moments)
+            self._source_stat = source_stat
+            print(f"✅ [SUCCESS] Column store siap: {len(self.store)} baris.")
+            return self.store
+
+        except Exception as e:
+            print(f"❌ Error streaming data: {str(e)}")
+            self.store = None
+            return None
+
+    def _open_store(self, store_dir):
+        """Column store di disk jika masih sesuai CSV & kamus, selain itu None."""
+        try:
+            if not os.path.exists(os.path.join(store_dir, 'schema.json')):
+                return None
+            store = ColumnStore(store_dir)
+            stamp = store.attrs.get('stamp', {})
+            mtime_ns = stamp.get('mtime_ns')
+            if not self._stamp_is_current(stamp, STORE_VERSION):
+                return None
+            if stamp['mtime_ns'] != mtime_ns:
+                store.save_attrs()
+            return store
+        except Exception as e:
+            print(f"⚠️ [STORE] Column store tidak dapat dibaca, membaca ulang CSV: {str(e)}")
+            return None
+
+    def _activate_store(self, store, cube=None, moments=None):
+        """Jadikan column store sumber data aktif (cube & korelasi dari store jika tidak diberikan)."""
+        self.store = store
+        self.df = None
+        self.data_version += 1
+        self.list_audio_populer = store.attrs.get('list_audio_populer', self.list_audio_populer)
+        if cube is None:
+            cube = OlapCube(pd.read_pickle(os.path.join(store.directory, 'cube.pkl')))
+        self._cube = cube
+        self._cube_version = self.data_version
+        self._moments = moments if moments is not None else RunningMoments.from_dict(store.attrs['moments'])
+        self._source_stat = self._current_source_stat()
+
+    def _frame_from_store(self, positions=None, columns=None):
+        """Baris column store sebagai frame olahan (skema & kolom lazy sama dengan mode biasa)."""
+        return self._apply_schema(self.store.frame(columns=columns, positions=positions))
+
+    # --- AKSES DATA (MODE BIASA & STREAMING) ---
+    def has_data(self):
+        """True jika ada baris olahan (di memori atau di column store)."""
+        if self.store is not None:
+            return len(self.store) > 0
+        return self.df is not None and not self.df.empty
+
+    def row_count(self):
+        """Jumlah baris olahan."""
+        if self.store is not None:
+            return len(self.store)
+        return 0 if self.df is None else len(self.df)
+
+    def get_column(self, name):
+        """Satu kolom olahan (mode streaming: dibaca dari column store, kolom numerik tetap memory-mapped)."""
+        if self.store is not None:
+            return self.store.column(name)
+        if self.df is None:
+            return pd.Series(dtype=np.float64, name=name)
+        return self.df[name]
+
+    # --- LOGIKA KLASIFIKASI RINGAN (AHO-CORASICK) ---
+    def _get_keyword_matcher(self, fingerprint=None):
+        """Automaton dibangun sekali dari KAMUS_KATEGORI (dibangun ulang jika kamus diedit)."""
+        if fingerprint is None:
+            fingerprint = self._kamus_fingerprint()
+        if self._keyword_matcher is None or self._keyword_matcher_fingerprint != fingerprint:
+            self._keyword_matcher = KeywordMatcher(self.KAMUS_KATEGORI, default_category='Hiburan')
+            self._keyword_matcher_fingerprint = fingerprint
+        return self._keyword_matcher
+
     def _classify_content_logic(self, text):
         if pd.isna(text): return 'Hiburan' # Default aman
         text_lower = str(text).lower()
+
+        # Cek cache dulu (caption yang sama sering muncul ulang: repost, duet, dll)
+        fingerprint = self._kamus_fingerprint()
+        cached = self.classification_cache.get(text_lower, fingerprint)
+        if cached is not None:
+            return cached
         
-        # Scoring Sederhana (Siapa yang paling banyak cocok)
-        scores = {k: 0 for k in self.KAMUS_KATEGORI}
-        
-        for kategori, keywords in self.KAMUS_KATEGORI.items():
-            for keyword in keywords:
-                # Cek apakah keyword ada di dalam teks (Cepat & Efisien)
-                if keyword in text_lower:
-                    scores[kategori] += 1
-        
-        # Ambil skor tertinggi
-        best_category = max(scores, key=scores.get)
-        
-        # Jika tidak ada yang cocok (skor 0), kembalikan 'Hiburan'
-        if scores[best_category] == 0:
-            return 'Hiburan'
-        else:
-            return best_category
+        # Scoring Sederhana (Siapa yang paling banyak cocok) dalam satu kali scan teks.
+        # Hasil identik dengan cek `keyword in text_lower` per keyword, termasuk
+        # tie-break max() (kategori pertama menang) & fallback 'Hiburan' saat skor 0.
+        category = self._get_keyword_matcher(fingerprint).classify(text_lower)
+        self.classification_cache.put(text_lower, fingerprint, category)
+        return category
+
+    def classify_content_series(self, texts):
+        """Klasifikasi satu kolom caption sekaligus (matriks hit sparse x matriks kategori)."""
+        texts = pd.Series(texts)
+        result = np.full(len(texts), 'Hiburan', dtype=object)
+        missing = texts.isna().to_numpy()
+        if missing.all():
+            return pd.Series(result, index=texts.index)
+
+        # Caption unik saja yang diproses; sisanya diambil dari cache
+        lowered = texts[~missing].astype(str).str.lower()
+        codes, uniques = pd.factorize(lowered)
+        fingerprint = self._kamus_fingerprint()
+        cache = self.classification_cache
+
+        unique_labels = np.empty(len(uniques), dtype=object)
+        miss_idx = []
+        for i, text_lower in enumerate(uniques):
+            label = cache.get(text_lower, fingerprint)
+            if label is None:
+                miss_idx.append(i)
+            else:
+                unique_labels[i] = label
+
+        if miss_idx:
+            miss_texts = pd.Series(uniques[miss_idx])
+            miss_labels = self._get_keyword_matcher(fingerprint).classify_series(miss_texts)
+            unique_labels[miss_idx] = miss_labels
+            for text_lower, label in zip(miss_texts, miss_labels):
+                cache.put(text_lower, fingerprint, label)
+            cache.save()  # dibatasi save_interval; sisanya ditulis saat exit
+
+        result[~missing] = unique_labels[codes]
+        return pd.Series(result, index=texts.index)
 
     # --- AUDIO METHOD ---
     def _classify_audio_logic(self, row):
@@ -234,15 +850,175 @@ class DataProcessor:
         elif music_name_str in self.list_audio_populer: return 'Audio Populer'
         else: return 'Audio Lainnya'
 
+    def classify_audio_series(self, df):
+        """Versi vektor dari _classify_audio_logic untuk seluruh DataFrame (tanpa apply axis=1)."""
+        if 'musicMeta.musicName' in df.columns:
+            names = df['musicMeta.musicName']
+        else:
+            names = pd.Series('', index=df.index)
+
+        missing = names.isna().to_numpy()
+        name_str = names.astype(str)
+        name_lower = name_str.str.lower()
+
+        tanpa_audio = (
+            missing
+            | name_str.str.strip().isin(['', '-', 'nan']).to_numpy()
+            | name_lower.isin(['tidak ada musik', 'no music']).to_numpy()
+        )
+
+        if 'musicMeta.musicOriginal' in df.columns:
+            flag = df['musicMeta.musicOriginal']
+            is_original = (flag.astype(str).str.lower() == 'true').to_numpy() | (flag == True).to_numpy()
+        else:
+            is_original = np.zeros(len(df), dtype=bool)
+        is_original = (
+            is_original
+            | name_lower.str.contains('original sound', regex=False).to_numpy()
+            | name_lower.str.contains('suara asli', regex=False).to_numpy()
+        )
+
+        # Membership lagu populer pakai set (bukan scan list per baris)
+        populer_set = {x for x in self.list_audio_populer if isinstance(x, str)}
+        is_populer = name_str.isin(populer_set).to_numpy()
+
+        labels = np.select(
+            [tanpa_audio, is_original, is_populer],
+            ['Tanpa Audio', 'Audio Original', 'Audio Populer'],
+            default='Audio Lainnya'
+        ).astype(object)
+        return pd.Series(labels, index=df.index)
+
     # --- DASHBOARD & STATS (TETAP UTUH) ---
     def get_unique_authors(self):
-        if self.df is None: self.load_data()
+        if self.df is None and self.store is None: self.load_data()
+        if self.store is not None:
+            return sorted(self.store.categories.get('authorMeta.name', []))
         if self.df is None: return []
         if 'authorMeta.name' in self.df.columns:
             return sorted(self.df['authorMeta.name'].astype(str).unique().tolist())
         return []
 
-    def get_summary_stats(self, df=None):
+    # --- CUBE AGREGAT (UNTUK PANEL DASHBOARD) ---
+    def get_cube(self):
+        """Cube agregat untuk versi data saat ini (dibangun sekali per versi data)."""
+        if self.store is not None: return self._cube  # dibangun per chunk saat streaming
+        if self.df is None: return None
+        if self._cube is None or self._cube_version != self.data_version:
+            self._cube = OlapCube.from_frame(self.df)
+            self._cube_version = self.data_version
+        return self._cube
+
+    # --- INDEKS KREATOR & WAKTU (UNTUK FILTER DASHBOARD) ---
+    def get_row_index(self):
+        """Indeks kreator & waktu untuk versi data saat ini."""
+        if self.df is None and self.store is None: return None
+        if self._row_index is None or self._row_index_version != self.data_version:
+            # Mode streaming: hanya dua kolom yang dibaca dari column store
+            source = self.df if self.store is None else self.store.frame(['createTimeISO', 'authorMeta.name'])
+            self._row_index = RowIndex(source)
+            self._row_index_version = self.data_version
+        return self._row_index
+
+    def filter_frame(self, author=None, start_date=None, end_date=None, year=None, month_name=None, columns=None):
+        """
+        Ambil baris sesuai filter lewat indeks (searchsorted) tanpa scan/copy seluruh frame.
+        columns: proyeksi kolom (mis. PROJECTIONS['dashboard']); None = semua kolom olahan.
+        """
+        if self.df is None and self.store is None: return pd.DataFrame()
+        positions = None
+        if not all(v is None for v in (author, start_date, end_date, year, month_name)):
+            positions = self.get_row_index().positions(
+                author=author, start_date=start_date, end_date=end_date, year=year, month_name=month_name
+            )
+        if self.store is not None:
+            # Mode streaming: hanya baris & kolom terpilih yang dibaca dari disk
+            return self._frame_from_store(positions, columns)
+        target = self.df if columns is None else self.df[columns]
+        return target if positions is None else target.iloc[positions]
+
+    def get_projection(self, consumer):
+        """Kolom olahan yang dibutuhkan konsumen (lihat PROJECTIONS) untuk seluruh baris."""
+        return self.filter_frame(columns=PROJECTIONS[consumer])
+
+    def with_details(self, frame, columns=None):
+        """
+        Lengkapi baris terproyeksi dengan kolom yang tidak ikut proyeksi (hanya untuk tabel detail):
+        kolom olahan diambil dari data aktif, DETAIL_COLUMNS dibaca dari CSV
+
+        Args:
+            frame (pd.DataFrame): Baris hasil filter_frame / get_top_videos (index = posisi baris)
+            columns (list): Kolom yang dibutuhkan (None = semua DETAIL_COLUMNS)
+
+        Returns:
+            pd.DataFrame: frame + kolom tambahan (NaN untuk baris yang tidak ada di CSV)
+        """
+        try:
+            missing = [col for col in (columns or DETAIL_COLUMNS) if col not in frame.columns]
+            if not missing or frame.empty:
+                return frame
+            frame = pd.DataFrame(frame)
+            order = list(frame.columns) + missing  # Kolom tambahan sesuai urutan permintaan
+
+            processed = [col for col in missing if col not in DETAIL_COLUMNS]
+            if processed:
+                if self.store is not None:
+                    extra = self._frame_from_store(frame.index.to_numpy(), processed)
+                else:
+                    extra = self.df[processed].loc[frame.index]
+                frame = pd.concat([frame, pd.DataFrame(extra)[processed]], axis=1)
+
+            header = pd.read_csv(self.data_path, nrows=0).columns
+            wanted = [col for col in missing if col in DETAIL_COLUMNS and col in header]
+            if not wanted:
+                return frame[[col for col in order if col in frame.columns]]
+
+            # Dibaca per chunk; hanya baris yang diminta yang disimpan
+            positions = np.sort(frame.index.to_numpy())
+            parts, start = [], 0
+            with pd.read_csv(self.data_path, usecols=wanted, chunksize=STREAM_CHUNK_SIZE,
+                             on_bad_lines='skip') as reader:
+                for chunk in reader:
+                    stop = start + len(chunk)
+                    lo, hi = np.searchsorted(positions, [start, stop])
+                    if hi > lo:
+                        part = chunk.iloc[positions[lo:hi] - start]
+                        part.index = positions[lo:hi]
+                        parts.append(part)
+                    start = stop
+                    if start > positions[-1]:
+                        break
+            details = pd.concat(parts) if parts else pd.DataFrame(columns=wanted)
+            frame = pd.concat([frame, details[wanted].reindex(frame.index)], axis=1)
+            return frame[[col for col in order if col in frame.columns]]
+        except Exception as e:
+            print(f"❌ Error loading detail columns: {str(e)}")
+            return frame
+
+    def _resolve_cube(self, df, cube):
+        # Cube eksplisit > cube data penuh (jika df tidak diberikan) > hitung dari baris df
+        if cube is not None: return cube
+        if df is None: return self.get_cube()
+        return None
+
+    def get_summary_stats(self, df=None, cube=None):
+        cube = self._resolve_cube(df, cube)
+        if cube is not None:
+            totals = cube.totals()
+            if not totals: return {}
+            return {
+                'total_videos': totals['count'],
+                'total_views': totals['playCount_sum'],
+                'total_likes': totals['diggCount_sum'],
+                'total_comments': totals['commentCount_sum'],
+                'total_shares': totals['shareCount_sum'],
+                'avg_views': totals['playCount_mean'],
+                'avg_likes': totals['diggCount_mean'],
+                'avg_engagement_rate': totals['engagement_rate_mean'],
+                'avg_duration': totals['videoMeta.duration_mean'],
+                'date_range': {'start': totals['createTimeISO_min'], 'end': totals['createTimeISO_max']}
+            }
+
         target_df = df if df is not None else self.df
         if target_df is None or target_df.empty: return {}
         return {
@@ -258,12 +1034,32 @@ class DataProcessor:
             'date_range': {'start': target_df['createTimeISO'].min(), 'end': target_df['createTimeISO'].max()}
         }
 
+    def get_trending_threshold(self, percentile=75):
+        """Batas tayangan video trending (persentil playCount seluruh data)."""
+        plays = self.get_column('playCount')
+        return float(np.percentile(plays, percentile)) if len(plays) else 0.0
+
+    def get_reference_stats(self):
+        """Rata-rata acuan untuk halaman prediksi (hanya kolom PROJECTIONS['reference'])."""
+        if self.df is None and self.store is None: self.load_data()
+        if not self.has_data(): return {}
+        means = {col: self.get_column(col).mean() for col in PROJECTIONS['reference']}
+        return {
+            'avg_likes': means['diggCount'],
+            'avg_comments': means['commentCount'],
+            'avg_shares': means['shareCount'],
+            'avg_duration': means['videoMeta.duration'],
+            'trending_threshold': self.get_trending_threshold(75)
+        }
+
     def get_leaderboard(self):
-        if self.df is None: self.load_data()
-        if self.df is None: return pd.DataFrame()
-        leaderboard = self.df.groupby('authorMeta.name').agg({
-            'playCount': 'sum', 'diggCount': 'sum', 'shareCount': 'sum',
-            'webVideoUrl': 'count', 'engagement_rate': 'mean'
+        if self.df is None and self.store is None: self.load_data()
+        if self.df is None and self.store is None: return pd.DataFrame()
+        rolled = self.get_cube().rollup('authorMeta.name')
+        leaderboard = pd.DataFrame({
+            'playCount': rolled['playCount_sum'], 'diggCount': rolled['diggCount_sum'],
+            'shareCount': rolled['shareCount_sum'], 'webVideoUrl': rolled['n_videos'],
+            'engagement_rate': rolled['engagement_rate_sum'] / rolled['n_rows']
         }).reset_index()
         leaderboard.rename(columns={
             'authorMeta.name': 'Nama Akun', 'webVideoUrl': 'Jml Video',
@@ -273,69 +1069,309 @@ class DataProcessor:
         return leaderboard.sort_values(by='Total Penayangan', ascending=False)
 
     # --- VISUALIZATION HELPERS ---
-    def get_performance_by_day(self, df=None):
+    def get_performance_by_day(self, df=None, cube=None):
+        day_order = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+        cube = self._resolve_cube(df, cube)
+        if cube is not None:
+            return cube.mean_by('upload_day', 'playCount').reindex(day_order)
         target = df if df is not None else self.df
         if target is None: return pd.DataFrame()
-        day_order = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
         return target.groupby('upload_day')['playCount'].mean().reindex(day_order)
 
-    def get_performance_by_hour(self, df=None):
+    def get_performance_by_hour(self, df=None, cube=None):
+        cube = self._resolve_cube(df, cube)
+        if cube is not None:
+            return cube.mean_by('upload_hour', 'playCount')
         target = df if df is not None else self.df
         if target is None: return pd.DataFrame()
         return target.groupby('upload_hour')['playCount'].mean()
 
-    def get_content_type_performance(self, df=None):
-        target = df if df is not None else self.df
-        if target is None: return pd.DataFrame()
-        perf = target.groupby('content_type').agg({'playCount': 'mean', 'webVideoUrl': 'count'})
-        perf.columns = ['Rata-rata Tayangan', 'Jumlah Video']
+    def _category_performance(self, dimension, df=None, cube=None):
+        cube = self._resolve_cube(df, cube)
+        if cube is not None:
+            rolled = cube.rollup(dimension)
+            perf = pd.DataFrame({
+                'Rata-rata Tayangan': rolled['playCount_sum'] / rolled['n_rows'],
+                'Jumlah Video': rolled['n_videos']
+            })
+        else:
+            target = df if df is not None else self.df
+            if target is None: return pd.DataFrame()
+            perf = target.groupby(dimension).agg({'playCount': 'mean', 'webVideoUrl': 'count'})
+            perf.columns = ['Rata-rata Tayangan', 'Jumlah Video']
         return perf.sort_values(by='Rata-rata Tayangan', ascending=False)
 
-    def get_audio_type_performance(self, df=None):
-        target = df if df is not None else self.df
-        if target is None: return pd.DataFrame()
-        perf = target.groupby('audio_type').agg({'playCount': 'mean', 'webVideoUrl': 'count'})
-        perf.columns = ['Rata-rata Tayangan', 'Jumlah Video']
-        return perf.sort_values(by='Rata-rata Tayangan', ascending=False)
+    def get_content_type_performance(self, df=None, cube=None):
+        return self._category_performance('content_type', df, cube)
+
+    def get_audio_type_performance(self, df=None, cube=None):
+        return self._category_performance('audio_type', df, cube)
 
     def get_correlation_matrix(self, df=None):
+        if df is None and self.store is not None:
+            return self._moments.corr()  # akumulator per chunk (tanpa membaca baris)
         target = df if df is not None else self.df
         if target is None: return pd.DataFrame()
-        return target[['playCount', 'diggCount', 'commentCount', 'shareCount', 'videoMeta.duration', 'engagement_rate']].corr()
+        return target[CORRELATION_COLUMNS].corr()
     
     def get_top_videos(self, df=None, n=10):
+        if df is None and self.store is not None:
+            # Kandidat dipilih dari kolom playCount (memory-mapped), hanya baris itu yang dibaca
+            candidates = self._top_candidates('playCount', n)
+            if len(candidates) == 0: return pd.DataFrame()
+            return self._frame_from_store(candidates).nlargest(n, 'playCount')
         target = df if df is not None else self.df
         if target is None: return pd.DataFrame()
         return target.nlargest(n, 'playCount')
 
-    # --- PREDICTION FEATURES ---
-    def prepare_features_for_prediction(self, raw_features):
-        text_content = raw_features.get('text_content', '')
-        detected_category = self._classify_content_logic(text_content)
-        user_audio_choice = raw_features.get('audio_type', 'Audio Lainnya') 
-        
-        features = {
-            'Jam_Posting': raw_features.get('upload_hour', 12),
-            'Is_Weekend': 1 if raw_features.get('upload_day', 0) in [5, 6] else 0,
-            'Panjang_Caption': raw_features.get('caption_length', 0),
-            'Jumlah_Hashtag': raw_features.get('hashtag_count', 0),
-            'Suka': raw_features.get('likes', 0),
-            'Durasi_Video': raw_features.get('duration', 0)
+    # --- PANEL BARIS DASHBOARD (MODE STREAMING: PER BLOK, TANPA MEMUAT SELURUH DATA) ---
+    def _column_blocks(self, column, positions=None):
+        """Nilai satu kolom numerik per blok STREAM_CHUNK_SIZE -> (nilai float64, posisi baris)."""
+        values = self.store.array(column)
+        n = len(values) if positions is None else len(positions)
+        for start in range(0, n, STREAM_CHUNK_SIZE):
+            if positions is None:
+                block = np.arange(start, min(start + STREAM_CHUNK_SIZE, n))
+                yield np.asarray(values[start:start + STREAM_CHUNK_SIZE], dtype=np.float64), block
+            else:
+                block = positions[start:start + STREAM_CHUNK_SIZE]
+                yield np.asarray(values[block], dtype=np.float64), block
+
+    def _top_candidates(self, column, n, positions=None):
+        """
+        Posisi kandidat n nilai terbesar: per blok semua nilai >= nilai ke-n blok itu
+        (seri ikut), sehingga nlargest atas kandidat = nlargest atas seluruh baris.
+        """
+        candidates = []
+        for values, block in self._column_blocks(column, positions):
+            if len(values) == 0:
+                continue
+            k = min(n, len(values))
+            cutoff = np.partition(values, len(values) - k)[len(values) - k]
+            candidates.append(block[values >= cutoff])
+        return np.concatenate(candidates) if candidates else np.empty(0, dtype=np.int64)
+
+    def _block_median(self, column, positions=None, n_bins=4096):
+        """
+        Median eksak dalam tiga lintasan berbatas memori: min/max, histogram untuk
+        menemukan bin nilai tengah, lalu hanya nilai di bin tersebut yang diurutkan.
+        """
+        n, low, high = 0, np.inf, -np.inf
+        for values, _ in self._column_blocks(column, positions):
+            if len(values):
+                n += len(values)
+                low, high = min(low, values.min()), max(high, values.max())
+        if n == 0:
+            return np.nan
+        if low == high:
+            return float(low)
+
+        edges = np.linspace(low, high, n_bins + 1)
+        counts = np.zeros(n_bins, dtype=np.int64)
+        for values, _ in self._column_blocks(column, positions):
+            counts += np.histogram(values, bins=edges)[0]
+
+        # Rank nilai tengah (dua rank jika n genap) -> bin yang memuatnya
+        ranks = sorted({(n - 1) // 2, n // 2})
+        cumulative = np.cumsum(counts)
+        bins = np.searchsorted(cumulative, ranks, side='right')
+        lo_edge, hi_edge = edges[bins.min()], edges[bins.max() + 1]
+        before = int(cumulative[bins.min() - 1]) if bins.min() > 0 else 0
+
+        selected = []
+        last_bin = bins.max() == n_bins - 1
+        for values, _ in self._column_blocks(column, positions):
+            inside = (values >= lo_edge) & ((values <= hi_edge) if last_bin else (values < hi_edge))
+            selected.append(values[inside])
+        selected = np.sort(np.concatenate(selected))
+        return float(np.mean([selected[r - before] for r in ranks]))
+
+    def _block_histogram(self, column, positions=None, bins=HISTOGRAM_BINS):
+        """Histogram dengan bin lebar sama di [min, max] (dua lintasan)."""
+        low, high = np.inf, -np.inf
+        for values, _ in self._column_blocks(column, positions):
+            if len(values):
+                low, high = min(low, values.min()), max(high, values.max())
+        if not np.isfinite(low):
+            return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+        edges = np.histogram_bin_edges([low, high], bins=bins)
+        counts = np.zeros(bins, dtype=np.int64)
+        for values, _ in self._column_blocks(column, positions):
+            counts += np.histogram(values, bins=edges)[0]
+        return counts, edges
+
+    def get_dashboard_panels(self, author=None, start_date=None, end_date=None, year=None, month_name=None,
+                             n_top=10, bins=HISTOGRAM_BINS):
+        """
+        Data panel tingkat baris Dashboard untuk satu filter. Mode biasa: dihitung dari baris
+        hasil filter_frame (proyeksi Dashboard). Mode streaming: per blok dari column store
+        (kolom memory-mapped), tanpa pernah memuat seluruh data ke memori.
+
+        Returns:
+            dict: n_videos, median_views, engagement_hist (Batas Bawah, Batas Atas, Frekuensi),
+                  time_series (createTimeISO, playCount; total harian dari cube jika baris
+                  > TIMELINE_MAX_POINTS), correlation, top_views / top_likes / top_comments (dengan text)
+        """
+        filters = dict(author=author, start_date=start_date, end_date=end_date, year=year, month_name=month_name)
+        empty = {'n_videos': 0, 'median_views': 0, 'engagement_hist': pd.DataFrame(),
+                 'time_series': pd.DataFrame(columns=['createTimeISO', 'playCount']),
+                 'correlation': pd.DataFrame(), 'top_views': pd.DataFrame(),
+                 'top_likes': pd.DataFrame(), 'top_comments': pd.DataFrame()}
+        if not self.has_data(): return empty
+
+        top_metrics = {'top_views': 'playCount', 'top_likes': 'diggCount', 'top_comments': 'commentCount'}
+        if self.store is None:
+            frame = self.filter_frame(columns=PROJECTIONS['dashboard'], **filters)
+            if frame.empty: return empty
+            counts, edges = np.histogram(frame['engagement_rate'].to_numpy(dtype=np.float64), bins=bins)
+            n_videos = len(frame)
+            median_views = frame['playCount'].median()
+            correlation = frame[CORRELATION_COLUMNS].corr()
+            tops = {key: frame.nlargest(n_top, metric) for key, metric in top_metrics.items()}
+            timeline = frame if n_videos <= TIMELINE_MAX_POINTS else None
+        else:
+            unfiltered = all(v is None for v in filters.values())
+            positions = None if unfiltered else self.get_row_index().positions(**filters)
+            n_videos = self.row_count() if positions is None else len(positions)
+            if n_videos == 0: return empty
+            counts, edges = self._block_histogram('engagement_rate', positions, bins)
+            median_views = self._block_median('playCount', positions)
+            if unfiltered:
+                correlation = self._moments.corr()
+            else:
+                moments = RunningMoments(CORRELATION_COLUMNS)
+                for start in range(0, n_videos, STREAM_CHUNK_SIZE):
+                    moments.update(self.store.frame(CORRELATION_COLUMNS, positions[start:start + STREAM_CHUNK_SIZE]))
+                correlation = moments.corr()
+            tops = {}
+            for key, metric in top_metrics.items():
+                candidates = self._top_candidates(metric, n_top, positions)
+                tops[key] = self._frame_from_store(candidates, PROJECTIONS['dashboard']).nlargest(n_top, metric)
+            timeline = None
+            if n_videos <= TIMELINE_MAX_POINTS:
+                timeline = self._frame_from_store(positions, ['createTimeISO', 'playCount'])
+
+        if timeline is not None:
+            time_series = timeline.sort_values('createTimeISO')[['createTimeISO', 'playCount']]
+        else:
+            # Terlalu banyak titik untuk satu grafik: total tayangan per hari dari cube
+            daily = self.get_cube().slice(**filters).rollup('upload_date')['playCount_sum']
+            time_series = pd.DataFrame({'createTimeISO': daily.index, 'playCount': daily.to_numpy()}).sort_values('createTimeISO')
+
+        return {
+            'n_videos': n_videos,
+            'median_views': median_views,
+            'engagement_hist': pd.DataFrame({'Batas Bawah': edges[:-1], 'Batas Atas': edges[1:], 'Frekuensi': counts}),
+            'time_series': time_series,
+            'correlation': correlation,
+            **{key: self.with_details(top, ['text']) for key, top in tops.items()},
         }
 
+    # --- PREDICTION FEATURES ---
+    # --- PIPELINE FITUR (SATU JALUR UNTUK PREDIKSI TUNGGAL, WHAT-IF & PREPROSES) ---
+    def default_feature_names(self):
+        """Kolom fitur lengkap (semua kategori kamus + Lainnya, semua tipe audio, interaksi)"""
         all_categories = list(self.KAMUS_KATEGORI.keys()) + ['Lainnya']
-        for cat in all_categories:
-            features[f"Kat_{cat}"] = 1 if detected_category == cat else 0
-            
-        all_audios = ['Audio Original', 'Audio Populer', 'Audio Lainnya', 'Tanpa Audio']
-        for audio in all_audios:
-            features[f"Audio_{audio}"] = 1 if user_audio_choice == audio else 0
-
-        suka_val = features['Suka']
-        for cat in all_categories:
-            features[f"Interaksi_{cat}_Suka"] = features[f"Kat_{cat}"] * suka_val
-
-        return pd.DataFrame([features])
+        return (
+            ['Jam_Posting', 'Is_Weekend', 'Panjang_Caption', 'Jumlah_Hashtag', 'Suka', 'Durasi_Video']
+            + [f"Kat_{cat}" for cat in all_categories]
+            + [f"Audio_{audio}" for audio in AUDIO_TYPES]
+            + [f"Interaksi_{cat}_Suka" for cat in all_categories]
+        )
+
+    def get_feature_pipeline(self, feature_names=None):
+        """
+        Pipeline fitur yang sudah dikompilasi untuk daftar kolom tertentu (di-cache per daftar)
+
+        Args:
+            feature_names (list): Kolom output, mis. ModelHandler.feature_names (None = default_feature_names)
+        """
+        key = tuple(feature_names) if feature_names is not None else tuple(self.default_feature_names())
+        if key not in self._feature_pipelines:
+            self._feature_pipelines[key] = FeaturePipeline(key)
+        return self._feature_pipelines[key]
+
+    def build_base_records(self, raw_records):
+        """
+        Ubah input form (list of dict) menjadi record dasar untuk FeaturePipeline
+
+        Args:
+            raw_records (list): Dict dengan kunci upload_hour, upload_day, caption_length,
+                hashtag_count, likes, duration, text_content, audio_type
+
+        Returns:
+            pd.DataFrame: Kolom numerik model + content_type & audio_type
+        """
+        raw = pd.DataFrame(list(raw_records), index=range(len(raw_records)))
+
+        def column(key, default):
+            # Sama dengan dict.get(key, default); kunci yang hilang di sebagian record ikut default
+            if key in raw.columns:
+                return raw[key].fillna(default)
+            return pd.Series(default, index=raw.index)
+
+        texts = column('text_content', '')
+        return pd.DataFrame({
+            'Jam_Posting': column('upload_hour', 12),
+            'Is_Weekend': column('upload_day', 0).isin([5, 6]).astype(np.int64),
+            'Panjang_Caption': column('caption_length', 0),
+            'Jumlah_Hashtag': column('hashtag_count', 0),
+            'Suka': column('likes', 0),
+            'Durasi_Video': column('duration', 0),
+            'content_type': self.classify_content_series(texts),
+            'audio_type': column('audio_type', 'Audio Lainnya'),
+        })
+
+    def prepare_features_for_prediction(self, raw_features, feature_names=None):
+        """
+        Fitur model untuk satu input form (kasus batch berisi satu record)
+
+        Args:
+            raw_features (dict): Input form Prediksi Tunggal
+            feature_names (list): Urutan kolom output (None = default_feature_names)
+
+        Returns:
+            pd.DataFrame: Satu baris fitur
+        """
+        records = self.build_base_records([raw_features])
+        return self.get_feature_pipeline(feature_names).transform_frame(records)
+
+    # --- SIMULASI WHAT-IF (JAM x HARI x AUDIO x DURASI) ---
+    def prepare_what_if_features(self, raw_features, hours=range(24), days=range(7), audio_types=None, durations=None,
+                                 feature_names=None):
+        """
+        Bangun semua kombinasi pengaturan upload sebagai satu matriks fitur.
+        Caption diklasifikasi sekali; hanya kolom jam/weekend/audio/durasi yang divariasikan.
+
+        Returns:
+            tuple: (grid, features) - grid berisi upload_hour, upload_day, audio_type, duration;
+                   features berisi fitur model dengan urutan baris yang sama
+        """
+        base = self.build_base_records([raw_features])
+        audio_types = list(audio_types) if audio_types is not None else AUDIO_TYPES
+        if not durations:
+            durations = [raw_features.get('duration', 0)]
+
+        hour_grid, day_grid, audio_grid, duration_grid = np.meshgrid(
+            np.asarray(list(hours)), np.asarray(list(days)),
+            np.arange(len(audio_types)), np.asarray(list(durations)), indexing='ij'
+        )
+        grid = pd.DataFrame({
+            'upload_hour': hour_grid.ravel(),
+            'upload_day': day_grid.ravel(),
+            'audio_type': np.asarray(audio_types, dtype=object)[audio_grid.ravel()],
+            'duration': duration_grid.ravel()
+        })
+
+        # Ulangi record dasar lalu timpa kolom yang divariasikan (tanpa loop per kombinasi)
+        records = base.loc[np.zeros(len(grid), dtype=np.intp)].reset_index(drop=True)
+        records['Jam_Posting'] = grid['upload_hour'].to_numpy()
+        records['Is_Weekend'] = np.isin(grid['upload_day'].to_numpy(), [5, 6]).astype(np.int64)
+        records['Durasi_Video'] = grid['duration'].to_numpy()
+        records['audio_type'] = grid['audio_type'].to_numpy()
+
+        features = self.get_feature_pipeline(feature_names).transform_frame(records)
+        return grid, features
 
 # --- GLOBAL INSTANCE ---
 _data_processor_instance = None
@@ -0,0 +1,122 @@
+"""
+Feature Pipeline Module
+Compiled mapping from base records (one row per video) to the model feature matrix
+"""
+import numpy as np
+import pandas as pd
+
+
+class FeaturePipeline:
+    """
+    Column plan compiled once from a feature-name list:
+    Kat_<cat> and Audio_<audio> are one-hot blocks, Interaksi_<cat>_Suka is
+    the category indicator times Suka, every other name is copied from the
+    same-named numeric column of the input (0 if absent)
+    """
+
+    def __init__(self, feature_names):
+        """
+        Args:
+            feature_names (list): Output columns, e.g. ModelHandler.feature_names
+        """
+        self.feature_names = list(feature_names)
+
+        kat_pos, audio_pos, inter_pos = {}, {}, {}
+        self.numeric_columns = []
+        numeric_pos = []
+        for j, name in enumerate(self.feature_names):
+            if name.startswith('Kat_'):
+                kat_pos[name[len('Kat_'):]] = j
+            elif name.startswith('Audio_'):
+                audio_pos[name[len('Audio_'):]] = j
+            elif name.startswith('Interaksi_') and name.endswith('_Suka'):
+                inter_pos[name[len('Interaksi_'):-len('_Suka')]] = j
+            else:
+                self.numeric_columns.append(name)
+                numeric_pos.append(j)
+
+        # Kategori = gabungan kategori di blok Kat_ dan Interaksi_ (urutan kemunculan)
+        self.categories = list(dict.fromkeys(list(kat_pos) + list(inter_pos)))
+        self.audio_types = list(audio_pos)
+
+        self._numeric_pos = np.asarray(numeric_pos, dtype=np.intp)
+        self._kat_src, self._kat_dst = self._block(self.categories, kat_pos)
+        self._inter_src, self._inter_dst = self._block(self.categories, inter_pos)
+        self._audio_src, self._audio_dst = self._block(self.audio_types, audio_pos)
+
+        self.onehot_columns = [self.feature_names[j] for j in np.concatenate([self._kat_dst, self._audio_dst])]
+        self.interaction_columns = [self.feature_names[j] for j in self._inter_dst]
+
+    @staticmethod
+    def _block(labels, positions):
+        """(indicator column, output column) index pairs for labels present in positions"""
+        src = [i for i, label in enumerate(labels) if label in positions]
+        dst = [positions[labels[i]] for i in src]
+        return np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp)
+
+    @staticmethod
+    def _indicator(values, labels):
+        """(n_rows, n_labels) 0/1 matrix; unknown values give an all-zero row"""
+        codes = pd.Index(labels).get_indexer(values)
+        indicator = np.zeros((len(codes), len(labels)), dtype=np.float64)
+        rows = np.flatnonzero(codes >= 0)
+        indicator[rows, codes[rows]] = 1.0
+        return indicator
+
+    def transform(self, records, content_col='content_type', audio_col='audio_type'):
+        """
+        Build the feature matrix
+
+        Args:
+            records (pd.DataFrame): Base records (numeric columns + content/audio labels)
+            content_col (str): Column with the detected content category
+            audio_col (str): Column with the audio type
+
+        Returns:
+            np.ndarray: (n_rows, len(feature_names)) float64 matrix
+        """
+        n_rows = len(records)
+        X = np.zeros((n_rows, len(self.feature_names)), dtype=np.float64)
+
+        # Kolom numerik disalin langsung ke posisinya
+        present = [i for i, col in enumerate(self.numeric_columns) if col in records.columns]
+        if present:
+            cols = [self.numeric_columns[i] for i in present]
+            X[:, self._numeric_pos[present]] = records[cols].to_numpy(dtype=np.float64)
+
+        if self.categories and content_col in records.columns:
+            indicator = self._indicator(records[content_col], self.categories)
+            X[:, self._kat_dst] = indicator[:, self._kat_src]
+            if len(self._inter_dst) and 'Suka' in records.columns:
+                # Sama dengan Kat_X * Suka (termasuk 0 * NaN = NaN)
+                likes = records['Suka'].to_numpy(dtype=np.float64)
+                X[:, self._inter_dst] = indicator[:, self._inter_src] * likes[:, None]
+
+        if self.audio_types and audio_col in records.columns:
+            indicator = self._indicator(records[audio_col], self.audio_types)
+            X[:, self._audio_dst] = indicator[:, self._audio_src]
+
+        return X
+
+    def transform_frame(self, records, content_col='content_type', audio_col='audio_type'):
+        """
+        Same as transform, returned as a DataFrame with integer one-hot columns,
+        interaction columns typed like Suka * int, and numeric columns in their source dtype
+
+        Returns:
+            pd.DataFrame: Columns in feature_names order, index of records
+        """
+        X = self.transform(records, content_col=content_col, audio_col=audio_col)
+        frame = pd.DataFrame(X, columns=self.feature_names, index=records.index)
+
+        dtypes = {col: np.int64 for col in self.onehot_columns}
+        likes_dtype = records['Suka'].dtype if 'Suka' in records.columns else np.dtype(np.int64)
+        if pd.api.types.is_numeric_dtype(likes_dtype):
+            for col in self.interaction_columns:
+                dtypes[col] = np.result_type(np.int64, likes_dtype)
+        for col in self.numeric_columns:
+            if col not in records.columns:
+                dtypes[col] = np.int64
+            elif pd.api.types.is_numeric_dtype(records[col].dtype) and not records[col].isna().any():
+                dtypes[col] = records[col].dtype
+        return frame.astype(dtypes)
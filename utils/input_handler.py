@@ -1,51 +1,128 @@
 import pandas as pd
+import csv
 import os
 import time
 import random
 import string
 
-def save_new_data_to_csv(new_data_dict):
-    """
-    Menyimpan data baru ke CSV dengan penanganan kolom otomatis & cerdas.
-    """
+# Skema tetap kolom dataset_tiktok.csv -> nilai default untuk sel kosong
+# (aturan sama dengan versi lama: angka -> 0, teks -> "-", bool -> False).
+# Tidak ditebak dari isi file: kolom yang kosong di data lama tetap dapat default yang benar.
+COLUMN_DEFAULTS = {
+    'diggCount': 0, 'shareCount': 0, 'playCount': 0, 'commentCount': 0, 'collectCount': 0,
+    'videoMeta.duration': 0, 'videoMeta.height': 0, 'videoMeta.width': 0,
+    'musicMeta.musicOriginal': False, 'authorMeta.verified': False,
+    'authorMeta.avatar': "-", 'authorMeta.name': "-", 'authorMeta.nickName': "-", 'text': "-",
+    'musicMeta.musicName': "-", 'musicMeta.musicAuthor': "-", 'createTimeISO': "-",
+    'webVideoUrl': "-", 'id': "-",
+}
+TEXT_DEFAULT = "-"  # Kolom header di luar skema dianggap teks
+
+def _get_dataset_path():
     # Cari path file relatif terhadap file script ini
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(os.path.dirname(current_dir), 'data', 'dataset_tiktok.csv')
-    
+    return os.path.join(os.path.dirname(current_dir), 'data', 'dataset_tiktok.csv')
+
+def _get_column_defaults(file_path):
+    """
+    Baca header saja (tanpa baris data) lalu ambil nilai default tiap kolom
+    dari COLUMN_DEFAULTS.
+    """
+    columns = list(pd.read_csv(file_path, nrows=0).columns)
+    defaults = {col: COLUMN_DEFAULTS.get(col, TEXT_DEFAULT) for col in columns}
+    return columns, defaults
+
+def _fill_row(row_dict, columns, defaults):
+    """Susun satu baris sesuai urutan header & isi nilai kosong dengan default."""
+    row = {}
+    for col in columns:
+        value = row_dict.get(col)
+        if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
+            value = defaults.get(col, "-")
+        elif isinstance(value, bool) and defaults.get(col) == 0 and not isinstance(defaults.get(col), bool):
+            # Kolom angka tetap angka (sama seperti hasil concat lama: False -> 0)
+            value = int(value)
+        row[col] = value
+    return row
+
+def _rewrite_csv(file_path, rows):
+    """Jalur lama (baca-gabung-tulis ulang). Dipakai hanya jika ada kolom baru di input."""
+    # 1. Baca data lama
+    df_old = pd.read_csv(file_path)
+
+    # 2. Buat DataFrame dari input baru
+    df_new = pd.DataFrame(rows)
+
+    # 3. GABUNGKAN (CONCAT) - Ini inti Pandas
+    # Pandas akan otomatis membuat kolom NaN jika di input tidak ada
+    df_final = pd.concat([df_old, df_new], ignore_index=True)
+
+    # 4. ISI NILAI KOSONG (SMART FILLNA - Menggantikan logika if-else panjang)
+    # Kita isi nilai NaN pada baris baru saja agar aman
+    new_idx = df_final.index[len(df_old):]
+
+    # Default untuk angka -> 0
+    num_cols = df_final.select_dtypes(include=['number']).columns
+    df_final.loc[new_idx, num_cols] = df_final.loc[new_idx, num_cols].fillna(0)
+
+    # Default untuk teks -> "-"
+    obj_cols = df_final.select_dtypes(include=['object', 'string']).columns
+    df_final.loc[new_idx, obj_cols] = df_final.loc[new_idx, obj_cols].fillna("-")
+
+    # Default Bool -> False
+    bool_cols = df_final.select_dtypes(include=['bool']).columns
+    df_final.loc[new_idx, bool_cols] = df_final.loc[new_idx, bool_cols].fillna(False)
+
+    # 5. SIMPAN
+    df_final.to_csv(file_path, index=False)
+
+def save_new_rows_to_csv(rows):
+    """
+    Menambahkan banyak baris sekaligus ke CSV dengan mode append
+    (tanpa membaca & menulis ulang seluruh dataset).
+    """
+    file_path = _get_dataset_path()
+
     try:
         if not os.path.exists(file_path):
             return False, "File database tidak ditemukan!"
+        if not rows:
+            return True, "Tidak ada data untuk ditambahkan."
+
+        columns, defaults = _get_column_defaults(file_path)
+
+        # Kolom yang belum ada di header tidak bisa di-append -> pakai jalur tulis ulang
+        unknown_cols = {k for row in rows for k in row.keys()} - set(columns)
+        if unknown_cols:
+            _rewrite_csv(file_path, rows)
+            return True, f"{len(rows)} data berhasil ditambahkan (kolom baru: {', '.join(sorted(unknown_cols))})."
+
+        df_new = pd.DataFrame([_fill_row(row, columns, defaults) for row in rows], columns=columns)
+
+        with open(file_path, 'rb+') as f:
+            # Pastikan baris baru dimulai di baris tersendiri
+            f.seek(0, os.SEEK_END)
+            needs_newline = False
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+            if needs_newline:
+                f.write(b'\n')
+
+        with open(file_path, 'a', encoding='utf-8', newline='') as f:
+            df_new.to_csv(f, header=False, index=False, lineterminator='\n', quoting=csv.QUOTE_MINIMAL)
+
+        return True, f"{len(rows)} data berhasil ditambahkan!"
 
-        # 1. Baca data lama
-        df_old = pd.read_csv(file_path)
-        
-        # 2. Buat DataFrame dari input baru
-        df_new = pd.DataFrame([new_data_dict])
-        
-        # 3. GABUNGKAN (CONCAT) - Ini inti Pandas
-        # Pandas akan otomatis membuat kolom NaN jika di input tidak ada
-        df_final = pd.concat([df_old, df_new], ignore_index=True)
-        
-        # 4. ISI NILAI KOSONG (SMART FILLNA - Menggantikan logika if-else panjang)
-        # Kita isi nilai NaN pada baris terakhir (data baru) saja agar aman
-        last_idx = df_final.index[-1]
-        
-        # Default untuk angka -> 0
-        num_cols = df_final.select_dtypes(include=['number']).columns
-        df_final.loc[last_idx, num_cols] = df_final.loc[last_idx, num_cols].fillna(0)
-        
-        # Default untuk teks -> "-"
-        obj_cols = df_final.select_dtypes(include=['object']).columns
-        df_final.loc[last_idx, obj_cols] = df_final.loc[last_idx, obj_cols].fillna("-")
-        
-        # Default Bool -> False
-        bool_cols = df_final.select_dtypes(include=['bool']).columns
-        df_final.loc[last_idx, bool_cols] = df_final.loc[last_idx, bool_cols].fillna(False)
-
-        # 5. SIMPAN
-        df_final.to_csv(file_path, index=False)
-        
-        return True, "Data berhasil ditambahkan!"
-        
     except Exception as e:
-        return False, f"Error sistem: {str(e)}"
\ No newline at end of file
+        return False, f"Error sistem: {str(e)}"
+
+def save_new_data_to_csv(new_data_dict):
+    """
+    Menyimpan data baru ke CSV dengan penanganan kolom otomatis & cerdas.
+    Satu baris langsung di-append ke akhir file (tidak menulis ulang dataset).
+    """
+    success, message = save_new_rows_to_csv([new_data_dict])
+    if success:
+        return True, "Data berhasil ditambahkan!"
+    return False, message
@@ -0,0 +1,426 @@
+"""
+Keyword Matcher Module
+Multi-pattern keyword matching (Aho-Corasick) for content classification
+"""
+import os
+import time
+import atexit
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton compiled once from a category dictionary"""
+
+    def __init__(self, kamus, default_category='Hiburan'):
+        """
+        Build the automaton
+
+        Args:
+            kamus (dict): Mapping category -> list of lowercase keywords
+            default_category (str): Category returned when nothing matches
+        """
+        self.categories = list(kamus.keys())
+        self.default_category = default_category
+
+        # Keyword unik -> bobot per kategori. Keyword yang muncul berulang di satu
+        # kategori tetap dihitung berulang (sama seperti loop substring lama).
+        self.keywords = []
+        self.keyword_weights = []
+        keyword_index = {}
+        for cat_idx, keywords in enumerate(kamus.values()):
+            for keyword in keywords:
+                if keyword not in keyword_index:
+                    keyword_index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.keyword_weights.append({})
+                weights = self.keyword_weights[keyword_index[keyword]]
+                weights[cat_idx] = weights.get(cat_idx, 0) + 1
+
+        self._build_automaton()
+        self._category_matrix = self._build_category_matrix()
+
+    def _build_automaton(self):
+        """Build goto, failure and output tables, then flatten into a DFA"""
+        goto = [{}]
+        outputs = [set()]
+
+        for kw_idx, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(kw_idx)
+
+        # BFS: failure link + transisi lengkap (DFA) agar scan cukup 1 lookup per karakter
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            outputs[state] |= outputs[fail[state]]
+            delta[state] = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state != 0 else 0
+                delta[state][ch] = nxt
+                queue.append(nxt)
+
+        self._delta = delta
+        self._outputs = [tuple(sorted(out)) for out in outputs]
+
+        # Bentuk tabel dari DFA yang sama untuk scan satu kolom (hit_matrix):
+        # simbol = karakter yang muncul di keyword (+ 0 = karakter lain -> state awal)
+        alphabet = sorted({ch for keyword in self.keywords for ch in keyword})
+        self._n_symbols = len(alphabet) + 1
+        # code point -> simbol (tabel lookup sampai code point terbesar di keyword)
+        self._symbol_lut = np.zeros(max(map(ord, alphabet), default=0) + 1, dtype=np.int32)
+        table = np.zeros((len(delta), self._n_symbols), dtype=np.int32)
+        for sym, ch in enumerate(alphabet, start=1):
+            self._symbol_lut[ord(ch)] = sym
+        for state, moves in enumerate(delta):
+            for ch, nxt in moves.items():
+                table[state, self._symbol_lut[ord(ch)]] = nxt
+        # Diratakan: state berikutnya = table[state * n_symbols + simbol]
+        self._table = table.ravel()
+        self._has_output = np.asarray([bool(out) for out in self._outputs])
+        self._output_indptr = np.cumsum([0] + [len(out) for out in self._outputs]).astype(np.int64)
+        self._output_indices = np.asarray([kw for out in self._outputs for kw in out], dtype=np.int64)
+
+    def _build_category_matrix(self):
+        """Sparse keyword x category weight matrix"""
+        rows, cols, data = [], [], []
+        for kw_idx, weights in enumerate(self.keyword_weights):
+            for cat_idx, weight in weights.items():
+                rows.append(kw_idx)
+                cols.append(cat_idx)
+                data.append(weight)
+        return sparse.csr_matrix(
+            (data, (rows, cols)),
+            shape=(len(self.keywords), len(self.categories)),
+            dtype=np.int32
+        )
+
+    def find_keywords(self, text_lower):
+        """
+        Find every distinct keyword occurring in the text
+
+        Args:
+            text_lower (str): Lowercased text
+
+        Returns:
+            set: Indices into self.keywords
+        """
+        delta = self._delta
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for ch in text_lower:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+    def score(self, text_lower):
+        """
+        Score all categories in one pass over the text
+
+        Returns:
+            list: Score per category, in dictionary order
+        """
+        scores = [0] * len(self.categories)
+        for kw_idx in self.find_keywords(text_lower):
+            for cat_idx, weight in self.keyword_weights[kw_idx].items():
+                scores[cat_idx] += weight
+        return scores
+
+    def classify(self, text_lower):
+        """
+        Return the best category, identical to max(scores, key=scores.get)
+        (first category wins ties) with the default fallback on zero score
+        """
+        scores = self.score(text_lower)
+        best_score = max(scores)
+        if best_score == 0:
+            return self.default_category
+        return self.categories[scores.index(best_score)]
+
+    # --- KLASIFIKASI SATU KOLOM (VEKTORISASI) ---
+    def hit_matrix(self, texts):
+        """
+        Build a sparse caption x keyword hit matrix. The automaton runs over all unique
+        captions at once: each NumPy step advances every caption still longer than the
+        current position by one character (no per-character Python loop per caption).
+
+        Args:
+            texts (pd.Series): Caption column (NaN allowed)
+
+        Returns:
+            scipy.sparse.csr_matrix: 1 where the keyword occurs in the caption
+        """
+        texts = pd.Series(texts)
+        missing = texts.isna().to_numpy()
+        lowered = texts.where(~missing, '').astype(str).str.lower()
+        codes, uniques = pd.factorize(lowered)
+        codes = np.where(missing, len(uniques), codes)  # baris kosong untuk NaN
+        uniques = np.asarray(uniques, dtype=object).tolist()
+        n_unique = len(uniques)
+
+        rows, states = [], []
+        lengths = np.fromiter(map(len, uniques), dtype=np.int64, count=n_unique)
+        if n_unique and lengths.max() > 0 and self._n_symbols > 1:
+            # Semua caption unik sebagai satu array code point -> simbol DFA (0 = di luar alfabet)
+            points = np.frombuffer(''.join(uniques).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            lut = self._symbol_lut
+            symbols = lut.take(np.minimum(points, len(lut) - 1))
+            symbols[points >= len(lut)] = 0
+
+            # Caption terpanjang di depan (rank); pada posisi pos hanya n_active[pos] rank teratas
+            # yang masih aktif. Simbol disusun per posisi agar tiap langkah membaca potongan kontigu.
+            order = np.argsort(-lengths, kind='stable')
+            rank = np.empty(n_unique, dtype=np.int64)
+            rank[order] = np.arange(n_unique)
+            n_active = np.bincount(lengths, minlength=lengths.max() + 1)[::-1].cumsum()[::-1][1:]
+            pos_start = np.concatenate([[0], np.cumsum(n_active)])
+            char_caption = np.repeat(np.arange(n_unique), lengths)
+            char_offset = np.arange(len(symbols)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            by_position = np.empty_like(symbols)
+            by_position[pos_start[char_offset] + rank[char_caption]] = symbols
+            del points, symbols, char_caption, char_offset
+
+            state = np.zeros(n_unique, dtype=np.int32)
+            for pos in range(len(n_active)):
+                active = state[:n_active[pos]]
+                active[:] = self._table.take(active * self._n_symbols + by_position[pos_start[pos]:pos_start[pos + 1]])
+                hit = np.flatnonzero(self._has_output.take(active))
+                if hit.size:
+                    rows.append(order[hit])
+                    states.append(active[hit])
+
+        if rows:
+            rows, states = np.concatenate(rows), np.concatenate(states)
+            counts = self._output_indptr[states + 1] - self._output_indptr[states]
+            # Keyword per state (termasuk keluaran failure link), diratakan per kecocokan
+            offsets = np.repeat(self._output_indptr[states] - np.cumsum(counts) + counts, counts)
+            cols = self._output_indices[offsets + np.arange(counts.sum())]
+            rows = np.repeat(rows, counts)
+        else:
+            rows = cols = np.empty(0, dtype=np.int64)
+
+        unique_hits = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(n_unique + 1, len(self.keywords))
+        )
+        # Keyword yang muncul berkali-kali dalam satu caption tetap bernilai 1
+        unique_hits.data[:] = 1
+        return unique_hits[codes]
+
+    def score_matrix(self, texts):
+        """
+        Score every caption against every category
+
+        Returns:
+            np.ndarray: Dense (n_captions, n_categories) score matrix
+        """
+        return (self.hit_matrix(texts) @ self._category_matrix).toarray()
+
+    def classify_series(self, texts):
+        """
+        Classify a whole caption column at once
+
+        Args:
+            texts (pd.Series): Caption column
+
+        Returns:
+            np.ndarray: Category label per caption (object dtype)
+        """
+        scores = self.score_matrix(texts)
+        labels = np.array(self.categories, dtype=object)
+        if scores.shape[0] == 0:
+            return labels[:0]
+
+        # argmax mengambil indeks pertama saat seri -> sama dengan max(scores, key=scores.get)
+        best_idx = scores.argmax(axis=1)
+        result = labels[best_idx]
+        result[scores[np.arange(scores.shape[0]), best_idx] == 0] = self.default_category
+        return result
+
+
+class ClassificationCache:
+    """Bounded LRU cache of caption -> category, optionally persisted to disk"""
+
+    def __init__(self, max_size=100_000, persist_path=None, save_interval=60.0):
+        """
+        Initialize the cache
+
+        Args:
+            max_size (int): Maximum number of cached captions
+            persist_path (str): Pickle file used across restarts (None = memory only)
+            save_interval (float): Minimum seconds between two non-forced saves
+        """
+        self.max_size = max_size
+        self.persist_path = persist_path
+        self.save_interval = save_interval
+        self._last_save = float('-inf')  # time.monotonic() bisa < save_interval setelah boot
+        self.fingerprint = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    # Lock tidak bisa di-pickle (mis. objek ikut st.cache_data): dibuat ulang saat unpickle
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text_lower, fingerprint):
+        """Hash of the normalized caption plus the dictionary fingerprint"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text_lower.encode('utf-8', errors='surrogatepass'))
+        return digest.digest()
+
+    def _check_fingerprint(self, fingerprint):
+        # Kamus berubah -> semua entri lama tidak berlaku lagi
+        if fingerprint != self.fingerprint:
+            self._entries.clear()
+            self.fingerprint = fingerprint
+            self._dirty = True
+
+    def get(self, text_lower, fingerprint):
+        """Return the cached category or None"""
+        key = self.make_key(text_lower, fingerprint)
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            label = self._entries.get(key)
+            if label is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return label
+
+    def put(self, text_lower, fingerprint, label):
+        """Store a category, evicting the least recently used entries"""
+        key = self.make_key(text_lower, fingerprint)
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            self._entries[key] = label
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._dirty = True
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._dirty = True
+
+    def stats(self):
+        """
+        Get cache counters
+
+        Returns:
+            dict: size, hits, misses, evictions and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def load(self):
+        """Load persisted entries (silently ignored if missing or unreadable)"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return False
+        try:
+            with open(self.persist_path, 'rb') as f:
+                payload = pickle.load(f)
+            with self._lock:
+                self.fingerprint = payload['fingerprint']
+                self._entries = OrderedDict(payload['entries'][-self.max_size:])
+                self._dirty = False
+            return True
+        except Exception as e:
+            print(f"Error loading classification cache: {str(e)}")
+            return False
+
+    def save(self, force=False):
+        """
+        Persist entries to disk if anything changed since the last save
+
+        Args:
+            force (bool): Ignore save_interval (e.g. at interpreter exit)
+
+        Returns:
+            bool: True if the file was written
+        """
+        if not self.persist_path or not self._dirty:
+            return False
+        if not force and time.monotonic() - self._last_save < self.save_interval:
+            return False  # Ditunda; tetap dirty sampai save berikutnya / saat exit
+        tmp_path = None
+        try:
+            with self._lock:
+                payload = {'fingerprint': self.fingerprint, 'entries': list(self._entries.items())}
+                self._dirty = False
+                self._last_save = time.monotonic()
+            directory = os.path.dirname(self.persist_path)
+            os.makedirs(directory, exist_ok=True)
+            # File sementara unik per proses/penulisan agar dua proses tidak saling menimpa
+            with tempfile.NamedTemporaryFile(dir=directory, prefix='.classification_cache-',
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.persist_path)
+            return True
+        except Exception as e:
+            print(f"Error saving classification cache: {str(e)}")
+            self._dirty = True
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+
+# Singleton instance
+_classification_cache = None
+
+def get_classification_cache(persist_path=None, max_size=100_000):
+    """Get or create the shared classification cache"""
+    global _classification_cache
+    if _classification_cache is None:
+        _classification_cache = ClassificationCache(max_size=max_size, persist_path=persist_path)
+        # Sisa entri yang ditunda (save_interval) ditulis saat proses selesai
+        atexit.register(_classification_cache.save, force=True)
+    return _classification_cache
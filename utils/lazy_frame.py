@@ -0,0 +1,130 @@
+"""
+Lazy Frame Module
+DataFrame whose alias / derived columns are computed when read instead of stored
+"""
+import pandas as pd
+
+
+class LazyFrame(pd.DataFrame):
+    """
+    DataFrame with a registry of lazy columns: name -> source column name (alias,
+    served as a view of the source) or callable(frame) -> pd.Series (derived).
+    A lazy column is only computed when it is read and never stored, so
+    it costs no memory or load time until a consumer actually asks for it.
+    Lazy columns resolve through df[name], df[[...]], df.get(name), name in df,
+    df.loc[rows, name] and df.name; they are not listed in df.columns (see
+    lazy_columns) and positional access (iloc) only sees stored columns.
+    Stored columns always win over lazy ones with the same name.
+    """
+
+    # Ikut disalin ke hasil slicing/copy (iloc, mask, copy, assign, ...)
+    _metadata = ['_lazy_columns']
+    _lazy_columns = None
+
+    @property
+    def _constructor(self):
+        return LazyFrame
+
+    @classmethod
+    def wrap(cls, df, lazy_columns):
+        """
+        Wrap a DataFrame (no data copy) and attach the lazy column registry
+
+        Args:
+            df (pd.DataFrame): Stored columns
+            lazy_columns (dict): name -> source column (str) or callable(frame)
+
+        Returns:
+            LazyFrame: Frame serving the lazy columns on read
+        """
+        frame = cls(df)
+        frame._lazy_columns = dict(lazy_columns)
+        return frame
+
+    def _is_lazy(self, key):
+        return (isinstance(key, str) and bool(self._lazy_columns)
+                and key in self._lazy_columns and key not in self.columns)
+
+    def _derive(self, name):
+        spec = self._lazy_columns[name]
+        if isinstance(spec, str):
+            # Alias: view kolom sumber (copy-on-write, tanpa salinan data)
+            values = pd.DataFrame.__getitem__(self, spec)
+        else:
+            values = spec(self)
+        return values.rename(name)
+
+    def _with_lazy(self, key):
+        """Frame with the lazy columns referenced by a column key assigned (None if there are none)"""
+        names = key if isinstance(key, list) else [key]
+        missing = {k: self._derive(k) for k in names if self._is_lazy(k)}
+        if not missing:
+            return None
+        return pd.DataFrame(self).assign(**missing)
+
+    def __getitem__(self, key):
+        if self._is_lazy(key):
+            return self._derive(key)
+        if isinstance(key, list):
+            frame = self._with_lazy(key)
+            if frame is not None:
+                return frame[key]
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or self._is_lazy(key)
+
+    def __getattr__(self, name):
+        # Akses atribut (df.Jam_Posting) seperti kolom tersimpan
+        if not name.startswith('_') and self._is_lazy(name):
+            return self._derive(name)
+        return super().__getattr__(name)
+
+    @property
+    def loc(self):
+        return _LazyLocIndexer(self)
+
+    @property
+    def lazy_columns(self):
+        """Names of lazy columns not shadowed by stored columns"""
+        return [name for name in (self._lazy_columns or {}) if name not in self.columns]
+
+    def materialize(self, columns=None):
+        """
+        Plain DataFrame with lazy columns written out (e.g. for CSV/Excel export):
+        an alias is placed right after its source column, derived columns at the end
+
+        Args:
+            columns (list): Lazy columns to include (None = all)
+
+        Returns:
+            pd.DataFrame: Stored + materialized columns
+        """
+        frame = pd.DataFrame(self)
+        for name in self.lazy_columns:
+            if columns is not None and name not in columns:
+                continue
+            spec = self._lazy_columns[name]
+            position = frame.columns.get_loc(spec) + 1 if isinstance(spec, str) and spec in frame.columns else len(frame.columns)
+            frame.insert(position, name, self._derive(name))
+        return frame
+
+
+class _LazyLocIndexer:
+    """df.loc that also resolves lazy columns in the column part of the key"""
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def _pandas_loc(self, frame=None):
+        return pd.DataFrame.loc.fget(self._frame if frame is None else frame)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            frame = self._frame._with_lazy(key[1]) if isinstance(key[1], (str, list)) else None
+            if frame is not None:
+                return self._pandas_loc(frame)[key]
+        return self._pandas_loc()[key]
+
+    def __setitem__(self, key, value):
+        self._pandas_loc()[key] = value
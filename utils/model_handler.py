@@ -2,6 +2,15 @@
 Model Handler Module
 Handles loading the trained model and making predictions
 """
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import joblib
 import pandas as pd
 import numpy as np
@@ -9,44 +18,395 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from utils.tree_engine import CompiledForest, FORMAT_VERSION
+from utils.prediction_cache import get_prediction_cache
+
+# Jumlah proses prediksi paralel untuk halaman Prediksi Massal (lihat configured_workers)
+PREDICT_WORKERS_ENV = 'TIKTOK_PREDICT_WORKERS'
+
 
 class ModelHandler:
     """Handle model loading and predictions"""
 
-    def __init__(self, model_path="models/tiktok_model_final_CLASSIFIER.pkl"):
+    # Batas baris untuk engine terkompilasi; batch lebih besar lebih cepat di jalur Cython sklearn
+    COMPILED_MAX_ROWS = 2048
+
+    # Jumlah maksimum rencana penyelarasan kolom (satu per skema input) yang disimpan
+    MAX_ALIGNMENT_PLANS = 32
+
+    # Baris minimum per shard saat prediksi paralel (batch lebih kecil tetap 1 core)
+    MIN_SHARD_ROWS = 5_000
+
+    def __init__(self, model_path="models/tiktok_model_final_CLASSIFIER.pkl", use_compiled=True, use_cache=True,
+                 n_workers=1, min_shard_rows=None):
         """
         Initialize model handler
 
         Args:
             model_path (str): Path to the trained model file
+            use_compiled (bool): Flatten the tree ensemble into NumPy node arrays
+                for low-latency inference (falls back to sklearn if unsupported)
+            use_cache (bool): Reuse probabilities of previously scored feature vectors
+            n_workers (int): Processes for parallel batch scoring (opt-in; 1 = off, None = all CPU cores).
+                The pool uses the 'spawn' start method and is reused until shutdown(); workers only
+                memory-map the compiled artifact (no parallel scoring without it)
+            min_shard_rows (int): Minimum rows per worker shard (None = MIN_SHARD_ROWS)
         """
         self.model_path = model_path
-        self.model = None
-        self.feature_names = None
-        self.load_model()
+        self.use_compiled = use_compiled
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.min_shard_rows = min_shard_rows or self.MIN_SHARD_ROWS
+        self.engine = None
+        self.model_fingerprint = None
+        self._model = None
+        self._meta = None
+        self._model_stat = None
+        self._alignment_plans = {}
+        self._executor = None       # Pool prediksi paralel (dibuat saat pertama dipakai)
+        self._executor_lock = threading.Lock()
+        self._shutdown_registered = False
+        self._artifact_path = None  # Artefak node array yang dimuat worker (None = paralel nonaktif)
+        self.prediction_cache = get_prediction_cache() if use_cache else None
+        # Model tidak dimuat di sini; dimuat saat pertama kali dibutuhkan (prediksi / info model)
+
+    # Pool & lock tidak ikut di-pickle
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        del state['_executor_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
+        self._shutdown_registered = False
+
+    @property
+    def model(self):
+        """Fitted sklearn model, unpickled only when first needed"""
+        if self._model is None and self._ensure_loaded() and self._model is None:
+            try:
+                self._model = joblib.load(self.model_path, mmap_mode='r')
+            except Exception as e:
+                print(f"Error loading model: {str(e)}")
+        return self._model
+
+    @property
+    def feature_names(self):
+        """Model feature names (read from the compiled artifact when available)"""
+        # Tanpa os.stat: dibaca di jalur per-baris, file model dicek sekali per prediksi (_align)
+        if not self._ensure_loaded():
+            return None
+        return self._meta['feature_names']
+
+    def _ensure_loaded(self, refresh=False):
+        """
+        Load on first use; with refresh=True also reload if the model file changed
+        (done once per prediction / info call, not on every attribute read)
+        """
+        if self._meta is None:
+            return self.load_model()
+        if refresh:
+            self._refresh_model_if_changed()
+        return self._meta is not None
+
+    def _artifact_dir(self, fingerprint):
+        model_path = Path(self.model_path)
+        return model_path.parent / '.cache' / f"{model_path.stem}-{fingerprint[:16]}-v{FORMAT_VERSION}"
+
+    @staticmethod
+    def _describe_model(model):
+        """Metadata needed by the pages without unpickling the model"""
+        meta = {'model_type': type(model).__name__}
+
+        # Get feature names
+        if hasattr(model, 'feature_names_in_'):
+            meta['feature_names'] = [str(name) for name in model.feature_names_in_]
+        else:
+            # Default feature names from inspection
+            meta['feature_names'] = [
+                'Suka', 'Komentar', 'Dibagikan', 'Durasi_Video', 'Jumlah_Hashtag',
+                'Jam_Sejak_Publikasi', 'Panjang_Caption', 'Hari_Upload', 'Jam_Upload',
+                'Format_Konten_Video', 'Tipe_Konten_Lainnya', 'Tipe_Konten_OOTD',
+                'Tipe_Konten_Tutorial', 'Tipe_Konten_Vlog', 'Tipe_Audio_Audio Lainnya',
+                'Tipe_Audio_Audio Original', 'Tipe_Audio_Audio Populer'
+            ]
+
+        for attr in ('n_estimators', 'max_depth'):
+            if hasattr(model, attr):
+                meta[attr] = getattr(model, attr)
+        if hasattr(model, 'classes_'):
+            meta['classes'] = np.asarray(model.classes_).tolist()
+        if hasattr(model, 'feature_importances_'):
+            meta['feature_importances'] = np.asarray(model.feature_importances_, dtype=np.float64).tolist()
+        return meta
+
+    def _load_artifact(self, artifact_dir):
+        """Memory-map a previously compiled artifact; returns (meta, engine) or (None, None)"""
+        try:
+            with open(artifact_dir / 'model.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            return meta, CompiledForest.load(artifact_dir, mmap_mode='r')
+        except Exception:
+            return None, None
+
+    def _save_artifact(self, artifact_dir, engine, meta):
+        """Write node arrays + metadata atomically and drop artifacts of older model files"""
+        tmp_dir = artifact_dir.with_name(f"{artifact_dir.name}.tmp-{os.getpid()}")
+        try:
+            engine.save(tmp_dir)
+            with open(tmp_dir / 'model.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_dir, artifact_dir)
+        except Exception as e:
+            # Proses lain mungkin sudah menulis artefak yang sama
+            if not artifact_dir.exists():
+                print(f"Error saving compiled model: {str(e)}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        for stale in artifact_dir.parent.glob(f"{Path(self.model_path).stem}-*"):
+            if stale != artifact_dir and '.tmp-' not in stale.name:
+                shutil.rmtree(stale, ignore_errors=True)
 
     def load_model(self):
-        """Load the trained model from file"""
+        """
+        Load the model: memory-map the compiled node arrays if they exist,
+        otherwise unpickle the model, compile it and write the artifact
+        """
         try:
-            self.model = joblib.load(self.model_path)
+            stat = os.stat(self.model_path)
+            with open(self.model_path, 'rb') as f:
+                fingerprint = hashlib.sha1(f.read()).hexdigest()
 
-            # Get feature names
-            if hasattr(self.model, 'feature_names_in_'):
-                self.feature_names = list(self.model.feature_names_in_)
-            else:
-                # Default feature names from inspection
-                self.feature_names = [
-                    'Suka', 'Komentar', 'Dibagikan', 'Durasi_Video', 'Jumlah_Hashtag',
-                    'Jam_Sejak_Publikasi', 'Panjang_Caption', 'Hari_Upload', 'Jam_Upload',
-                    'Format_Konten_Video', 'Tipe_Konten_Lainnya', 'Tipe_Konten_OOTD',
-                    'Tipe_Konten_Tutorial', 'Tipe_Konten_Vlog', 'Tipe_Audio_Audio Lainnya',
-                    'Tipe_Audio_Audio Original', 'Tipe_Audio_Audio Populer'
-                ]
+            self._model = None
+            self._meta = None
+            self.engine = None
+            self._artifact_path = None
+            self._alignment_plans = {}
+            if self.model_fingerprint not in (None, fingerprint):
+                self.shutdown()  # Worker masih memegang model lama
+            self.model_fingerprint = fingerprint
+            self._model_stat = (stat.st_size, stat.st_mtime_ns)
+
+            artifact_dir = self._artifact_dir(fingerprint)
+            meta, engine = self._load_artifact(artifact_dir) if self.use_compiled else (None, None)
+
+            if meta is None:
+                self._model = joblib.load(self.model_path, mmap_mode='r')
+                meta = self._describe_model(self._model)
+                if self.use_compiled:
+                    try:
+                        engine = CompiledForest(self._model)
+                        self._save_artifact(artifact_dir, engine, meta)
+                    except Exception as e:
+                        print(f"Compiled engine unavailable, using sklearn: {str(e)}")
+
+            self._meta = meta
+            self.engine = engine
+            if engine is not None and artifact_dir.exists():
+                self._artifact_path = str(artifact_dir)
             return True
         except Exception as e:
             print(f"Error loading model: {str(e)}")
             return False
 
+    def _refresh_model_if_changed(self):
+        """Reload the model when the file on disk changed since it was loaded"""
+        try:
+            stat = os.stat(self.model_path)
+        except OSError:
+            return
+        if (stat.st_size, stat.st_mtime_ns) != self._model_stat:
+            self.load_model()
+
+    def _use_engine(self, n_rows):
+        """Whether the compiled engine should score a batch of n_rows"""
+        return self.engine is not None and n_rows <= self.COMPILED_MAX_ROWS
+
+    def _alignment_plan(self, columns):
+        """
+        Column-alignment plan for an input schema (cached per column tuple)
+
+        Args:
+            columns (iterable): Column names of the incoming features
+
+        Returns:
+            tuple: (source positions, model feature positions) as index arrays
+        """
+        key = tuple(columns)
+        plan = self._alignment_plans.get(key)
+        if plan is None:
+            # Kolom duplikat: pakai kemunculan pertama
+            position = {}
+            for i, col in enumerate(key):
+                position.setdefault(col, i)
+
+            src, dst = [], []
+            for j, name in enumerate(self.feature_names):
+                if name in position:
+                    src.append(position[name])
+                    dst.append(j)
+            plan = (np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp))
+
+            if len(self._alignment_plans) >= self.MAX_ALIGNMENT_PLANS:
+                self._alignment_plans.clear()
+            self._alignment_plans[key] = plan
+        return plan
+
+    def _align(self, features):
+        """
+        Write features into a new float32 matrix in self.feature_names order
+        (absent features are 0; the caller's object is never modified)
+
+        Args:
+            features (pd.DataFrame or dict): Features for prediction
+
+        Returns:
+            np.ndarray: (n_rows, n_features) float32 matrix
+        """
+        if not self._ensure_loaded(refresh=True):
+            raise ValueError("Model could not be loaded")
+        n_features = len(self.feature_names)
+        if isinstance(features, dict):
+            src, dst = self._alignment_plan(features.keys())
+            values = list(features.values())
+            X = np.zeros((1, n_features), dtype=np.float32)
+            X[0, dst] = np.asarray([values[i] for i in src], dtype=np.float64)
+            return X
+
+        src, dst = self._alignment_plan(features.columns)
+        X = np.zeros((len(features), n_features), dtype=np.float32)
+        if len(src):
+            # Konversi via float64 lalu float32, sama seperti validasi input sklearn
+            X[:, dst] = features.iloc[:, src].to_numpy(dtype=np.float64)
+        return X
+
+    def set_workers(self, n_workers):
+        """
+        Change the number of scoring processes (the running pool is stopped if it differs)
+
+        Args:
+            n_workers (int): Processes for parallel batch scoring (1 = off, None = all CPU cores)
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers != self.n_workers:
+            self.shutdown()
+            self.n_workers = n_workers
+
+    def _n_shards(self, n_rows):
+        """Number of worker shards for a batch (1 = score in this process)"""
+        # Worker hanya memakai artefak terkompilasi; tanpa artefak batch dihitung di proses ini
+        if self._artifact_path is None:
+            return 1
+        return max(1, min(self.n_workers, n_rows // self.min_shard_rows))
+
+    def _sklearn_proba(self, X):
+        """predict_proba of the sklearn model on the aligned matrix"""
+        # Dibungkus DataFrame bernama (tanpa salinan): sklearn mengecek nama fitur tanpa UserWarning
+        return self.model.predict_proba(pd.DataFrame(X, columns=self.feature_names, copy=False))
+
+    def _predict_proba(self, X):
+        """Class probabilities from one pass over the ensemble"""
+        if self._n_shards(len(X)) > 1:
+            return self._predict_proba_parallel(X)
+        if self._use_engine(len(X)):
+            return self.engine.predict_proba(X)
+        return self._sklearn_proba(X)
+
+    def _get_executor(self):
+        """Process pool shared by all parallel calls (created once, 'spawn' start method)"""
+        with self._executor_lock:
+            if self._executor is None:
+                # Spawn (bukan fork): aman dari lock milik thread lain di server Streamlit.
+                # Worker hanya me-memory-map node array artefak (model sklearn tidak pernah dimuat)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.n_workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker, initargs=(self._artifact_path,)
+                )
+                if not self._shutdown_registered:
+                    atexit.register(self.shutdown)
+                    self._shutdown_registered = True
+            return self._executor
+
+    def shutdown(self):
+        """Stop the worker pool (a new one is created on the next parallel call)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _predict_proba_parallel(self, X):
+        """
+        Shard rows across the process pool; results are stacked in the original row order
+
+        Args:
+            X (np.ndarray): Aligned feature matrix from _align
+
+        Returns:
+            np.ndarray: (n_rows, n_classes) probabilities
+        """
+        shards = np.array_split(X, self._n_shards(len(X)))
+        try:
+            return np.vstack(list(self._get_executor().map(_score_shard, shards)))
+        except BrokenProcessPool as e:
+            # Worker mati (mis. kehabisan memori): pool dibuang, batch dihitung di proses ini
+            print(f"Parallel scoring failed, scoring in-process: {str(e)}")
+            self.shutdown()
+            if self._use_engine(len(X)):
+                return self.engine.predict_proba(X)
+            return self._sklearn_proba(X)
+
+    def _predict_proba_cached(self, X):
+        """
+        Class probabilities, scoring only rows missing from the prediction cache
+
+        Args:
+            X (np.ndarray): Aligned feature matrix from _align
+
+        Returns:
+            np.ndarray: (n_rows, n_classes) probabilities
+        """
+        cache = self.prediction_cache
+        if cache is None or self.model_fingerprint is None:
+            return self._predict_proba(X)
+
+        fingerprint = self.model_fingerprint
+        keys = [cache.make_key(row, fingerprint) for row in X]
+        cached = cache.get_many(keys, fingerprint)
+
+        # Baris yang belum ada di cache (duplikat dalam batch cukup dihitung sekali)
+        pending = {}
+        for i, probabilities in enumerate(cached):
+            if probabilities is None:
+                pending.setdefault(keys[i], i)
+
+        if pending:
+            rows = np.fromiter(pending.values(), dtype=np.intp, count=len(pending))
+            scored = self._predict_proba(X[rows])
+            fresh = {key: scored[j].copy() for j, key in enumerate(pending)}
+            cache.put_many(fresh.items(), fingerprint)
+            cached = [fresh[keys[i]] if probabilities is None else probabilities
+                      for i, probabilities in enumerate(cached)]
+
+        return np.vstack(cached)
+
+    def _predict_with_proba(self, X):
+        """
+        Run the ensemble once and derive labels from the probabilities
+
+        Args:
+            X (np.ndarray): Aligned feature matrix from _align
+
+        Returns:
+            tuple: (labels, probabilities)
+        """
+        probabilities = self._predict_proba_cached(X)
+        # Sama dengan aturan predict() sklearn: kelas dengan probabilitas tertinggi
+        classes = self.engine.classes_ if self.engine is not None else np.asarray(self.model.classes_)
+        labels = classes.take(np.argmax(probabilities, axis=1), axis=0)
+        return labels, probabilities
+
     def predict(self, features):
         """
         Make a prediction
@@ -58,21 +418,13 @@ class ModelHandler:
             tuple: (prediction, probability)
         """
         try:
-            # Convert dict to DataFrame if needed
-            if isinstance(features, dict):
-                features = pd.DataFrame([features])
-
-            # Ensure all required features are present
-            for feature in self.feature_names:
-                if feature not in features.columns:
-                    features[feature] = 0
+            # Align features to model order (missing features -> 0)
+            X = self._align(features)
 
-            # Order features correctly
-            features = features[self.feature_names]
-
-            # Make prediction
-            prediction = self.model.predict(features)[0]
-            probabilities = self.model.predict_proba(features)[0]
+            # Make prediction (one pass over the ensemble)
+            predictions, probabilities = self._predict_with_proba(X)
+            prediction = predictions[0]
+            probabilities = probabilities[0]
             confidence = probabilities[prediction]
 
             return prediction, confidence, probabilities
@@ -91,23 +443,78 @@ class ModelHandler:
             tuple: (predictions, probabilities)
         """
         try:
-            # Ensure all required features are present
-            for feature in self.feature_names:
-                if feature not in features_df.columns:
-                    features_df[feature] = 0
-
-            # Order features correctly
-            features_df = features_df[self.feature_names]
+            # Align features to model order (missing features -> 0)
+            X = self._align(features_df)
 
-            # Make predictions
-            predictions = self.model.predict(features_df)
-            probabilities = self.model.predict_proba(features_df)
+            # Make predictions (one pass over the ensemble)
+            predictions, probabilities = self._predict_with_proba(X)
 
             return predictions, probabilities
         except Exception as e:
             print(f"Error making batch prediction: {str(e)}")
             return None, None
 
+    def _explainer(self):
+        """Compiled forest used for contributions (built on demand if the engine is disabled)"""
+        if self.engine is None and self.model is not None:
+            self.engine = CompiledForest(self.model)
+        return self.engine
+
+    def _positive_class_index(self):
+        """Column of the 'Trending' class (label 1) in probability outputs"""
+        classes = self._meta.get('classes', []) if self._ensure_loaded() else []
+        return classes.index(1) if 1 in classes else -1
+
+    def get_contributions(self, features):
+        """
+        Per-prediction feature contributions toward the Trending class
+        (Saabas-style, from the decision path of every tree)
+
+        Args:
+            features (pd.DataFrame or dict): Features for prediction
+
+        Returns:
+            tuple: (bias, pd.DataFrame of contributions with one column per model feature);
+                   bias + row sum equals the Trending probability. (None, None) on error.
+        """
+        try:
+            X = self._align(features)
+            bias, contributions = self._explainer().contributions(X)
+            class_idx = self._positive_class_index()
+            index = features.index if isinstance(features, pd.DataFrame) else None
+            contributions_df = pd.DataFrame(contributions[:, :, class_idx], columns=self.feature_names, index=index)
+            return float(bias[class_idx]), contributions_df
+        except Exception as e:
+            print(f"Error computing contributions: {str(e)}")
+            return None, None
+
+    def get_top_contributions(self, features, top_n=3):
+        """
+        Top features per row ranked by absolute contribution
+
+        Args:
+            features (pd.DataFrame or dict): Features for prediction
+            top_n (int): Number of features per row
+
+        Returns:
+            pd.DataFrame: Faktor_Utama_1..top_n columns formatted as 'feature (+0.123)', or None on error
+        """
+        _, contributions_df = self.get_contributions(features)
+        if contributions_df is None:
+            return None
+
+        values = contributions_df.to_numpy()
+        top_n = min(top_n, values.shape[1])
+        order = np.argsort(-np.abs(values), axis=1, kind='stable')[:, :top_n]
+        names = np.asarray(self.feature_names, dtype=object)
+
+        top = {}
+        for rank in range(top_n):
+            cols = order[:, rank]
+            picked = values[np.arange(len(values)), cols]
+            top[f'Faktor_Utama_{rank + 1}'] = [f"{name} ({value:+.3f})" for name, value in zip(names[cols], picked)]
+        return pd.DataFrame(top, index=contributions_df.index)
+
     def get_feature_importance(self):
         """
         Get feature importance from the model
@@ -116,8 +523,8 @@ class ModelHandler:
             pd.DataFrame: Feature importance sorted by value
         """
         try:
-            if hasattr(self.model, 'feature_importances_'):
-                importance = self.model.feature_importances_
+            if self._ensure_loaded(refresh=True) and 'feature_importances' in self._meta:
+                importance = np.asarray(self._meta['feature_importances'])
                 feature_importance = pd.DataFrame({
                     'feature': self.feature_names,
                     'importance': importance
@@ -137,28 +544,69 @@ class ModelHandler:
         Returns:
             dict: Model information
         """
+        if not self._ensure_loaded(refresh=True):
+            return {}
+
+        meta = self._meta
         info = {
-            'model_type': type(self.model).__name__,
-            'n_features': len(self.feature_names),
-            'features': self.feature_names
+            'model_type': meta['model_type'],
+            'n_features': len(meta['feature_names']),
+            'features': meta['feature_names']
         }
 
-        if hasattr(self.model, 'n_estimators'):
-            info['n_estimators'] = self.model.n_estimators
-        if hasattr(self.model, 'max_depth'):
-            info['max_depth'] = self.model.max_depth
-        if hasattr(self.model, 'classes_'):
-            info['classes'] = list(self.model.classes_)
+        for key in ('n_estimators', 'max_depth', 'classes'):
+            if key in meta:
+                info[key] = meta[key]
 
         return info
 
 
+# Engine di dalam proses worker (prediksi paralel)
+_worker_engine = None
+
+def _init_worker(artifact_path):
+    """Process-pool initializer: memory-map the compiled node arrays (the sklearn pickle is never loaded)"""
+    global _worker_engine
+    _worker_engine = CompiledForest.load(artifact_path, mmap_mode='r')
+
+def _score_shard(X):
+    """Score one shard inside a worker with the compiled engine (any shard size)"""
+    return _worker_engine.predict_proba(X)
+
+
+def configured_workers():
+    """
+    Scoring processes configured through the PREDICT_WORKERS_ENV environment variable
+
+    Returns:
+        int: 1 if unset or invalid (serial), the CPU count for 'auto', otherwise the given number
+    """
+    value = os.environ.get(PREDICT_WORKERS_ENV, '').strip().lower()
+    if not value:
+        return 1
+    if value == 'auto':
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(f"Invalid {PREDICT_WORKERS_ENV}={value!r}, scoring serially")
+        return 1
+
+
 # Singleton instance
 _model_handler = None
 
-def get_model_handler():
-    """Get or create model handler instance"""
+def get_model_handler(n_workers=None):
+    """
+    Get or create model handler instance
+
+    Args:
+        n_workers (int): Scoring processes for batch prediction (None = keep the current
+            setting; a new handler then starts serial)
+    """
     global _model_handler
     if _model_handler is None:
-        _model_handler = ModelHandler()
+        _model_handler = ModelHandler(n_workers=n_workers or 1)
+    elif n_workers is not None:
+        _model_handler.set_workers(n_workers)
     return _model_handler
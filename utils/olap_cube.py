@@ -0,0 +1,232 @@
+"""
+OLAP Cube Module
+Pre-aggregated sums, counts and sums of squares for dashboard rollups
+"""
+import numpy as np
+import pandas as pd
+
+# Dimensi cube (nama kolom sama dengan kolom hasil DataProcessor.load_data)
+DIMENSIONS = ['authorMeta.name', 'upload_date', 'upload_hour', 'upload_day', 'content_type', 'audio_type']
+
+# Metrik yang disimpan sebagai sum & sum of squares
+MEASURES = ['playCount', 'diggCount', 'commentCount', 'shareCount', 'engagement_rate', 'videoMeta.duration']
+
+
+class OlapCube:
+    """Pre-aggregated cube: one cell per distinct combination of DIMENSIONS"""
+
+    def __init__(self, cells):
+        """
+        Args:
+            cells (pd.DataFrame): Dimension columns + aggregated measure columns
+        """
+        self.cells = cells
+
+    @staticmethod
+    def _aggregations(columns):
+        agg = {}
+        for col in columns:
+            if col.endswith('_max'):
+                agg[col] = 'max'
+            elif col.endswith('_min'):
+                agg[col] = 'min'
+            elif col not in DIMENSIONS:
+                agg[col] = 'sum'
+        return agg
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Build the cube from processed rows
+
+        Args:
+            df (pd.DataFrame): Output of DataProcessor.load_data
+
+        Returns:
+            OlapCube: Aggregated cube
+        """
+        frame = pd.DataFrame(index=df.index)
+        for dim in DIMENSIONS:
+            if dim == 'upload_date':
+                # Tanggal disimpan sebagai timestamp harian (lebih cepat dari objek date)
+                frame[dim] = df['createTimeISO'].dt.normalize()
+            elif dim in df.columns:
+                frame[dim] = df[dim]
+            else:
+                frame[dim] = np.nan
+
+        frame['n_rows'] = np.int64(1)
+        if 'webVideoUrl' in df.columns:
+            frame['n_videos'] = df['webVideoUrl'].notna().astype(np.int64)
+        else:
+            frame['n_videos'] = np.int64(1)
+
+        for measure in MEASURES:
+            values = df[measure].astype(np.float64)
+            frame[f'{measure}_sum'] = values
+            frame[f'{measure}_sumsq'] = values * values
+        frame['playCount_max'] = df['playCount'].astype(np.float64)
+        frame['createTimeISO_min'] = df['createTimeISO']
+        frame['createTimeISO_max'] = df['createTimeISO']
+
+        cells = frame.groupby(DIMENSIONS, dropna=False, sort=False, observed=True).agg(
+            cls._aggregations(frame.columns)
+        ).reset_index()
+        return cls(cells)
+
+    def merge(self, other):
+        """
+        Combine two cubes (e.g. existing data + newly appended rows)
+
+        Returns:
+            OlapCube: Merged cube
+        """
+        combined = pd.concat([self.cells, other.cells], ignore_index=True)
+        cells = combined.groupby(DIMENSIONS, dropna=False, sort=False, observed=True).agg(
+            self._aggregations(combined.columns)
+        ).reset_index()
+        return OlapCube(cells)
+
+    def slice(self, author=None, start_date=None, end_date=None, year=None, month_name=None):
+        """
+        Filter cube cells (same filters as the Dashboard sidebar)
+
+        Args:
+            author (str): Author name (None = all authors)
+            start_date, end_date (datetime.date): Inclusive date range
+            year (int): Upload year
+            month_name (str): English month name (e.g. 'January')
+
+        Returns:
+            OlapCube: Sliced cube
+        """
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        if author is not None:
+            mask &= (cells['authorMeta.name'] == author).to_numpy()
+
+        dates = cells['upload_date']
+        if start_date is not None:
+            mask &= (dates >= pd.Timestamp(start_date, tz=dates.dt.tz)).to_numpy()
+        if end_date is not None:
+            mask &= (dates <= pd.Timestamp(end_date, tz=dates.dt.tz)).to_numpy()
+        if year is not None:
+            mask &= (dates.dt.year == year).to_numpy()
+        if month_name is not None:
+            mask &= (dates.dt.month_name() == month_name).to_numpy()
+
+        if mask.all():
+            return self
+        return OlapCube(cells[mask])
+
+    @property
+    def empty(self):
+        return self.cells.empty
+
+    def rollup(self, by=None):
+        """
+        Roll the cube up to the given dimension(s)
+
+        Args:
+            by (str or list): Dimension(s) to keep (None = grand total)
+
+        Returns:
+            pd.DataFrame or pd.Series: Aggregated measures
+        """
+        agg = self._aggregations(self.cells.columns)
+        if by is None:
+            return pd.Series({col: getattr(self.cells[col], how)() for col, how in agg.items()})
+        return self.cells.groupby(by, observed=True).agg(agg)
+
+    def mean_by(self, by, measure='playCount'):
+        """Mean of a measure per group (sum / row count)"""
+        rolled = self.rollup(by)
+        result = rolled[f'{measure}_sum'] / rolled['n_rows']
+        result.name = measure
+        return result
+
+    def std_by(self, by, measure='playCount'):
+        """Sample standard deviation per group, from sums and sums of squares"""
+        rolled = self.rollup(by)
+        n = rolled['n_rows']
+        total = rolled[f'{measure}_sum']
+        variance = (rolled[f'{measure}_sumsq'] - total * total / n) / (n - 1).where(n > 1)
+        result = np.sqrt(variance.clip(lower=0))
+        result.name = measure
+        return result
+
+    def totals(self):
+        """
+        Grand totals used by the summary metrics
+
+        Returns:
+            dict: row count, sums, means and max/min
+        """
+        if self.cells.empty:
+            return {}
+        total = self.rollup()
+        n = total['n_rows']
+        stats = {'count': int(n), 'playCount_max': total['playCount_max'],
+                 'createTimeISO_min': total['createTimeISO_min'],
+                 'createTimeISO_max': total['createTimeISO_max']}
+        for measure in MEASURES:
+            stats[f'{measure}_sum'] = total[f'{measure}_sum']
+            stats[f'{measure}_mean'] = total[f'{measure}_sum'] / n if n else 0
+        return stats
+
+
+class RunningMoments:
+    """
+    Streaming mean / co-moment accumulator (Chan et al. pairwise merge),
+    numerically stable for large counts; gives the same correlation matrix
+    as DataFrame.corr() without holding the rows
+    """
+
+    def __init__(self, columns):
+        """
+        Args:
+            columns (list): Numeric columns to track
+        """
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+
+    def update(self, df):
+        """Merge the moments of one chunk"""
+        values = df[self.columns].to_numpy(dtype=np.float64)
+        n_b = len(values)
+        if n_b == 0:
+            return
+        mean_b = values.mean(axis=0)
+        centered = values - mean_b
+        comoment_b = centered.T @ centered
+
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.comoment = self.comoment + comoment_b + np.outer(delta, delta) * (self.n * n_b / n)
+        self.mean = self.mean + delta * (n_b / n)
+        self.n = n
+
+    def corr(self):
+        """
+        Returns:
+            pd.DataFrame: Pearson correlation matrix (NaN for constant columns)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.sqrt(np.diag(self.comoment))
+            matrix = self.comoment / np.outer(scale, scale)
+        np.fill_diagonal(matrix, np.where(scale > 0, 1.0, np.nan))
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def to_dict(self):
+        return {'columns': self.columns, 'n': self.n, 'mean': self.mean.tolist(), 'comoment': self.comoment.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        moments = cls(data['columns'])
+        moments.n = data['n']
+        moments.mean = np.asarray(data['mean'], dtype=np.float64)
+        moments.comoment = np.asarray(data['comoment'], dtype=np.float64)
+        return moments
@@ -0,0 +1,114 @@
+"""
+Prediction Cache Module
+Bounded LRU cache of model probabilities keyed by aligned feature vectors
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class PredictionCache:
+    """Bounded LRU cache of feature vector -> class probabilities"""
+
+    def __init__(self, max_size=50_000):
+        """
+        Initialize the cache
+
+        Args:
+            max_size (int): Maximum number of cached feature vectors
+        """
+        self.max_size = max_size
+        self.fingerprint = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(row, fingerprint):
+        """
+        Hash of one aligned feature vector plus the model fingerprint
+
+        Args:
+            row (np.ndarray): One row of the aligned float32 matrix
+            fingerprint (str): Model file fingerprint
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(row.tobytes())
+        return digest.digest()
+
+    def _check_fingerprint(self, fingerprint):
+        # Model berubah -> semua prediksi lama tidak berlaku lagi
+        if fingerprint != self.fingerprint:
+            self._entries.clear()
+            self.fingerprint = fingerprint
+
+    def get_many(self, keys, fingerprint):
+        """
+        Look up a whole batch under one lock
+
+        Returns:
+            list: Cached probabilities per key (None for misses)
+        """
+        results = []
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            for key in keys:
+                probabilities = self._entries.get(key)
+                if probabilities is None:
+                    self.misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                results.append(probabilities)
+        return results
+
+    def put_many(self, items, fingerprint):
+        """
+        Store (key, probabilities) pairs, evicting the least recently used entries
+        """
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            for key, probabilities in items:
+                self._entries[key] = probabilities
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Get cache counters
+
+        Returns:
+            dict: size, hits, misses, evictions and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+# Singleton instance (dipakai bersama oleh semua sesi Streamlit dalam satu proses)
+_prediction_cache = None
+
+def get_prediction_cache(max_size=50_000):
+    """Get or create the shared prediction cache"""
+    global _prediction_cache
+    if _prediction_cache is None:
+        _prediction_cache = PredictionCache(max_size=max_size)
+    return _prediction_cache
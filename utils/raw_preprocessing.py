@@ -0,0 +1,166 @@
+"""
+Raw Preprocessing Module
+Convert raw TikTok scraper exports into model-ready features (Preproses Data page)
+"""
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.data_processor import get_data_processor
+from utils.lazy_frame import LazyFrame
+
+# Regex fitur caption (dipakai per nilai maupun per kolom)
+HASHTAG_PATTERN = re.compile(r'#\w+')
+COLLAB_PATTERN = re.compile(r'collab|ft', re.IGNORECASE)
+
+# Kolom Audio_X halaman ini (tanpa 'Tanpa Audio', berbeda dari fitur Prediksi Tunggal)
+PAGE_AUDIO_TYPES = ['Audio Original', 'Audio Populer', 'Audio Lainnya']
+
+
+def extract_hashtags(text):
+    """Extract hashtags from caption"""
+    if pd.isna(text):
+        return []
+    hashtags = HASHTAG_PATTERN.findall(str(text))
+    return hashtags
+
+
+def count_hashtags(text):
+    """Count number of hashtags"""
+    return len(extract_hashtags(text))
+
+
+def calculate_hours_since_publish(upload_time, reference_time=None):
+    """Calculate hours since publish"""
+    from datetime import timezone
+
+    if reference_time is None:
+        reference_time = datetime.now(timezone.utc)
+
+    # Ensure both datetimes have compatible timezone information
+    if upload_time.tzinfo is not None and reference_time.tzinfo is None:
+        reference_time = reference_time.replace(tzinfo=timezone.utc)
+    elif upload_time.tzinfo is None and reference_time.tzinfo is not None:
+        upload_time = upload_time.replace(tzinfo=timezone.utc)
+
+    time_diff = reference_time - upload_time
+    hours = time_diff.total_seconds() / 3600
+    return max(0, hours)
+
+
+# --- CORE PREPROCESSING FUNCTION (UPDATED) ---
+def preprocess_raw_data(df_raw, reference_time=None, data_processor=None):
+    """
+    Preprocess raw TikTok data into model-ready features
+    Menggunakan logika DataProcessor agar konsisten dengan Notebook Langkah 4
+
+    Args:
+        df_raw (pd.DataFrame): Raw FreeTikTokScraper export
+        reference_time (datetime): Reference for Jam_Sejak_Publikasi (None = now, UTC)
+        data_processor (DataProcessor): Source of the category / audio logic (None = get_data_processor())
+
+    Returns:
+        LazyFrame: Engineered features; Jam_Upload, Tipe_Konten_X and Tipe_Audio_X are lazy aliases
+    """
+    dp = data_processor if data_processor is not None else get_data_processor()
+    df = df_raw.copy()
+
+    # 1. Basic engagement metrics & Rename
+    df['Suka'] = df['diggCount']
+    df['Komentar'] = df['commentCount']
+    df['Dibagikan'] = df['shareCount']
+    df['Durasi_Video'] = df['videoMeta.duration']
+
+    # 2. Caption analysis (vectorized; caption kosong/NaN -> 0)
+    text = df['text'].astype(str)
+    text_missing = df['text'].isna()
+    df['Jumlah_Hashtag'] = text.str.count(HASHTAG_PATTERN).where(~text_missing, 0).astype('int64')
+    df['Panjang_Caption'] = text.str.len().where(~text_missing, 0).astype('int64')
+
+    # 3. Temporal features
+    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
+    
+    # Timezone handling for hours_since_publish
+    if reference_time is None:
+        from datetime import timezone
+        reference_time = datetime.now(timezone.utc)
+    
+    # Ensure UTC for calculations
+    if df['createTimeISO'].dt.tz is None:
+        iso_series = df['createTimeISO'].dt.tz_localize('UTC')
+    else:
+        iso_series = df['createTimeISO'].dt.tz_convert('UTC')
+
+    # Selisih waktu dihitung sekaligus untuk satu kolom (sama dengan calculate_hours_since_publish)
+    reference_ts = pd.Timestamp(reference_time)
+    if reference_ts.tzinfo is None:
+        reference_ts = reference_ts.tz_localize('UTC')
+    hours = ((reference_ts - iso_series).dt.total_seconds() / 3600).to_numpy(dtype=np.float64)
+    # max(0, jam): nilai negatif & NaT -> 0
+    df['Jam_Sejak_Publikasi'] = np.where(hours > 0, hours, 0.0)
+
+    # Fitur Waktu Model
+    df['Jam_Posting'] = df['createTimeISO'].dt.hour
+    aliases = {'Jam_Upload': 'Jam_Posting'}  # Alias (lazy, lihat akhir fungsi)
+    df['Hari_Posting'] = df['createTimeISO'].dt.day_name()
+    # Is_Weekend (Fitur Baru)
+    df['Is_Weekend'] = df['Hari_Posting'].isin(['Saturday', 'Sunday']).astype('int64')
+    # Hari Upload (Numerik 0-6)
+    df['Hari_Upload'] = df['createTimeISO'].dt.dayofweek
+
+    # 4. Content & Audio Classification (Using DP Logic for Consistency)
+    # Gunakan logika kamus 10 kategori dari DataProcessor
+    df['content_type_detected'] = dp.classify_content_series(df['text'])
+    
+    # Audio Logic (Load Top 20 if needed)
+    if not dp.list_audio_populer and 'musicMeta.musicName' in df.columns:
+         dp.list_audio_populer = df['musicMeta.musicName'].value_counts().head(20).index.tolist()
+    
+    df['audio_type_detected'] = dp.classify_audio_series(df)
+
+    # 5 & 6. One-hot Encoding + Interaction Features (Kat_X * Suka)
+    # Pipeline fitur yang sama dengan Prediksi Tunggal (DataProcessor.get_feature_pipeline)
+    all_categories = list(dp.KAMUS_KATEGORI.keys()) + ['Lainnya']
+    encoded_cols = (
+        [f"Kat_{cat}" for cat in all_categories]
+        + [f"Audio_{audio}" for audio in PAGE_AUDIO_TYPES]
+        + [f"Interaksi_{cat}_Suka" for cat in all_categories]
+    )
+    pipeline = dp.get_feature_pipeline(encoded_cols)
+    encoded = pipeline.transform_frame(
+        df, content_col='content_type_detected', audio_col='audio_type_detected'
+    )
+
+    df = pd.concat([df.drop(columns=[c for c in encoded.columns if c in df.columns]), encoded], axis=1)
+
+    # Tipe_Konten_X / Tipe_Audio_X = alias Kat_X / Audio_X (kompatibilitas tampilan & ekspor)
+    for col in pipeline.onehot_columns:
+        if col.startswith('Kat_'):
+            aliases[f"Tipe_Konten_{col[len('Kat_'):]}"] = col
+        else:
+            aliases[f"Tipe_Audio_{col[len('Audio_'):]}"] = col
+
+    # 7. Additional Features (Legacy Support/Trends)
+    df['Kekuatan_Tren_Audio'] = np.where(df['audio_type_detected'] == 'Audio Populer', 0.9, 0.5)
+    # Estimasi Tren Hashtag sederhana
+    hashtag_engagement = df['Suka'] + df['Komentar'] + df['Dibagikan']
+    p75 = hashtag_engagement.quantile(0.75) if not hashtag_engagement.empty else 0
+    df['Kekuatan_Tren_Hashtag'] = np.where(hashtag_engagement >= p75, 0.9, 0.5)
+    
+    # str(NaN) = 'nan' tidak pernah cocok dengan pola, jadi NaN -> 0
+    df['Apakah_Kolaborasi'] = text.str.contains(COLLAB_PATTERN, na=False).astype('int64')
+    df['Format_Konten_Video'] = 1 # Asumsi Vertical
+
+    # 8. Organize Columns
+    # Kita simpan semua kolom hasil engineering
+    # Tambahkan ID dan Caption untuk referensi
+    if 'Video_ID' not in df.columns:
+        df.insert(0, 'Video_ID', range(1, len(df) + 1))
+    
+    if 'text' in df.columns and 'Caption' not in df.columns:
+        df.insert(1, 'Caption', df['text'])
+
+    # Alias tidak disimpan sebagai salinan; ditulis lengkap saat ekspor (materialize)
+    return LazyFrame.wrap(df, aliases)
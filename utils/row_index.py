@@ -0,0 +1,131 @@
+"""
+Row Index Module
+Author and upload-time indexes for fast dashboard filtering
+"""
+import calendar
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+MONTH_NAMES = list(calendar.month_name)[1:]
+
+
+class RowIndex:
+    """Author -> row positions index plus a sorted createTimeISO int64 index"""
+
+    def __init__(self, df):
+        """
+        Build the indexes
+
+        Args:
+            df (pd.DataFrame): Output of DataProcessor.load_data
+        """
+        times = df['createTimeISO']
+        self.tz = getattr(times.dt, 'tz', None)
+        if self.tz is not None:
+            # Filter tanggal berlaku pada jam dinding zona kolom (seperti .dt.date / .dt.year)
+            times = times.dt.tz_localize(None)
+        ts = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+        # Indeks waktu global (semua kreator)
+        self.time_order = np.argsort(ts, kind='stable')
+        self.sorted_ts = ts[self.time_order]
+
+        # Indeks kreator: baris diurutkan per (kreator, waktu) + offset per kreator
+        if 'authorMeta.name' in df.columns:
+            codes, authors = pd.factorize(df['authorMeta.name'])
+        else:
+            codes, authors = np.full(len(df), -1), pd.Index([])
+        order = np.lexsort((ts, codes))
+        order = order[codes[order] >= 0]  # kreator kosong (NaN) tidak diindeks
+        sorted_codes = codes[order]
+        bounds = np.searchsorted(sorted_codes, np.arange(len(authors) + 1), side='left')
+
+        self.author_order = order
+        self.author_sorted_ts = ts[order]
+        self.author_slices = {
+            author: (bounds[i], bounds[i + 1]) for i, author in enumerate(authors)
+        }
+
+    # --- HELPER ---
+    def _to_ns(self, value):
+        return pd.Timestamp(value).value
+
+    def _scope(self, author):
+        """Return (positions sorted by time, their timestamps) for an author or all rows"""
+        if author is None:
+            return self.time_order, self.sorted_ts
+        lo, hi = self.author_slices.get(author, (0, 0))
+        return self.author_order[lo:hi], self.author_sorted_ts[lo:hi]
+
+    # --- QUERY ---
+    def positions(self, author=None, start_date=None, end_date=None, year=None, month_name=None):
+        """
+        Row positions matching the filters (ascending, for use with df.iloc)
+
+        Args:
+            author (str): Author name (None = all authors)
+            start_date, end_date (datetime.date): Inclusive date range
+            year (int): Upload year
+            month_name (str): English month name, requires year
+
+        Returns:
+            np.ndarray: Integer row positions
+        """
+        positions, ts = self._scope(author)
+        lo, hi = 0, len(ts)
+
+        # Semua filter waktu diubah menjadi rentang [awal, akhir) lalu di-searchsorted
+        ranges = []
+        if start_date is not None:
+            ranges.append((self._to_ns(start_date), None))
+        if end_date is not None:
+            ranges.append((None, self._to_ns(pd.Timestamp(end_date) + timedelta(days=1))))
+        if year is not None:
+            if month_name is not None:
+                month = MONTH_NAMES.index(month_name) + 1
+                start = pd.Timestamp(year=int(year), month=month, day=1)
+                ranges.append((start.value, (start + pd.offsets.MonthBegin(1)).value))
+            else:
+                ranges.append((pd.Timestamp(year=int(year), month=1, day=1).value,
+                               pd.Timestamp(year=int(year) + 1, month=1, day=1).value))
+
+        for start_ns, end_ns in ranges:
+            if start_ns is not None:
+                lo = max(lo, int(np.searchsorted(ts, start_ns, side='left')))
+            if end_ns is not None:
+                hi = min(hi, int(np.searchsorted(ts, end_ns, side='left')))
+
+        if hi <= lo:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(positions[lo:hi])
+
+    def count(self, author=None):
+        """Number of indexed rows for an author (or all rows)"""
+        return len(self._scope(author)[1])
+
+    def date_bounds(self, author=None):
+        """
+        First and last upload date
+
+        Returns:
+            tuple: (min_date, max_date) as datetime.date, or (None, None) if empty
+        """
+        ts = self._scope(author)[1]
+        if len(ts) == 0:
+            return None, None
+        return pd.Timestamp(ts[0]).date(), pd.Timestamp(ts[-1]).date()
+
+    def available_years(self, author=None):
+        """Sorted list of upload years"""
+        ts = self._scope(author)[1]
+        return sorted(pd.DatetimeIndex(ts).year.unique().tolist())
+
+    def available_months(self, year, author=None):
+        """English month names present in a year, in calendar order"""
+        positions, ts = self._scope(author)
+        lo = np.searchsorted(ts, pd.Timestamp(year=int(year), month=1, day=1).value, side='left')
+        hi = np.searchsorted(ts, pd.Timestamp(year=int(year) + 1, month=1, day=1).value, side='left')
+        months = pd.DatetimeIndex(ts[lo:hi]).month.unique()
+        return [MONTH_NAMES[m - 1] for m in sorted(months)]
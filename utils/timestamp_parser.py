@@ -0,0 +1,150 @@
+"""
+Timestamp Parser Module
+Fast createTimeISO parsing and calendar parts from int64 epoch arithmetic
+"""
+import numpy as np
+import pandas as pd
+
+# Format tetap keluaran scraper, mis. 2024-06-03T12:50:13.000Z (24 karakter)
+SCRAPER_ISO_LENGTH = 24
+SEPARATORS = {4: '-', 7: '-', 10: 'T', 13: ':', 16: ':', 19: '.', 23: 'Z'}
+
+# String yang dilewati pandas saat memilih baris acuan inferensi format (tslib.first_non_null)
+NULL_STRINGS = {'', 'NaT', 'nat', 'NAT', 'nan', 'NaN', 'NAN'}
+
+MICROS_PER_SECOND = 1_000_000
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+
+def _parse_scraper_format(values):
+    """
+    Fixed-width parse of the scraper format straight from the character codes
+
+    Returns:
+        tuple: (epoch microseconds int64, mask of rows that matched the format exactly)
+    """
+    # Satu karakter ekstra untuk mendeteksi string yang lebih panjang dari format
+    width = SCRAPER_ISO_LENGTH + 1
+    chars = values.to_numpy(dtype=object).astype(f'U{width}').view(np.uint32).reshape(-1, width)
+
+    ok = chars[:, SCRAPER_ISO_LENGTH] == 0
+    for pos, sep in SEPARATORS.items():
+        ok &= chars[:, pos] == ord(sep)
+
+    def number(start, stop):
+        digits = chars[:, start:stop].astype(np.int64) - ord('0')
+        valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+        value = np.zeros(len(chars), dtype=np.int64)
+        for i in range(stop - start):
+            value = value * 10 + digits[:, i]
+        return value, valid
+
+    fields = {}
+    for name, (start, stop) in {'year': (0, 4), 'month': (5, 7), 'day': (8, 10), 'hour': (11, 13),
+                                'minute': (14, 16), 'second': (17, 19), 'milli': (20, 23)}.items():
+        fields[name], valid = number(start, stop)
+        ok &= valid
+    ok &= (fields['month'] >= 1) & (fields['month'] <= 12) & (fields['day'] >= 1)
+    ok &= (fields['hour'] < 24) & (fields['minute'] < 60) & (fields['second'] < 60)
+
+    # Hari sejak epoch lewat kalender NumPy (datetime64[M] -> [D]); baris tidak valid diberi 1970-01
+    month_index = np.where(ok, (fields['year'] - 1970) * 12 + fields['month'] - 1, 0)
+    month_start = month_index.astype('datetime64[M]')
+    first_day = month_start.astype('datetime64[D]').view(np.int64)
+    days_in_month = (month_start + 1).astype('datetime64[D]').view(np.int64) - first_day
+    ok &= fields['day'] <= days_in_month
+
+    seconds = ((first_day + fields['day'] - 1) * SECONDS_PER_DAY + fields['hour'] * SECONDS_PER_HOUR
+               + fields['minute'] * 60 + fields['second'])
+    return seconds * MICROS_PER_SECOND + fields['milli'] * 1000, ok
+
+
+def _default_parse(values):
+    """pd.to_datetime bawaan (format & zona waktu diinferensi dari baris pertama)"""
+    try:
+        return pd.to_datetime(values, dayfirst=False, errors='coerce')
+    except ValueError:
+        # Offset zona waktu campuran: pandas menolak seluruh kolom, maka disamakan ke UTC
+        return pd.to_datetime(values, dayfirst=False, errors='coerce', utc=True)
+
+
+def first_timestamp(values):
+    """
+    First value pandas infers the datetime format from (missing values and
+    'NaT' / 'nan' strings are skipped)
+
+    Args:
+        values (pd.Series): Raw timestamp strings
+
+    Returns:
+        object: The reference value, or None if the column has none
+    """
+    for value in values[values.notna()]:
+        if not (isinstance(value, str) and value.strip() in NULL_STRINGS):
+            return value
+    return None
+
+
+def parse_iso_timestamps(values, reference=None):
+    """
+    Parse timestamps with the same result as pd.to_datetime(values, dayfirst=False,
+    errors='coerce'). When every non-missing row is in the exact scraper format the
+    column is decoded with array arithmetic (UTC, as pandas infers from the trailing
+    'Z'); otherwise the whole column goes through that default parser, so the format
+    and timezone are inferred from the first row and naive timestamps stay naive
+
+    Args:
+        values (pd.Series): Raw timestamp strings
+        reference (object): First timestamp of the full column when values is one
+            chunk of it (see first_timestamp); None = infer from values itself
+
+    Returns:
+        tuple: (pd.Series datetime64 with NaT for unparseable values,
+                number of rows outside the scraper format)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return values, 0
+
+    micros, ok = _parse_scraper_format(values)
+    n_fallback = int((~ok & values.notna().to_numpy()).sum())
+    reference_ok = reference is None or _parse_scraper_format(pd.Series([reference], dtype=object))[1][0]
+    if n_fallback or not ok.any() or not reference_ok:
+        # Format lain ikut parser bawaan untuk seluruh kolom: satu baris berbeda format
+        # juga bisa mengubah format yang diinferensi untuk baris lainnya
+        if reference is None:
+            return _default_parse(values), n_fallback
+        # Chunk: baris acuan ditaruh di depan agar format & zona waktu sama dengan seluruh kolom
+        padded = pd.concat([pd.Series([reference], dtype=object), values.astype(object)], ignore_index=True)
+        times = _default_parse(padded).iloc[1:]
+        return times.set_axis(values.index).rename(values.name), n_fallback
+
+    micros[~ok] = np.iinfo(np.int64).min  # NaT
+    times = pd.Series(micros.view('datetime64[us]'), index=values.index, name=values.name).dt.tz_localize('UTC')
+    return times, 0
+
+
+def epoch_parts(times):
+    """
+    Calendar parts from int64 epoch arithmetic, without per-row datetime objects.
+    Parts follow the wall-clock time of the column's timezone (same as .dt.hour etc.)
+
+    Args:
+        times (pd.Series): datetime64 (naive or tz-aware) without NaT
+
+    Returns:
+        dict: hour, weekday (0 = Monday), year, month (1-12) as small integer arrays
+    """
+    if times.dt.tz is not None:
+        times = times.dt.tz_localize(None)
+    micros = times.to_numpy(dtype='datetime64[us]').view(np.int64)
+    seconds = micros // MICROS_PER_SECOND
+    days = seconds // SECONDS_PER_DAY
+    # Bulan sejak Januari 1970 (datetime64[D] -> [M] adalah pembagian kalender di NumPy)
+    months = days.astype('datetime64[D]').astype('datetime64[M]').view(np.int64)
+    return {
+        'hour': ((seconds // SECONDS_PER_HOUR) % 24).astype(np.int8),
+        'weekday': ((days + 3) % 7).astype(np.int8),  # 1970-01-01 = Kamis
+        'year': (months // 12 + 1970).astype(np.int16),
+        'month': (months % 12 + 1).astype(np.int8),
+    }
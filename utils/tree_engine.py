@@ -0,0 +1,250 @@
+"""
+Tree Engine Module
+Compiled (flattened) tree-ensemble inference with vectorized traversal
+"""
+import json
+import os
+
+import numpy as np
+
+# Array node yang disimpan sebagai file .npy (dapat di-memory-map)
+ARRAY_NAMES = ('feature', 'threshold', 'child', 'missing_right', 'value', 'roots', 'classes_')
+
+# Naik setiap kali isi artefak berubah (artefak versi lama dikompilasi ulang)
+FORMAT_VERSION = 2
+
+
+class CompiledForest:
+    """Flattened node arrays for a fitted sklearn tree or forest classifier"""
+
+    # Jumlah baris per blok saat traversal (blok kecil tetap muat di cache CPU)
+    CHUNK_SIZE = 512
+
+    def __init__(self, model):
+        """
+        Flatten all trees of the model into contiguous arrays
+
+        Args:
+            model: Fitted RandomForestClassifier / ExtraTreesClassifier /
+                DecisionTreeClassifier (anything exposing tree_ per estimator)
+        """
+        estimators = getattr(model, 'estimators_', None)
+        if estimators is None:
+            estimators = [model]
+        if not estimators or not all(hasattr(est, 'tree_') for est in estimators):
+            raise ValueError("Model is not a supported tree ensemble")
+
+        self.classes_ = np.asarray(model.classes_)
+        self.n_classes = len(self.classes_)
+        self.n_features = int(model.n_features_in_)
+        self.n_trees = len(estimators)
+
+        features, thresholds, children, missing, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for est in estimators:
+            tree = est.tree_
+            feature, threshold, child, missing_right, value = self._flatten_tree(tree, offset)
+
+            # Probabilitas per daun dinormalisasi seperti DecisionTreeClassifier.predict_proba
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+
+            features.append(feature)
+            thresholds.append(threshold)
+            children.append(child)
+            missing.append(missing_right)
+            values.append(value / normalizer)
+            roots.append(offset)
+            offset += len(feature)
+            max_depth = max(max_depth, int(tree.max_depth))
+
+        self.feature = np.ascontiguousarray(np.concatenate(features), dtype=np.int32)
+        self.threshold = np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64)
+        self.child = np.ascontiguousarray(np.concatenate(children), dtype=np.int32)
+        self.missing_right = np.ascontiguousarray(np.concatenate(missing), dtype=np.bool_)
+        self.value = np.ascontiguousarray(np.concatenate(values), dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = max_depth
+
+    def _flatten_tree(self, tree, offset):
+        """
+        Renumber one tree in BFS order so that the right child is always
+        left child + 1; the next node is then child[node] + (x > threshold).
+        Leaves point to themselves with an infinite threshold.
+        NaN follows sklearn's missing_go_to_left routing (missing_right = not it).
+        """
+        n_nodes = tree.node_count
+        new_id = np.empty(n_nodes, dtype=np.int64)
+        order = [0]
+        new_id[0] = 0
+        head = 0
+        while head < len(order):
+            node = order[head]
+            head += 1
+            if tree.children_left[node] != -1:
+                for kid in (tree.children_left[node], tree.children_right[node]):
+                    new_id[kid] = len(order)
+                    order.append(kid)
+
+        order = np.asarray(order)
+        is_leaf = tree.children_left[order] == -1
+        child = np.where(is_leaf, np.arange(n_nodes), new_id[np.where(is_leaf, 0, tree.children_left[order])])
+        feature = np.where(is_leaf, 0, tree.feature[order])
+        threshold = np.where(is_leaf, np.inf, tree.threshold[order])
+        # Model sklearn lama tanpa dukungan NaN: NaN ke kiri (NaN > threshold = False)
+        go_left = getattr(tree, 'missing_go_to_left', None)
+        missing_right = np.zeros(n_nodes, dtype=np.bool_) if go_left is None else ~is_leaf & (go_left[order] == 0)
+        value = tree.value[order, 0, :self.n_classes].astype(np.float64)
+        return feature, threshold, child + offset, missing_right, value
+
+    def save(self, directory):
+        """
+        Write the node arrays as .npy files plus a small JSON header
+
+        Args:
+            directory (str): Target directory (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(directory, f'{name}.npy'), getattr(self, name), allow_pickle=False)
+        header = {'n_features': self.n_features, 'max_depth': self.max_depth, 'format_version': FORMAT_VERSION}
+        with open(os.path.join(directory, 'engine.json'), 'w', encoding='utf-8') as f:
+            json.dump(header, f)
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """
+        Load node arrays written by save(); with mmap_mode='r' the arrays are
+        memory-mapped, so processes share the pages through the OS page cache
+
+        Args:
+            directory (str): Directory written by save()
+            mmap_mode (str): Passed to np.load (None = read into memory)
+
+        Returns:
+            CompiledForest: Engine without a reference to the sklearn model
+        """
+        engine = cls.__new__(cls)
+        with open(os.path.join(directory, 'engine.json'), encoding='utf-8') as f:
+            header = json.load(f)
+        if header.get('format_version') != FORMAT_VERSION:
+            raise ValueError("Compiled artifact was written by an older engine version")
+        for name in ARRAY_NAMES:
+            array = np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode, allow_pickle=False)
+            setattr(engine, name, np.asarray(array))
+        engine.n_features = int(header['n_features'])
+        engine.max_depth = int(header['max_depth'])
+        engine.n_classes = len(engine.classes_)
+        engine.n_trees = len(engine.roots)
+        return engine
+
+    def _prepare(self, X):
+        # sklearn membandingkan fitur float32 dengan threshold float64
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"X has {X.shape[1]} features, but the model expects {self.n_features}")
+        # Sama dengan validasi sklearn: NaN diizinkan (dirutekan per node), infinity ditolak
+        if np.isinf(X).any():
+            raise ValueError("Input X contains infinity or a value too large for dtype('float32')")
+        return X
+
+    def apply(self, X):
+        """
+        Leaf index reached in every tree
+
+        Args:
+            X (np.ndarray): Feature matrix in model feature order
+
+        Returns:
+            np.ndarray: (n_rows, n_trees) global leaf node ids
+        """
+        X = self._prepare(X)
+        n_rows = X.shape[0]
+        leaves = np.empty((n_rows, self.n_trees), dtype=np.int32)
+        for start in range(0, n_rows, self.CHUNK_SIZE):
+            block = X[start:start + self.CHUNK_SIZE]
+            flat = block.ravel()
+            # Offset baris dalam array X yang diratakan, untuk gather nilai fitur
+            row_base = (np.arange(block.shape[0], dtype=np.int32) * self.n_features)[:, None]
+            node = np.repeat(self.roots[None, :], block.shape[0], axis=0)
+            has_nan = np.isnan(flat).any()
+            for _ in range(self.max_depth):
+                x = flat.take(row_base + self.feature.take(node))
+                go_right = x > self.threshold.take(node)
+                if has_nan:
+                    go_right |= np.isnan(x) & self.missing_right.take(node)
+                node = self.child.take(node) + go_right
+            leaves[start:start + block.shape[0]] = node
+        return leaves
+
+    def predict_proba(self, X):
+        """
+        Class probabilities (mean of per-tree leaf distributions)
+
+        Returns:
+            np.ndarray: (n_rows, n_classes)
+        """
+        leaves = self.apply(X)
+        return self.value[leaves].sum(axis=1) / self.n_trees
+
+    def predict(self, X):
+        """
+        Class labels (argmax of probabilities, same rule as sklearn)
+
+        Returns:
+            np.ndarray: (n_rows,)
+        """
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def _tree_contributions(self, t):
+        """
+        Saabas path contributions accumulated from the root to every node of tree t,
+        as (n_nodes_of_tree, n_features * n_classes); built per call, never cached
+        """
+        root = int(self.roots[t])
+        end = int(self.roots[t + 1]) if t + 1 < self.n_trees else len(self.feature)
+        n_nodes = end - root
+        child = self.child[root:end] - root
+        internal = child != np.arange(n_nodes)
+        feature = self.feature[root:end]
+        value = self.value[root:end]
+        contrib = np.zeros((n_nodes, self.n_features, self.n_classes), dtype=np.float64)
+
+        # Urutan BFS: proses per kedalaman, anak mewarisi kontribusi induk + perubahan nilai di split
+        frontier = np.zeros(1, dtype=np.intp)
+        while frontier.size:
+            parents = frontier[internal[frontier]]
+            if not parents.size:
+                break
+            kids = np.concatenate([child[parents], child[parents] + 1]).astype(np.intp)
+            parents = np.concatenate([parents, parents])
+            contrib[kids] = contrib[parents]
+            contrib[kids, feature[parents], :] += value[kids] - value[parents]
+            frontier = kids
+        return contrib.reshape(n_nodes, -1)
+
+    def contributions(self, X):
+        """
+        Per-prediction feature contributions (Saabas): for every tree, each
+        split on the decision path credits its feature with the change in
+        class distribution; results are averaged over trees.
+        bias + contributions.sum(axis=1) equals predict_proba(X).
+
+        Args:
+            X (np.ndarray): Feature matrix in model feature order
+
+        Returns:
+            tuple: (bias (n_classes,), contributions (n_rows, n_features, n_classes))
+        """
+        leaves = self.apply(X)
+        n_rows = leaves.shape[0]
+        contributions = np.zeros((n_rows, self.n_features * self.n_classes), dtype=np.float64)
+        # Tabel kontribusi dibuat per pohon (kecil, tidak disimpan) lalu diambil di daun tiap baris
+        for t, root in enumerate(self.roots):
+            contributions += self._tree_contributions(t).take(leaves[:, t] - root, axis=0)
+        contributions = contributions.reshape(n_rows, self.n_features, self.n_classes) / self.n_trees
+        bias = self.value[self.roots].mean(axis=0)
+        return bias, contributions
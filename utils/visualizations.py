@@ -289,6 +289,39 @@ def create_histogram(df, x, title, xaxis_title, nbins=30):
     return fig
 
 
+def create_binned_histogram(bins_df, title, xaxis_title):
+    """
+    Create a histogram from pre-computed bins (e.g. counted chunk by chunk)
+
+    Args:
+        bins_df (pd.DataFrame): Columns 'Batas Bawah', 'Batas Atas', 'Frekuensi'
+        title (str): Chart title
+        xaxis_title (str): X-axis label
+
+    Returns:
+        plotly figure
+    """
+    fig = go.Figure(go.Bar(
+        x=(bins_df['Batas Bawah'] + bins_df['Batas Atas']) / 2,
+        y=bins_df['Frekuensi'],
+        width=bins_df['Batas Atas'] - bins_df['Batas Bawah'],
+        customdata=bins_df[['Batas Bawah', 'Batas Atas']],
+        hovertemplate="%{customdata[0]:.2f} - %{customdata[1]:.2f}<br>Frekuensi: %{y}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="Frekuensi",
+        bargap=0,
+        template='plotly_white'
+    )
+
+    fig = update_plotly_theme(fig)
+
+    return fig
+
+
 def create_grouped_bar_chart(df, x, y_columns, title, xaxis_title, yaxis_title):
     """
     Create a grouped bar chart with multiple y columns
@@ -0,0 +1,43 @@
+"""
+What-If Module
+Score every upload-hour x day x audio (x duration) combination in one model call
+"""
+import numpy as np
+
+
+def sweep_posting_options(data_processor, model_handler, raw_features, hours=range(24), days=range(7),
+                          audio_types=None, durations=None):
+    """
+    Predict the trending probability for every combination of upload settings
+
+    Args:
+        data_processor (DataProcessor): Builds the feature grid
+        model_handler (ModelHandler): Scores the grid with a single predict_batch call
+        raw_features (dict): Same input as DataProcessor.prepare_features_for_prediction
+        hours (iterable): Upload hours to try
+        days (iterable): Upload days to try (0 = Senin ... 6 = Minggu)
+        audio_types (list): Audio types to try (None = all audio types known by the model)
+        durations (list): Video durations in seconds to try (None = keep the input duration)
+
+    Returns:
+        dict: 'ranked' (grid sorted by Prob_Trending, best first) and
+              'heatmap' (days x hours, best Prob_Trending over audio/duration), or None on error
+    """
+    grid, features = data_processor.prepare_what_if_features(
+        raw_features, hours=hours, days=days, audio_types=audio_types, durations=durations,
+        feature_names=model_handler.feature_names
+    )
+    predictions, probabilities = model_handler.predict_batch(features)
+    if predictions is None:
+        return None
+
+    # Kolom probabilitas kelas "Trending" (label 1)
+    classes = model_handler.get_model_info().get('classes', [0, 1])
+    trending_idx = classes.index(1) if 1 in classes else probabilities.shape[1] - 1
+
+    grid['Prediksi'] = predictions
+    grid['Prob_Trending'] = probabilities[:, trending_idx]
+
+    ranked = grid.sort_values('Prob_Trending', ascending=False, kind='stable').reset_index(drop=True)
+    heatmap = grid.groupby(['upload_day', 'upload_hour'])['Prob_Trending'].max().unstack('upload_hour')
+    return {'ranked': ranked, 'heatmap': heatmap}
@@ -86,7 +86,7 @@ with col2:
     
     # Menampilkan info dataset dinamis
     total_influencers = len(dp.get_unique_authors())
-    total_vids = len(dp.df) if dp.df is not None else 0
+    total_vids = dp.row_count()
     st.write(f"- **Total Video:** {total_vids}")
     st.write(f"- **Total Influencer:** {total_influencers}")
 